@@ -0,0 +1,110 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import argparse
+import json
+import sys
+from timeit import default_timer
+
+from systemds.context import SystemDSContext
+from systemds.script_building.script import DMLScript
+
+description = """Benchmarks the code generation of the SystemDS Python API for large DAGs:
+deep chains of operations and diamonds, where every level reuses the previous level twice.
+The time per node is reported for growing sizes, and the benchmark fails if the time per
+node of the largest size exceeds the smallest by more than the tolerance, i.e. if the code
+generation does not scale linearly."""
+
+context_args = {"logging_level": 40, "py4j_logging_level": 50}
+
+
+def chain(sds: SystemDSContext, n: int):
+    x = sds.rand(3, 3, seed=42)
+    for _ in range(n):
+        x = x + 1
+    return x
+
+
+def diamond(sds: SystemDSContext, n: int):
+    x = sds.rand(3, 3, seed=42)
+    # each level adds three nodes
+    for _ in range(n // 3):
+        x = (x + 1) * (x - 1)
+    return x
+
+
+def measure(sds: SystemDSContext, build_dag, n: int, repeats: int) -> float:
+    """Measure the best time of generating and clearing the script of a DAG of n nodes."""
+    dag = build_dag(sds, n)
+    best = float("inf")
+    for _ in range(repeats):
+        start = default_timer()
+        script = DMLScript(sds)
+        script.build_code(dag)
+        script.dml_script
+        script.clear(dag)
+        best = min(best, default_timer() - start)
+    return best
+
+
+def main(args):
+    results = {}
+    failed = []
+    with SystemDSContext(**context_args) as sds:
+        for name, build_dag in [("chain", chain), ("diamond", diamond)]:
+            times = {}
+            for n in args.sizes:
+                times[n] = measure(sds, build_dag, n, args.repeats)
+                print(
+                    f"{name:<8} {n:>8} nodes {times[n]:>10.4f}s {times[n] / n * 1e6:>8.2f}us/node"
+                )
+            first, last = min(args.sizes), max(args.sizes)
+            ratio = (times[last] / last) / (times[first] / first)
+            if ratio > 1 + args.tolerance:
+                failed.append(name)
+            results[name] = {"seconds": times, "per_node_ratio": ratio}
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if failed:
+        print("Not linear: " + ", ".join(failed))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 100000],
+        help="the numbers of nodes of the DAGs",
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", help="file to write the JSON results to")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.0,
+        help="allowed relative increase of the time per node from the smallest to the largest size",
+    )
+    main(parser.parse_args())
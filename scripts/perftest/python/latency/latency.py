@@ -0,0 +1,199 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from timeit import default_timer
+
+import numpy as np
+from systemds.context import SystemDSContext
+from systemds.script_building.script import DMLScript
+
+description = """Benchmarks the latency of the SystemDS Python API:
+context creation (cold JVM, JVM with class data sharing archive, attach to a daemon),
+the round trip of an empty script, small operations, and the overhead per compute call.
+The results are printed and optionally saved as JSON, and can be compared against a
+stored baseline to detect regressions."""
+
+context_args = {"logging_level": 40, "py4j_logging_level": 50}
+
+
+def measure(fn, repeats: int, warmup: int) -> dict:
+    """Run fn warmup + repeats times, and summarize the timings of the repeats in seconds."""
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(repeats):
+        start = default_timer()
+        fn()
+        times.append(default_timer() - start)
+    times.sort()
+    return {
+        "repeats": repeats,
+        "min": times[0],
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "p90": times[min(len(times) - 1, int(len(times) * 0.9))],
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+    }
+
+
+def bench_context(repeats: int, warmup: int) -> dict:
+    results = {}
+    results["context_cold"] = measure(
+        lambda: SystemDSContext(class_data_sharing=False, **context_args).close(),
+        repeats,
+        warmup,
+    )
+    # The first closed context creates the archive, therefore warmup at least once.
+    results["context_cds"] = measure(
+        lambda: SystemDSContext(**context_args).close(), repeats, max(1, warmup)
+    )
+    with SystemDSContext(daemon=True, **context_args) as daemon:
+        address = "localhost:" + str(daemon.get_port())
+        results["context_attach"] = measure(
+            lambda: SystemDSContext(attach=address, **context_args).close(),
+            repeats,
+            warmup,
+        )
+    return results
+
+
+def bench_compute(repeats: int, warmup: int) -> dict:
+    results = {}
+    with SystemDSContext(**context_args) as sds:
+
+        def empty_script():
+            script = DMLScript(sds)
+            script.add_code("")
+            script.execute()
+
+        results["empty_script"] = measure(empty_script, repeats, warmup)
+
+        # Full compute path with trivial work in the JVM, i.e. the overhead per compute call.
+        results["compute_overhead"] = measure(
+            lambda: sds.scalar(1).compute(), repeats, warmup
+        )
+
+        a = np.random.rand(10, 10)
+        b = np.random.rand(10, 10)
+        results["small_op"] = measure(
+            lambda: (sds.from_numpy(a) @ sds.from_numpy(b)).sum().compute(),
+            repeats,
+            warmup,
+        )
+
+        def for_loop():
+            x = sds.rand(10, 10, 0, 10, seed=42)
+            y = sds.rand(10, 10, 0, 10, seed=32)
+            for _ in range(10):
+                x = x @ y
+            x.sum().compute()
+
+        results["small_op_chain"] = measure(for_loop, repeats, warmup)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Compare the medians against the baseline.
+
+    :return: the names of the benchmarks that regressed by more than the tolerance
+    """
+    regressions = []
+    print(f"{'benchmark':<20} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for name, res in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]["median"]
+        ratio = res["median"] / base if base > 0 else float("inf")
+        flag = ""
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            flag = " REGRESSION"
+        print(f"{name:<20} {base:>12.6f} {res['median']:>12.6f} {ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main(args):
+    np.random.seed(args.seed)
+    results = {}
+    if "context" in args.suites:
+        results.update(bench_context(args.context_repeats, args.warmup))
+    if "compute" in args.suites:
+        results.update(bench_compute(args.repeats, args.warmup))
+
+    report = {
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "repeats": args.repeats,
+            "context_repeats": args.context_repeats,
+            "warmup": args.warmup,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("Regressions: " + ", ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--suites",
+        nargs="+",
+        choices=["context", "compute"],
+        default=["context", "compute"],
+        help="the benchmark suites to run",
+    )
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument(
+        "--context-repeats",
+        type=int,
+        default=5,
+        help="repeats of the context creation, each starts a JVM",
+    )
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="file to write the JSON results to")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed relative slowdown of the median against the baseline",
+    )
+    main(parser.parse_args())
@@ -1,4 +1,5 @@
-# -------------------------------------------------------------
+#!/bin/bash
+#-------------------------------------------------------------
 #
 # Licensed to the Apache Software Foundation (ASF) under one
 # or more contributor license agreements.  See the NOTICE file
@@ -17,14 +18,25 @@
 # specific language governing permissions and limitations
 # under the License.
 #
-# -------------------------------------------------------------
+#-------------------------------------------------------------
+if [ "$(basename $PWD)" != "perftest" ];
+then
+  echo "Please execute scripts from directory 'perftest'"
+  exit 1;
+fi
 
+# Latency benchmarks of the Python API, the results are stored as JSON,
+# and compared against the baseline if one is stored.
+REPEATS=${1:-50}
+BASELINE=${2:-"results/python_latency_baseline.json"}
 
-x = rand(rows= 10,cols = 10,min = 0,max = 10,seed=42)
-y = rand(rows= 10,cols = 10,min = 0,max = 10,seed=32)
+mkdir -p results
+OUTPUT="results/python_latency_$(date +%Y%m%d_%H%M%S).json"
 
-for (k in 1:10){
-    x = x %*% y
-}
-
-print(sum(x))
+if [ -f "$BASELINE" ]; then
+  python ./python/latency/latency.py --repeats $REPEATS --output $OUTPUT --baseline $BASELINE
+else
+  python ./python/latency/latency.py --repeats $REPEATS --output $OUTPUT
+  cp $OUTPUT $BASELINE
+  echo "Stored $OUTPUT as baseline $BASELINE"
+fi
@@ -81,6 +81,7 @@ public class DMLOptions {
 	public int                  fedMonitoringPort = -1;
 	public String               fedMonitoringAddress = null;
 	public int                  pythonPort    = -1;
+	public boolean              pythonDaemon  = false;            // keep the python gateway alive for multiple attaching clients
 	public boolean              checkPrivacy  = false;            // Check which privacy constraints are loaded and checked during federated execution 
 	public boolean              federatedCompilation = false;     // Compile federated instructions based on input federation state and privacy constraints.
 	public boolean              noFedRuntimeConversion = false;   // If activated, no runtime conversion of CP instructions to FED instructions will be performed.
@@ -302,6 +303,9 @@ public class DMLOptions {
 		if (line.hasOption("python"))
 			dmlOptions.pythonPort = Integer.parseInt(line.getOptionValue("python"));
 
+		if (line.hasOption("daemon"))
+			dmlOptions.pythonDaemon = true;
+
 		// Named arguments map is created as ("$K, 123), ("$X", "X.csv"), etc
 		if (line.hasOption("nvargs")){
 			String varNameRegex = "^[a-zA-Z]([a-zA-Z0-9_])*$";
@@ -391,6 +395,9 @@ public class DMLOptions {
 		Option pythonOpt = OptionBuilder
 			.withDescription("Python Context start with port argument for communication to from python to java")
 			.isRequired().hasArg().create("python");
+		Option pythonDaemonOpt = OptionBuilder
+			.withDescription("Keep the Python gateway alive as a daemon that multiple Python processes can attach to")
+			.create("daemon");
 		Option monitorIdOpt = OptionBuilder
 				.withDescription("Coordinator context start with monitorId argument for monitoring registration")
 				.hasOptionalArg().create("monitorId");
@@ -445,6 +452,7 @@ public class DMLOptions {
 		options.addOption(monitorOpt);
 		options.addOption(registerMonitorOpt);
 		options.addOption(monitorIdOpt);
+		options.addOption(pythonDaemonOpt);
 		options.addOption(checkPrivacy);
 		options.addOption(federatedCompilation);
 		options.addOption(noFedRuntimeConversion);
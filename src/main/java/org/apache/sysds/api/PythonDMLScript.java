@@ -19,6 +19,12 @@
 
 package org.apache.sysds.api;
 
+import java.lang.management.ManagementFactory;
+import java.util.Map;
+import java.util.Set;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.atomic.AtomicLong;
+
 import org.apache.commons.logging.Log;
 import org.apache.commons.logging.LogFactory;
 import org.apache.sysds.api.jmlc.Connection;
@@ -31,7 +37,13 @@ import py4j.Py4JServerConnection;
 public class PythonDMLScript {
 
 	private static final Log LOG = LogFactory.getLog(PythonDMLScript.class.getName());
+	/** Prefix of the line printed to standard out once the gateway is ready, the Python side blocks on this line */
+	public static final String READY_PREFIX = "SystemDS Python gateway ready on port:";
 	final private Connection _connection;
+	final private boolean _daemon;
+	final private Map<Long, Connection> _sessions = new ConcurrentHashMap<>();
+	final private AtomicLong _sessionCounter = new AtomicLong();
+	final private Set<Long> _statsSessions = ConcurrentHashMap.newKeySet();
 
 	/**
 	 * Entry point for Python API.
@@ -42,10 +54,16 @@ public class PythonDMLScript {
 	public static void main(String[] args) throws Exception {
 		final DMLOptions dmlOptions = DMLOptions.parseCLArguments(args);
 		DMLScript.loadConfiguration(dmlOptions.configFile);
-		final GatewayServer GwS = new GatewayServer(new PythonDMLScript(), dmlOptions.pythonPort);
-		GwS.addListener(new DMLGateWayListener());
+		final GatewayServer GwS = new GatewayServer(new PythonDMLScript(dmlOptions.pythonDaemon),
+			dmlOptions.pythonPort);
+		GwS.addListener(new DMLGateWayListener(dmlOptions.pythonDaemon));
 		try {
 			GwS.start();
+			// The port might be chosen by the operating system (port 0), therefore report the
+			// bound port and the time the JVM took to get ready back to the Python process.
+			System.out.println(READY_PREFIX + GwS.getListeningPort() + ":"
+				+ ManagementFactory.getRuntimeMXBean().getUptime());
+			System.out.flush();
 		}
 		catch(Py4JNetworkException p4e) {
 			/**
@@ -60,24 +78,116 @@ public class PythonDMLScript {
 		}
 	}
 
-	private PythonDMLScript() {
+	private PythonDMLScript(boolean daemon) {
 		// we enable multi-threaded I/O and operations for a single JMLC
 		// connection because the calling Python process is unlikely to run
 		// multi-threaded streams of operations on the same shared context
 		_connection = new Connection();
+		_daemon = daemon;
 	}
 
 	public Connection getConnection() {
 		return _connection;
 	}
 
+	public boolean isDaemon() {
+		return _daemon;
+	}
+
+	/**
+	 * Open a new session for an attaching Python client. Each session has its own JMLC connection, such that prepared
+	 * scripts and their variables are isolated between clients, while the JVM (JIT-compiled code, lineage cache, buffer
+	 * pool) is shared across all of them.
+	 * 
+	 * @return The session id to use in subsequent calls to getSession and closeSession.
+	 */
+	public long openSession() {
+		final long id = _sessionCounter.incrementAndGet();
+		_sessions.put(id, new Connection());
+		LOG.debug("Opened session " + id + ", active sessions: " + _sessions.size());
+		return id;
+	}
+
+	/**
+	 * Get the connection of an open session.
+	 * 
+	 * @param id The session id returned by openSession
+	 * @return The JMLC connection of the session
+	 */
+	public Connection getSession(long id) {
+		final Connection c = _sessions.get(id);
+		if(c == null)
+			throw new DMLException("Invalid or already closed Python session: " + id);
+		return c;
+	}
+
+	/**
+	 * Close a session and release its JMLC connection. Closing an unknown session is a no-op.
+	 * 
+	 * @param id The session id returned by openSession
+	 */
+	public void closeSession(long id) {
+		final Connection c = _sessions.remove(id);
+		if(c != null) {
+			setStatistics(id, false);
+			c.close();
+			LOG.debug("Closed session " + id + ", active sessions: " + _sessions.size());
+		}
+	}
+
+	public int getNumSessions() {
+		return _sessions.size();
+	}
+
+	/**
+	 * Enable or disable runtime statistics for a session. Statistics are gathered JVM-wide, therefore they are
+	 * enabled while at least one session requests them, and a client never switches them off for other sessions.
+	 * 
+	 * @param id    The session id returned by openSession, or 0 for the connection of the owning process
+	 * @param stats True if statistics should be gathered for the session
+	 */
+	public synchronized void setStatistics(long id, boolean stats) {
+		if(stats)
+			_statsSessions.add(id);
+		else
+			_statsSessions.remove(id);
+		DMLScript.STATISTICS = !_statsSessions.isEmpty();
+	}
+
+	/**
+	 * Check if runtime statistics are requested by a session.
+	 * 
+	 * @param id The session id returned by openSession, or 0 for the connection of the owning process
+	 * @return True if the session gathers statistics
+	 */
+	public boolean isStatistics(long id) {
+		return _statsSessions.contains(id);
+	}
+
+	/**
+	 * Enable lineage tracing for all sessions. The lineage state is only reset when lineage is enabled for the first
+	 * time, such that a session does not discard the lineage traced by other sessions.
+	 */
+	public synchronized void enableLineage() {
+		if(!DMLScript.LINEAGE)
+			_connection.setLineage(true);
+	}
+
 	protected static class DMLGateWayListener implements GatewayServerListener {
 		private static final Log LOG = LogFactory.getLog(DMLGateWayListener.class.getName());
+		private final boolean _daemon;
+
+		protected DMLGateWayListener(boolean daemon) {
+			_daemon = daemon;
+		}
 
 		@Override
 		public void connectionError(Exception e) {
 			LOG.warn("Connection error: " + e.getMessage());
-			System.exit(1);
+			// a daemon serves many clients, therefore a single broken client connection
+			// must not terminate the gateway.
+			if(!_daemon)
+				System.exit(1);
 		}
 
 		@Override
@@ -90,6 +90,7 @@ public class Connection implements Closeable
 {
 	private final DMLConfig _dmlconf;
 	private final CompilerConfig _cconf;
+	private boolean _bindOutputs = false;
 	private static FileSystem fs = null;
 	
 	/**
@@ -188,6 +189,17 @@ public class Connection implements Closeable
 		Lineage.resetInternalState();
 	}
 
+	/**
+	 * Sets a boolean flag indicating if the output variables of prepared scripts
+	 * are bound directly, i.e., kept live at the end of the script without
+	 * requiring write statements for them. The option is false by default.
+	 * 
+	 * @param bind boolean value with true indicating outputs should be bound directly
+	 */
+	public void setOutputBinding(boolean bind) {
+		_bindOutputs = bind;
+	}
+
 	/**
 	 * Sets a boolean flag indicating if memory profiling statistics should be
 	 * gathered. The option is false by default.
@@ -257,7 +269,7 @@ public class Connection implements Closeable
 			
 			//language validate
 			DMLTranslator dmlt = new DMLTranslator(prog);
-			dmlt.liveVariableAnalysis(prog);
+			dmlt.liveVariableAnalysis(prog, true, _bindOutputs ? outputs : new String[0]);
 			dmlt.validateParseTree(prog);
 			
 			//hop construct/rewrite
@@ -175,6 +175,19 @@ public class DMLTranslator
 	}
 
 	public void liveVariableAnalysis(DMLProgram dmlp, boolean inclFuns) {
+		liveVariableAnalysis(dmlp, inclFuns, new String[0]);
+	}
+
+	/**
+	 * Live variable analysis of the program, where the given variables are live
+	 * at the end of the program. This keeps the computation of these variables and
+	 * binds them by transient writes, without requiring persistent writes in the script.
+	 *
+	 * @param dmlp the DML program
+	 * @param inclFuns if true, also analyze the functions of the program
+	 * @param liveOut the variables live at the end of the program
+	 */
+	public void liveVariableAnalysis(DMLProgram dmlp, boolean inclFuns, String[] liveOut) {
 
 		// for each namespace, handle function statement blocks
 		if( inclFuns ) {
@@ -198,16 +211,22 @@ public class DMLTranslator
 			activeIn = sb.initializeforwardLV(activeIn);
 		}
 
+		VariableSet programLiveOut = new VariableSet();
 		if (dmlp.getNumStatementBlocks() > 0){
 			StatementBlock lastSb = dmlp.getStatementBlock(dmlp.getNumStatementBlocks() - 1);
-			lastSb._liveOut = new VariableSet();
+			// restrict the variables defined at the end of the program to the live ones
+			for (String varName : liveOut)
+				if (lastSb._liveOut != null && lastSb._liveOut.containsVariable(varName))
+					programLiveOut.addVariable(varName, lastSb._liveOut.getVariable(varName));
+			lastSb._liveOut = new VariableSet(programLiveOut);
+			currentLiveOut = new VariableSet(programLiveOut);
 			for (int i = dmlp.getNumStatementBlocks() - 1; i >= 0; i--) {
 				StatementBlock sb = dmlp.getStatementBlock(i);
 				currentLiveOut = sb.analyze(currentLiveOut);
 			}
 		}
 
-		cleanupLiveOutVariables(dmlp.getStatementBlocks(), new VariableSet());
+		cleanupLiveOutVariables(dmlp.getStatementBlocks(), programLiveOut);
 	}
 
 	public void liveVariableAnalysisFunction(DMLProgram dmlp, FunctionStatementBlock fsb) {
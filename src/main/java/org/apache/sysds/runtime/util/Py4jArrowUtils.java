@@ -0,0 +1,385 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one
+ * or more contributor license agreements.  See the NOTICE file
+ * distributed with this work for additional information
+ * regarding copyright ownership.  The ASF licenses this file
+ * to you under the Apache License, Version 2.0 (the
+ * "License"); you may not use this file except in compliance
+ * with the License.  You may obtain a copy of the License at
+ *
+ *   http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an
+ * "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+ * KIND, either express or implied.  See the License for the
+ * specific language governing permissions and limitations
+ * under the License.
+ */
+
+package org.apache.sysds.runtime.util;
+
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.OutputStream;
+import java.nio.channels.Channels;
+import java.nio.charset.StandardCharsets;
+import java.util.ArrayList;
+import java.util.List;
+
+import org.apache.arrow.memory.BufferAllocator;
+import org.apache.arrow.memory.RootAllocator;
+import org.apache.arrow.vector.BaseIntVector;
+import org.apache.arrow.vector.BigIntVector;
+import org.apache.arrow.vector.BitVector;
+import org.apache.arrow.vector.FieldVector;
+import org.apache.arrow.vector.Float4Vector;
+import org.apache.arrow.vector.Float8Vector;
+import org.apache.arrow.vector.IntVector;
+import org.apache.arrow.vector.LargeVarCharVector;
+import org.apache.arrow.vector.VarCharVector;
+import org.apache.arrow.vector.VectorSchemaRoot;
+import org.apache.arrow.vector.dictionary.Dictionary;
+import org.apache.arrow.vector.dictionary.DictionaryProvider;
+import org.apache.arrow.vector.dictionary.DictionaryProvider.MapDictionaryProvider;
+import org.apache.arrow.vector.ipc.ArrowStreamReader;
+import org.apache.arrow.vector.ipc.ArrowStreamWriter;
+import org.apache.arrow.vector.types.pojo.ArrowType;
+import org.apache.arrow.vector.types.pojo.DictionaryEncoding;
+import org.apache.arrow.vector.types.pojo.FieldType;
+import org.apache.sysds.runtime.DMLRuntimeException;
+import org.apache.sysds.runtime.compress.colgroup.mapping.AMapToData;
+import org.apache.sysds.runtime.compress.colgroup.mapping.MapToFactory;
+import org.apache.sysds.runtime.frame.data.FrameBlock;
+import org.apache.sysds.runtime.frame.data.columns.ABooleanArray;
+import org.apache.sysds.runtime.frame.data.columns.Array;
+import org.apache.sysds.runtime.frame.data.columns.ArrayFactory;
+import org.apache.sysds.runtime.frame.data.columns.DDCArray;
+import org.apache.sysds.runtime.frame.data.columns.OptionalArray;
+
+/**
+ * Utils for exchanging frames with Python as Apache Arrow IPC streams. A whole pandas DataFrame is sent or returned in
+ * a single call, instead of one call per column. This class is separate from Py4jConverterUtils, such that the Arrow
+ * classes are only loaded if the Arrow exchange is used.
+ */
+public class Py4jArrowUtils {
+
+	/**
+	 * Convert an Arrow IPC stream to a FrameBlock. Columns containing nulls are converted to optional arrays.
+	 *
+	 * @param stream The Arrow IPC stream
+	 * @return The FrameBlock
+	 * @throws IOException If the stream could not be read
+	 */
+	public static FrameBlock convertArrowToFrameBlock(byte[] stream) throws IOException {
+		return readArrow(new ByteArrayInputStream(stream));
+	}
+
+	/**
+	 * Convert an Arrow IPC stream in a file, e.g., in shared memory, to a FrameBlock.
+	 *
+	 * @param path The path of the file containing the Arrow IPC stream
+	 * @return The FrameBlock
+	 * @throws IOException If the file could not be read
+	 */
+	public static FrameBlock convertArrowFileToFrameBlock(String path) throws IOException {
+		try(InputStream in = new FileInputStream(path)) {
+			return readArrow(in);
+		}
+	}
+
+	/**
+	 * Convert a FrameBlock to an Arrow IPC stream with a single record batch.
+	 *
+	 * @param fb The FrameBlock
+	 * @return The Arrow IPC stream
+	 * @throws IOException If the stream could not be written
+	 */
+	public static byte[] convertFrameBlockToArrow(FrameBlock fb) throws IOException {
+		ByteArrayOutputStream out = new ByteArrayOutputStream();
+		writeArrow(fb, out);
+		return out.toByteArray();
+	}
+
+	/**
+	 * Convert a FrameBlock to an Arrow IPC stream written to a file, e.g., in shared memory.
+	 *
+	 * @param fb   The FrameBlock
+	 * @param path The path of the file to write
+	 * @throws IOException If the file could not be written
+	 */
+	public static void convertFrameBlockToArrowFile(FrameBlock fb, String path) throws IOException {
+		try(OutputStream out = new FileOutputStream(path)) {
+			writeArrow(fb, out);
+		}
+	}
+
+	private static FrameBlock readArrow(InputStream in) throws IOException {
+		try(BufferAllocator allocator = new RootAllocator();
+			ArrowStreamReader reader = new ArrowStreamReader(in, allocator)) {
+			final VectorSchemaRoot root = reader.getVectorSchemaRoot();
+			final List<FieldVector> vectors = root.getFieldVectors();
+			final String[] names = new String[vectors.size()];
+			for(int c = 0; c < names.length; c++)
+				names[c] = vectors.get(c).getName();
+			// Python sends a single record batch, further batches are appended row-wise
+			FrameBlock ret = null;
+			while(reader.loadNextBatch()) {
+				final FrameBlock batch = convertBatch(vectors, names, reader);
+				ret = ret == null ? batch : ret.append(batch, false);
+			}
+			return ret == null ? convertBatch(vectors, names, reader) : ret;
+		}
+	}
+
+	private static FrameBlock convertBatch(List<FieldVector> vectors, String[] names, DictionaryProvider provider) {
+		final Array<?>[] columns = new Array<?>[vectors.size()];
+		for(int c = 0; c < columns.length; c++) {
+			final FieldVector v = vectors.get(c);
+			final DictionaryEncoding encoding = v.getField().getDictionary();
+			if(encoding != null)
+				columns[c] = convertDictionary((BaseIntVector) v, provider.lookup(encoding.getId()).getVector());
+			else
+				columns[c] = convertVector(v);
+		}
+		return new FrameBlock(columns, names);
+	}
+
+	/**
+	 * Convert a dictionary encoded vector, e.g., a pandas categorical, to a DDCArray of codes and dictionary values,
+	 * without decoding the values. Null codes are mapped to an additional null entry in the dictionary.
+	 */
+	private static Array<?> convertDictionary(BaseIntVector codes, FieldVector values) {
+		final int n = codes.getValueCount();
+		final int nUnique = values.getValueCount();
+		final boolean nulls = codes.getNullCount() > 0;
+		final int[] map = new int[n];
+		for(int i = 0; i < n; i++)
+			map[i] = codes.isNull(i) ? nUnique : (int) codes.getValueAsLong(i);
+		Array<?> dict = convertVector(values);
+		if(nulls)
+			dict = appendNull(dict);
+		return new DDCArray<>(dict, MapToFactory.create(map, dict.size()));
+	}
+
+	@SuppressWarnings("unchecked")
+	private static <T> Array<T> appendNull(Array<T> dict) {
+		final Array<T> ret = (Array<T>) ArrayFactory.allocateOptional(dict.getValueType(), dict.size() + 1);
+		for(int i = 0; i < dict.size(); i++)
+			ret.set(i, dict.get(i));
+		return ret;
+	}
+
+	private static Array<?> convertVector(FieldVector v) {
+		final int n = v.getValueCount();
+		if(v instanceof VarCharVector || v instanceof LargeVarCharVector) {
+			final String[] values = new String[n];
+			for(int i = 0; i < n; i++) {
+				if(!v.isNull(i))
+					values[i] = new String(v instanceof VarCharVector ? ((VarCharVector) v)
+						.get(i) : ((LargeVarCharVector) v).get(i), StandardCharsets.UTF_8);
+			}
+			return ArrayFactory.create(values);
+		}
+
+		final Array<?> values;
+		if(v instanceof IntVector) {
+			final IntVector iv = (IntVector) v;
+			final int[] a = new int[n];
+			for(int i = 0; i < n; i++)
+				if(!iv.isNull(i))
+					a[i] = iv.get(i);
+			values = ArrayFactory.create(a);
+		}
+		else if(v instanceof BigIntVector) {
+			final BigIntVector lv = (BigIntVector) v;
+			final long[] a = new long[n];
+			for(int i = 0; i < n; i++)
+				if(!lv.isNull(i))
+					a[i] = lv.get(i);
+			values = ArrayFactory.create(a);
+		}
+		else if(v instanceof Float4Vector) {
+			final Float4Vector fv = (Float4Vector) v;
+			final float[] a = new float[n];
+			for(int i = 0; i < n; i++)
+				if(!fv.isNull(i))
+					a[i] = fv.get(i);
+			values = ArrayFactory.create(a);
+		}
+		else if(v instanceof Float8Vector) {
+			final Float8Vector dv = (Float8Vector) v;
+			final double[] a = new double[n];
+			for(int i = 0; i < n; i++)
+				if(!dv.isNull(i))
+					a[i] = dv.get(i);
+			values = ArrayFactory.create(a);
+		}
+		else if(v instanceof BitVector) {
+			final BitVector bv = (BitVector) v;
+			final boolean[] a = new boolean[n];
+			for(int i = 0; i < n; i++)
+				if(!bv.isNull(i))
+					a[i] = bv.get(i) != 0;
+			values = ArrayFactory.create(a);
+		}
+		else
+			throw new DMLRuntimeException(
+				"Unsupported Arrow type " + v.getField().getType() + " of column " + v.getName());
+
+		if(v.getNullCount() == 0)
+			return values;
+		final boolean[] valid = new boolean[n];
+		for(int i = 0; i < n; i++)
+			valid[i] = !v.isNull(i);
+		return optional(values, ArrayFactory.create(valid));
+	}
+
+	private static <T> Array<T> optional(Array<T> values, ABooleanArray valid) {
+		return new OptionalArray<>(values, valid);
+	}
+
+	private static void writeArrow(FrameBlock fb, OutputStream out) throws IOException {
+		try(BufferAllocator allocator = new RootAllocator()) {
+			final List<FieldVector> vectors = new ArrayList<>();
+			final MapDictionaryProvider provider = new MapDictionaryProvider();
+			try {
+				for(int c = 0; c < fb.getNumColumns(); c++) {
+					final Array<?> a = fb.getColumn(c);
+					if(a instanceof DDCArray && ((DDCArray<?>) a).getDict() != null)
+						vectors.add(createDictionaryVector(fb.getColumnName(c), (DDCArray<?>) a, provider, allocator));
+					else
+						vectors.add(createVector(fb.getColumnName(c), a, fb.getNumRows(), allocator));
+				}
+				try(VectorSchemaRoot root = new VectorSchemaRoot(vectors);
+					ArrowStreamWriter writer = new ArrowStreamWriter(root, provider, Channels.newChannel(out))) {
+					root.setRowCount(fb.getNumRows());
+					writer.start();
+					writer.writeBatch();
+					writer.end();
+				}
+			}
+			finally {
+				for(FieldVector v : vectors)
+					v.close();
+				for(long id : provider.getDictionaryIds())
+					provider.lookup(id).getVector().close();
+			}
+		}
+	}
+
+	/**
+	 * Create a dictionary encoded vector from a DDCArray, which pandas returns as a categorical column.
+	 */
+	private static FieldVector createDictionaryVector(String name, DDCArray<?> a, MapDictionaryProvider provider,
+		BufferAllocator allocator) {
+		final Array<?> dict = a.getDict();
+		final AMapToData map = a.getMap();
+		final int n = a.size();
+		final DictionaryEncoding encoding = new DictionaryEncoding(provider.getDictionaryIds().size(), false,
+			new ArrowType.Int(32, true));
+		provider.put(new Dictionary(createVector(name, dict, dict.size(), allocator), encoding));
+		final IntVector v = new IntVector(name, new FieldType(true, new ArrowType.Int(32, true), encoding),
+			allocator);
+		v.allocateNew(n);
+		for(int i = 0; i < n; i++) {
+			final int code = map.getIndex(i);
+			if(dict.get(code) == null)
+				v.setNull(i);
+			else
+				v.set(i, code);
+		}
+		v.setValueCount(n);
+		return v;
+	}
+
+	private static FieldVector createVector(String name, Array<?> a, int n, BufferAllocator allocator) {
+		switch(a.getValueType()) {
+			case UINT4:
+			case UINT8:
+			case INT32: {
+				final IntVector v = new IntVector(name, allocator);
+				v.allocateNew(n);
+				for(int i = 0; i < n; i++) {
+					final Object o = a.get(i);
+					if(o == null)
+						v.setNull(i);
+					else
+						v.set(i, ((Number) o).intValue());
+				}
+				v.setValueCount(n);
+				return v;
+			}
+			case INT64: {
+				final BigIntVector v = new BigIntVector(name, allocator);
+				v.allocateNew(n);
+				for(int i = 0; i < n; i++) {
+					final Object o = a.get(i);
+					if(o == null)
+						v.setNull(i);
+					else
+						v.set(i, ((Number) o).longValue());
+				}
+				v.setValueCount(n);
+				return v;
+			}
+			case FP32: {
+				final Float4Vector v = new Float4Vector(name, allocator);
+				v.allocateNew(n);
+				for(int i = 0; i < n; i++) {
+					final Object o = a.get(i);
+					if(o == null)
+						v.setNull(i);
+					else
+						v.set(i, ((Number) o).floatValue());
+				}
+				v.setValueCount(n);
+				return v;
+			}
+			case FP64: {
+				final Float8Vector v = new Float8Vector(name, allocator);
+				v.allocateNew(n);
+				for(int i = 0; i < n; i++) {
+					final Object o = a.get(i);
+					if(o == null)
+						v.setNull(i);
+					else
+						v.set(i, ((Number) o).doubleValue());
+				}
+				v.setValueCount(n);
+				return v;
+			}
+			case BOOLEAN: {
+				final BitVector v = new BitVector(name, allocator);
+				v.allocateNew(n);
+				for(int i = 0; i < n; i++) {
+					final Object o = a.get(i);
+					if(o == null)
+						v.setNull(i);
+					else
+						v.set(i, (Boolean) o ? 1 : 0);
+				}
+				v.setValueCount(n);
+				return v;
+			}
+			default: {
+				// strings, characters and hashes are returned as their string representation
+				final VarCharVector v = new VarCharVector(name, allocator);
+				v.allocateNew(n);
+				for(int i = 0; i < n; i++) {
+					final Object o = a.get(i);
+					if(o == null)
+						v.setNull(i);
+					else
+						v.setSafe(i, o.toString().getBytes(StandardCharsets.UTF_8));
+				}
+				v.setValueCount(n);
+				return v;
+			}
+		}
+	}
+}
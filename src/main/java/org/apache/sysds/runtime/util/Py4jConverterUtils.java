@@ -19,17 +19,41 @@
 
 package org.apache.sysds.runtime.util;
 
+import java.io.IOException;
 import java.nio.ByteBuffer;
 import java.nio.ByteOrder;
+import java.nio.DoubleBuffer;
+import java.nio.FloatBuffer;
+import java.nio.IntBuffer;
+import java.nio.MappedByteBuffer;
+import java.nio.channels.FileChannel;
+import java.nio.channels.FileChannel.MapMode;
 import java.nio.charset.StandardCharsets;
+import java.nio.file.Paths;
+import java.nio.file.StandardOpenOption;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.BitSet;
+import java.util.List;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Future;
 
 import org.apache.sysds.common.Types;
 import org.apache.sysds.runtime.DMLRuntimeException;
+import org.apache.sysds.runtime.compress.CompressedMatrixBlock;
+import org.apache.sysds.runtime.data.DenseBlock;
+import org.apache.sysds.runtime.data.SparseBlock;
+import org.apache.sysds.runtime.frame.data.FrameBlock;
+import org.apache.sysds.runtime.frame.data.columns.ABooleanArray;
 import org.apache.sysds.runtime.frame.data.columns.Array;
 import org.apache.sysds.runtime.frame.data.columns.ArrayFactory;
 import org.apache.sysds.runtime.frame.data.columns.BitSetArray;
 import org.apache.sysds.runtime.frame.data.columns.BooleanArray;
+import org.apache.sysds.runtime.frame.data.columns.IntegerArray;
+import org.apache.sysds.runtime.frame.data.columns.LongArray;
 import org.apache.sysds.runtime.matrix.data.MatrixBlock;
+import org.apache.sysds.utils.stats.InfrastructureAnalyzer;
 
 /**
  * Utils for converting python data to java.
@@ -63,6 +87,66 @@ public class Py4jConverterUtils {
 		return mb;
 	}
 
+	/**
+	 * Convert a MatrixBlock to the compressed sparse row representation of SciPy, without converting sparse blocks to
+	 * dense. The returned array contains the row pointers (rlen + 1 int32 values), followed by the column indexes (nnz
+	 * int32 values) and the values (nnz float64 values), all in native byte order.
+	 *
+	 * @param mb The MatrixBlock to convert
+	 * @return The CSR arrays in a single byte array
+	 */
+	public static byte[] convertMBToPy4JCSR(MatrixBlock mb) {
+		mb = CompressedMatrixBlock.getUncompressed(mb, "Python sparse result transfer");
+		final int rlen = mb.getNumRows();
+		final int clen = mb.getNumColumns();
+		final long nnz = mb.recomputeNonZeros();
+		final long size = (rlen + 1L) * Integer.BYTES + nnz * (Integer.BYTES + Double.BYTES);
+		if(size > Integer.MAX_VALUE)
+			throw new DMLRuntimeException("MatrixBlock with " + nnz + " non zeros cannot be converted to a scipy matrix");
+		final byte[] ret = new byte[(int) size];
+		final ByteBuffer buf = ByteBuffer.wrap(ret).order(ByteOrder.nativeOrder());
+		final IntBuffer rowPtr = buf.asIntBuffer();
+		final IntBuffer colIdx = buf.position((rlen + 1) * Integer.BYTES).slice().order(ByteOrder.nativeOrder())
+			.asIntBuffer();
+		final DoubleBuffer values = buf.position((rlen + 1 + (int) nnz) * Integer.BYTES).slice()
+			.order(ByteOrder.nativeOrder()).asDoubleBuffer();
+		int pos = 0;
+		rowPtr.put(0);
+		if(mb.isEmptyBlock(false)) {
+			for(int r = 0; r < rlen; r++)
+				rowPtr.put(0);
+		}
+		else if(mb.isInSparseFormat()) {
+			SparseBlock sb = mb.getSparseBlock();
+			for(int r = 0; r < rlen; r++) {
+				if(!sb.isEmpty(r)) {
+					final int apos = sb.pos(r);
+					final int alen = sb.size(r);
+					colIdx.put(sb.indexes(r), apos, alen);
+					values.put(sb.values(r), apos, alen);
+					pos += alen;
+				}
+				rowPtr.put(pos);
+			}
+		}
+		else {
+			DenseBlock db = mb.getDenseBlock();
+			for(int r = 0; r < rlen; r++) {
+				final double[] avals = db.values(r);
+				final int apos = db.pos(r);
+				for(int c = 0; c < clen; c++) {
+					if(avals[apos + c] != 0) {
+						colIdx.put(c);
+						values.put(avals[apos + c]);
+						pos++;
+					}
+				}
+				rowPtr.put(pos);
+			}
+		}
+		return ret;
+	}
+
 	public static MatrixBlock allocateDenseOrSparse(int rlen, int clen, boolean isSparse) {
 		MatrixBlock ret = new MatrixBlock(rlen, clen, isSparse);
 		ret.allocateBlock();
@@ -91,40 +175,132 @@ public class Py4jConverterUtils {
 			double[] denseBlock = new double[(int) limit];
 			ByteBuffer buf = ByteBuffer.wrap(data);
 			buf.order(ByteOrder.nativeOrder());
+			readDense(buf, 0, denseBlock, 0, (int) limit, valueType);
+			mb.init(denseBlock, rlen, clen);
+		}
+		mb.recomputeNonZeros();
+		mb.examSparsity();
+		return mb;
+	}
 
-			switch(valueType) {
-				case UINT8:
-					for(int i = 0; i< limit; i++)
-						denseBlock[i] = buf.get() & 0xFF;
-					break;
-				case INT32:
-					for(int i = 0; i < limit; i++)
-						denseBlock[i] = buf.getInt();
-					break;
-				case FP32:
-					for(int i = 0; i < limit; i++)
-						denseBlock[i] = buf.getFloat();
-					break;
-				case FP64:
-					for(int i = 0; i < limit; i++)
-						denseBlock[i] = buf.getDouble();
-					break;
-				default:
-					throw new DMLRuntimeException("Unsupported value type: " + valueType.name());
+	/**
+	 * Convert a dense array written by Python into a memory mapped file (e.g., in /dev/shm) to a MatrixBlock. The file
+	 * is read directly from the mapped pages, avoiding to ship the data over the Py4J socket.
+	 * 
+	 * @param path      The path of the file containing the row-major values in native byte order
+	 * @param rlen      The number of rows
+	 * @param clen      The number of columns
+	 * @param valueType The value type of the values in the file
+	 * @return The MatrixBlock containing the values
+	 * @throws IOException If the file could not be read
+	 */
+	public static MatrixBlock convertMMapToMB(String path, int rlen, int clen, Types.ValueType valueType)
+		throws IOException {
+		final int typeSize = getTypeSize(valueType);
+		final long limit = (long) rlen * clen;
+		MatrixBlock mb = allocateDenseOrSparse(rlen, clen, false);
+		try(FileChannel channel = FileChannel.open(Paths.get(path), StandardOpenOption.READ)) {
+			if(channel.size() < limit * typeSize)
+				throw new DMLRuntimeException(
+					"Memory mapped file " + path + " is smaller than the expected " + limit * typeSize + " bytes");
+			// a single mapping is limited to 2GB, therefore map the file in segments of whole rows
+			final int segmentRows = Math.max(1, Integer.MAX_VALUE / typeSize / Math.max(1, clen));
+			for(int rl = 0; rl < rlen && clen > 0; rl += segmentRows) {
+				final int ru = Math.min(rlen, rl + segmentRows);
+				MappedByteBuffer buf = channel.map(MapMode.READ_ONLY, (long) rl * clen * typeSize,
+					(long) (ru - rl) * clen * typeSize);
+				buf.order(ByteOrder.nativeOrder());
+				readRows(buf, mb.getDenseBlock(), rl, ru, clen, valueType);
 			}
-			mb.init(denseBlock, rlen, clen);
 		}
+		return completeDenseMB(mb);
+	}
+
+	/**
+	 * Set a block of rows of a dense MatrixBlock allocated with allocateDenseOrSparse. Python sends matrices that do
+	 * not fit into a single byte array as multiple row blocks, concurrently over separate connections. Because the row
+	 * ranges are disjoint, no synchronization is needed. Once all row blocks are set, completeDenseMB has to be called.
+	 *
+	 * @param mb        The dense MatrixBlock to fill
+	 * @param data      The row-major values of the rows in native byte order
+	 * @param rl        The first row (inclusive)
+	 * @param ru        The last row (exclusive)
+	 * @param valueType The value type of the values in data
+	 */
+	public static void setRowBlock(MatrixBlock mb, byte[] data, int rl, int ru, Types.ValueType valueType) {
+		final int clen = mb.getNumColumns();
+		if(data.length < (long) (ru - rl) * clen * getTypeSize(valueType))
+			throw new DMLRuntimeException("Row block [" + rl + ":" + ru + "] has an invalid number of bytes: " + data.length);
+		ByteBuffer buf = ByteBuffer.wrap(data);
+		buf.order(ByteOrder.nativeOrder());
+		readRows(buf, mb.getDenseBlock(), rl, ru, clen, valueType);
+	}
+
+	/**
+	 * Finish a dense MatrixBlock filled by row blocks, by computing the number of non zeros and converting it to sparse
+	 * if beneficial.
+	 *
+	 * @param mb The MatrixBlock filled with setRowBlock
+	 * @return The MatrixBlock
+	 */
+	public static MatrixBlock completeDenseMB(MatrixBlock mb) {
 		mb.recomputeNonZeros();
 		mb.examSparsity();
 		return mb;
 	}
 
+	private static void readRows(ByteBuffer buf, DenseBlock db, int rl, int ru, int clen, Types.ValueType valueType) {
+		final int typeSize = getTypeSize(valueType);
+		for(int r = rl; r < ru; r++)
+			readDense(buf, (r - rl) * clen * typeSize, db.values(r), db.pos(r), clen, valueType);
+	}
+
+	private static int getTypeSize(Types.ValueType valueType) {
+		switch(valueType) {
+			case UINT8:
+				return 1;
+			case INT32:
+			case FP32:
+				return 4;
+			case FP64:
+				return 8;
+			default:
+				throw new DMLRuntimeException("Unsupported value type: " + valueType.name());
+		}
+	}
+
+	private static void readDense(ByteBuffer buf, int srcOff, double[] dest, int off, int len,
+		Types.ValueType valueType) {
+		switch(valueType) {
+			case UINT8:
+				for(int i = 0; i < len; i++)
+					dest[off + i] = buf.get(srcOff + i) & 0xFF;
+				break;
+			case INT32:
+				for(int i = 0; i < len; i++)
+					dest[off + i] = buf.getInt(srcOff + i * 4);
+				break;
+			case FP32:
+				for(int i = 0; i < len; i++)
+					dest[off + i] = buf.getFloat(srcOff + i * 4);
+				break;
+			case FP64:
+				DoubleBuffer db = buf.duplicate().position(srcOff).slice().order(buf.order()).asDoubleBuffer();
+				db.get(dest, off, len);
+				break;
+			default:
+				throw new DMLRuntimeException("Unsupported value type: " + valueType.name());
+		}
+	}
+
 	public static Array<?> convert(byte[] data, int numElements, Types.ValueType valueType) {
 		if(data == null || valueType == null) {
 			throw new DMLRuntimeException("Invalid input data or value type.");
 		}
+		return convert(ByteBuffer.wrap(data), numElements, valueType);
+	}
 
-		ByteBuffer buffer = ByteBuffer.wrap(data);
+	private static Array<?> convert(ByteBuffer buffer, int numElements, Types.ValueType valueType) {
 		buffer.order(ByteOrder.LITTLE_ENDIAN);
 
 		Array<?> array = ArrayFactory.allocate(valueType, numElements);
@@ -199,6 +375,319 @@ public class Py4jConverterUtils {
 		return array;
 	}
 
+	/**
+	 * Convert a column of strings encoded by Python in bulk. The data contains the byte lengths of all strings as
+	 * little endian int32 values (-1 for null), followed by the concatenated UTF-8 bytes of all strings.
+	 *
+	 * @param data        The encoded strings
+	 * @param numElements The number of strings
+	 * @return The array containing the strings
+	 */
+	public static Array<?> convertStrings(byte[] data, int numElements) {
+		if(data == null)
+			throw new DMLRuntimeException("Invalid input data for " + numElements + " strings.");
+		return convertStrings(data, 0, data.length, numElements);
+	}
+
+	private static Array<?> convertStrings(byte[] data, int off, int len, int numElements) {
+		if(len < (long) numElements * Integer.BYTES)
+			throw new DMLRuntimeException("Invalid input data for " + numElements + " strings.");
+		final ByteBuffer buffer = ByteBuffer.wrap(data).order(ByteOrder.LITTLE_ENDIAN);
+		final String[] values = new String[numElements];
+		int pos = off + numElements * Integer.BYTES;
+		for(int i = 0; i < numElements; i++) {
+			final int strLen = buffer.getInt(off + i * Integer.BYTES);
+			if(strLen >= 0) {
+				values[i] = new String(data, pos, strLen, StandardCharsets.UTF_8);
+				pos += strLen;
+			}
+		}
+		return ArrayFactory.create(values);
+	}
+
+	/**
+	 * Convert a column of strings to a single byte array for Python, avoiding one call per value. The format is the
+	 * same as for convertStrings, the byte lengths of all strings as little endian int32 values (-1 for null), followed
+	 * by the concatenated UTF-8 bytes of all strings.
+	 *
+	 * @param array The array to convert, values of other types are converted to their string representation
+	 * @return The encoded strings
+	 */
+	public static byte[] convertStringsToPy4J(Array<?> array) {
+		final int numElements = array.size();
+		final byte[][] values = new byte[numElements][];
+		long size = (long) numElements * Integer.BYTES;
+		for(int i = 0; i < numElements; i++) {
+			final Object v = array.get(i);
+			if(v != null) {
+				values[i] = v.toString().getBytes(StandardCharsets.UTF_8);
+				size += values[i].length;
+			}
+		}
+		if(size > Integer.MAX_VALUE)
+			throw new DMLRuntimeException("String column of " + size + " bytes cannot be converted for Python");
+		final ByteBuffer buffer = ByteBuffer.allocate((int) size).order(ByteOrder.LITTLE_ENDIAN);
+		for(int i = 0; i < numElements; i++)
+			buffer.putInt(values[i] == null ? -1 : values[i].length);
+		for(int i = 0; i < numElements; i++)
+			if(values[i] != null)
+				buffer.put(values[i]);
+		return buffer.array();
+	}
+
+	/**
+	 * Convert a column of booleans bit-packed by Python (numpy.packbits with little bit order).
+	 *
+	 * @param data        The packed bits, one bit per value
+	 * @param numElements The number of values
+	 * @return The array containing the booleans
+	 */
+	public static Array<?> convertPackedBooleans(byte[] data, int numElements) {
+		if(data == null)
+			throw new DMLRuntimeException("Invalid input data for " + numElements + " packed booleans.");
+		return convertPackedBooleans(data, 0, data.length, numElements);
+	}
+
+	private static Array<?> convertPackedBooleans(byte[] data, int off, int len, int numElements) {
+		if(len < (numElements + 7) / 8)
+			throw new DMLRuntimeException("Invalid input data for " + numElements + " packed booleans.");
+		final ABooleanArray ret = ArrayFactory.allocateBoolean(numElements);
+		final BitSet bits = BitSet.valueOf(ByteBuffer.wrap(data, off, len));
+		for(int i = bits.nextSetBit(0); i >= 0 && i < numElements; i = bits.nextSetBit(i + 1))
+			ret.set(i, true);
+		return ret;
+	}
+
+	/**
+	 * Convert a column of booleans to bit-packed bytes for Python, in the format of numpy.packbits with little bit
+	 * order. Null values are returned as false.
+	 *
+	 * @param array The boolean array
+	 * @return The packed bits, one bit per value
+	 */
+	public static byte[] convertBooleansToPackedPy4J(Array<?> array) {
+		final int numElements = array.size();
+		final BitSet bits = new BitSet(numElements);
+		for(int i = 0; i < numElements; i++)
+			if(Boolean.TRUE.equals(array.get(i)))
+				bits.set(i);
+		return Arrays.copyOf(bits.toByteArray(), (numElements + 7) / 8);
+	}
+
+	/**
+	 * Convert a pandas DataFrame to a FrameBlock in a single call. All columns are packed into one byte array, each
+	 * column in the format of convertStrings for STRING, convertPackedBooleans for BOOLEAN, and convert for all other
+	 * value types. The columns are converted in parallel.
+	 *
+	 * @param data    The packed columns
+	 * @param offsets The start offsets of the columns in data as little endian int32 values, followed by the end offset
+	 *                of the last column
+	 * @param numRows The number of rows
+	 * @param schema  The names of the value types of the columns, separated by commas
+	 * @param names   The column names, encoded as for convertStrings
+	 * @return The FrameBlock containing all columns
+	 */
+	public static FrameBlock convertFrameBlock(byte[] data, byte[] offsets, int numRows, String schema, byte[] names) {
+		final String[] types = schema.split(",");
+		final int numCols = types.length;
+		if(data == null || offsets == null || offsets.length < (numCols + 1) * Integer.BYTES)
+			throw new DMLRuntimeException("Invalid input data for " + numCols + " columns.");
+		final IntBuffer off = ByteBuffer.wrap(offsets).order(ByteOrder.LITTLE_ENDIAN).asIntBuffer();
+		final String[] colNames = new String[numCols];
+		final Array<?> colNameArray = convertStrings(names, numCols);
+		for(int j = 0; j < numCols; j++)
+			colNames[j] = (String) colNameArray.get(j);
+
+		final Array<?>[] columns = new Array<?>[numCols];
+		final int k = Math.min(InfrastructureAnalyzer.getLocalParallelism(), numCols);
+		if(k <= 1) {
+			for(int j = 0; j < numCols; j++)
+				columns[j] = convertColumn(data, off.get(j), off.get(j + 1), numRows, types[j]);
+		}
+		else {
+			final ExecutorService pool = CommonThreadPool.get(k);
+			try {
+				final List<Future<Array<?>>> tasks = new ArrayList<>(numCols);
+				for(int j = 0; j < numCols; j++) {
+					final int c = j;
+					tasks.add(pool.submit(() -> convertColumn(data, off.get(c), off.get(c + 1), numRows, types[c])));
+				}
+				for(int j = 0; j < numCols; j++)
+					columns[j] = tasks.get(j).get();
+			}
+			catch(InterruptedException | ExecutionException e) {
+				throw new DMLRuntimeException("Failed to convert frame columns", e);
+			}
+			finally {
+				pool.shutdown();
+			}
+		}
+		return new FrameBlock(columns, colNames);
+	}
+
+	private static Array<?> convertColumn(byte[] data, int start, int end, int numRows, String type) {
+		if(start < 0 || end < start || end > data.length)
+			throw new DMLRuntimeException("Invalid column offsets " + start + " to " + end);
+		final Types.ValueType valueType = Types.ValueType.valueOf(type.trim());
+		switch(valueType) {
+			case STRING:
+				return convertStrings(data, start, end - start, numRows);
+			case BOOLEAN:
+				return convertPackedBooleans(data, start, end - start, numRows);
+			default:
+				return convert(ByteBuffer.wrap(data, start, end - start), numRows, valueType);
+		}
+	}
+
+	/**
+	 * Convert all columns of a FrameBlock for Python in a single call. The result starts with the number of columns
+	 * and the byte length of the metadata as little endian int32 values, followed by the metadata encoded as for
+	 * convertStrings (the transferred value types of all columns, then the column names), the start offsets of the
+	 * columns relative to the end of the header as little endian int64 values (followed by the end offset of the last
+	 * column), and the columns. FP64, FP32, INT64 and INT32 columns are sent as little endian values, BOOLEAN columns as
+	 * packed bits as for convertBooleansToPackedPy4J, and all other columns as strings as for convertStringsToPy4J.
+	 *
+	 * @param fb The FrameBlock to convert
+	 * @return The encoded FrameBlock
+	 */
+	public static byte[] convertFrameBlockToPy4J(FrameBlock fb) {
+		final byte[][] parts = encodeFrameBlock(fb);
+		long size = 0;
+		for(byte[] part : parts)
+			size += part.length;
+		if(size > Integer.MAX_VALUE)
+			throw new DMLRuntimeException("Frame of " + size + " bytes cannot be converted for Python");
+		final ByteBuffer buffer = ByteBuffer.allocate((int) size);
+		for(byte[] part : parts)
+			buffer.put(part);
+		return buffer.array();
+	}
+
+	/**
+	 * Write all columns of a FrameBlock for Python to a file, in the format of convertFrameBlockToPy4J. This avoids
+	 * the 2GB limit of Java arrays and the transfer over the Py4J socket.
+	 *
+	 * @param fb   The FrameBlock to convert
+	 * @param path The path of the file, the file is overwritten
+	 * @throws IOException If the file cannot be written
+	 */
+	public static void convertFrameBlockToFile(FrameBlock fb, String path) throws IOException {
+		final byte[][] parts = encodeFrameBlock(fb);
+		try(FileChannel channel = FileChannel.open(Paths.get(path), StandardOpenOption.CREATE, StandardOpenOption.WRITE,
+			StandardOpenOption.TRUNCATE_EXISTING)) {
+			for(byte[] part : parts) {
+				final ByteBuffer buffer = ByteBuffer.wrap(part);
+				while(buffer.hasRemaining())
+					channel.write(buffer);
+			}
+		}
+	}
+
+	private static byte[][] encodeFrameBlock(FrameBlock fb) {
+		final int numCols = fb.getNumColumns();
+		final String[] meta = new String[2 * numCols];
+		final byte[][] parts = new byte[numCols + 1][];
+		final int k = Math.min(InfrastructureAnalyzer.getLocalParallelism(), numCols);
+		if(k <= 1) {
+			for(int j = 0; j < numCols; j++)
+				parts[j + 1] = encodeColumn(fb, j, meta);
+		}
+		else {
+			final ExecutorService pool = CommonThreadPool.get(k);
+			try {
+				final List<Future<byte[]>> tasks = new ArrayList<>(numCols);
+				for(int j = 0; j < numCols; j++) {
+					final int c = j;
+					tasks.add(pool.submit(() -> encodeColumn(fb, c, meta)));
+				}
+				for(int j = 0; j < numCols; j++)
+					parts[j + 1] = tasks.get(j).get();
+			}
+			catch(InterruptedException | ExecutionException e) {
+				throw new DMLRuntimeException("Failed to convert frame columns", e);
+			}
+			finally {
+				pool.shutdown();
+			}
+		}
+		System.arraycopy(fb.getColumnNames(), 0, meta, numCols, numCols);
+
+		final byte[] metaBytes = convertStringsToPy4J(ArrayFactory.create(meta));
+		final ByteBuffer header = ByteBuffer.allocate(2 * Integer.BYTES + metaBytes.length + (numCols + 1) * Long.BYTES)
+			.order(ByteOrder.LITTLE_ENDIAN);
+		header.putInt(numCols).putInt(metaBytes.length).put(metaBytes);
+		long offset = 0;
+		header.putLong(offset);
+		for(int j = 0; j < numCols; j++)
+			header.putLong(offset += parts[j + 1].length);
+		parts[0] = header.array();
+		return parts;
+	}
+
+	private static byte[] encodeColumn(FrameBlock fb, int c, String[] types) {
+		final int numRows = fb.getNumRows();
+		final Array<?> array = fb.getColumn(c) != null ? fb.getColumn(c) : ArrayFactory.allocate(fb.getSchema()[c],
+			numRows);
+		final boolean nulls = array.containsNull();
+		switch(array.getValueType()) {
+			case FP64:
+				types[c] = "FP64";
+				return encodeDoubles(array, numRows, nulls);
+			case FP32: {
+				types[c] = "FP32";
+				final ByteBuffer buffer = ByteBuffer.allocate(numRows * Float.BYTES).order(ByteOrder.LITTLE_ENDIAN);
+				for(int i = 0; i < numRows; i++)
+					buffer.putFloat(nulls && array.get(i) == null ? Float.NaN : (float) array.getAsDouble(i));
+				return buffer.array();
+			}
+			case INT64: {
+				// integers with nulls are returned as doubles with NaN, like pandas does for missing integers
+				if(nulls) {
+					types[c] = "FP64";
+					return encodeDoubles(array, numRows, true);
+				}
+				types[c] = "INT64";
+				final ByteBuffer buffer = ByteBuffer.allocate(numRows * Long.BYTES).order(ByteOrder.LITTLE_ENDIAN);
+				// the values are copied exactly, doubles cannot represent all longs above 2^53
+				if(array instanceof LongArray)
+					buffer.asLongBuffer().put(((LongArray) array).get(), 0, numRows);
+				else
+					for(int i = 0; i < numRows; i++)
+						buffer.putLong(((Number) array.get(i)).longValue());
+				return buffer.array();
+			}
+			case INT32:
+			case UINT8:
+			case UINT4: {
+				if(nulls) {
+					types[c] = "FP64";
+					return encodeDoubles(array, numRows, true);
+				}
+				types[c] = "INT32";
+				final ByteBuffer buffer = ByteBuffer.allocate(numRows * Integer.BYTES).order(ByteOrder.LITTLE_ENDIAN);
+				if(array instanceof IntegerArray)
+					buffer.asIntBuffer().put(((IntegerArray) array).get(), 0, numRows);
+				else
+					for(int i = 0; i < numRows; i++)
+						buffer.putInt(((Number) array.get(i)).intValue());
+				return buffer.array();
+			}
+			case BOOLEAN:
+				types[c] = "BOOLEAN";
+				return convertBooleansToPackedPy4J(array);
+			default:
+				types[c] = "STRING";
+				return convertStringsToPy4J(array);
+		}
+	}
+
+	private static byte[] encodeDoubles(Array<?> array, int numRows, boolean nulls) {
+		final ByteBuffer buffer = ByteBuffer.allocate(numRows * Double.BYTES).order(ByteOrder.LITTLE_ENDIAN);
+		for(int i = 0; i < numRows; i++)
+			buffer.putDouble(nulls && array.get(i) == null ? Double.NaN : array.getAsDouble(i));
+		return buffer.array();
+	}
+
 	public static byte[] convertMBtoPy4JDenseArr(MatrixBlock mb) {
 		byte[] ret = null;
 		if(mb.isInSparseFormat()) {
@@ -213,19 +702,184 @@ public class Py4jConverterUtils {
 
 		double[] denseBlock = mb.getDenseBlockValues();
 		if(mb.isEmptyBlock()) {
-			for(int i = 0; i < limit; i++) {
-				ByteBuffer.wrap(ret, i * times, times).order(ByteOrder.nativeOrder()).putDouble(0);
-			}
+			// the allocated array is already filled with zeros
+			return ret;
 		}
 		else if(denseBlock == null) {
 			throw new DMLRuntimeException("Error while dealing with empty blocks.");
 		}
 		else {
-			for(int i = 0; i < denseBlock.length; i++) {
-				ByteBuffer.wrap(ret, i * times, times).order(ByteOrder.nativeOrder()).putDouble(denseBlock[i]);
-			}
+			ByteBuffer.wrap(ret).order(ByteOrder.nativeOrder()).asDoubleBuffer().put(denseBlock, 0, (int) limit);
 		}
 
 		return ret;
 	}
+
+	/**
+	 * Convert a MatrixBlock to a dense row-major array of the given value type, e.g., to return FP32 results without
+	 * doubling the memory on the Python side. Values are cast like Java primitive casts, UINT8 keeps the lowest 8 bits
+	 * of the int value.
+	 *
+	 * @param mb        The MatrixBlock to convert
+	 * @param valueType The value type of the returned values, FP64, FP32, INT32 or UINT8
+	 * @return The values in native byte order
+	 */
+	public static byte[] convertMBtoPy4JDenseArr(MatrixBlock mb, Types.ValueType valueType) {
+		if(valueType == Types.ValueType.FP64)
+			return convertMBtoPy4JDenseArr(mb);
+		mb = CompressedMatrixBlock.getUncompressed(mb, "Python result transfer");
+		return convertMBtoPy4JDenseArr(mb, 0, mb.getNumRows(), valueType);
+	}
+
+	/**
+	 * Convert a block of rows of a MatrixBlock to a dense row-major array of doubles. Python fetches results that do
+	 * not fit into a single byte array as multiple row blocks, concurrently over separate connections. In contrast to
+	 * convertMBtoPy4JDenseArr, sparse blocks are not converted to dense in place, which would not be thread-safe.
+	 *
+	 * @param mb The uncompressed MatrixBlock to convert
+	 * @param rl The first row (inclusive)
+	 * @param ru The last row (exclusive)
+	 * @return The values of the rows in native byte order
+	 */
+	public static byte[] convertMBtoPy4JDenseArr(MatrixBlock mb, int rl, int ru) {
+		return convertMBtoPy4JDenseArr(mb, rl, ru, Types.ValueType.FP64);
+	}
+
+	/**
+	 * Convert a block of rows of a MatrixBlock to a dense row-major array of the given value type.
+	 *
+	 * @param mb        The uncompressed MatrixBlock to convert
+	 * @param rl        The first row (inclusive)
+	 * @param ru        The last row (exclusive)
+	 * @param valueType The value type of the returned values, FP64, FP32, INT32 or UINT8
+	 * @return The values of the rows in native byte order
+	 */
+	public static byte[] convertMBtoPy4JDenseArr(MatrixBlock mb, int rl, int ru, Types.ValueType valueType) {
+		final int clen = mb.getNumColumns();
+		final int times = getTypeSize(valueType);
+		long limit = (long) (ru - rl) * clen;
+		if(limit > Integer.MAX_VALUE / times)
+			throw new DMLRuntimeException("Row block of size " + limit + " cannot be converted to dense numpy array");
+		byte[] ret = new byte[(int) (limit * times)];
+		if(!mb.isEmptyBlock(false))
+			writeRows(mb, ByteBuffer.wrap(ret).order(ByteOrder.nativeOrder()), rl, ru, clen, valueType);
+		return ret;
+	}
+
+	/**
+	 * Write the values of a MatrixBlock as a dense row-major array of doubles into a memory mapped file, which is then
+	 * mapped by Python as a numpy array. In contrast to convertMBtoPy4JDenseArr no intermediate byte array is allocated
+	 * in the JVM and sparse blocks are written without converting them to dense.
+	 *
+	 * @param mb   The MatrixBlock to write
+	 * @param path The path to the file, the file is resized to the size of the dense array
+	 * @throws IOException If the file could not be written
+	 */
+	public static void convertMBToMMap(MatrixBlock mb, String path) throws IOException {
+		convertMBToMMap(mb, path, Types.ValueType.FP64);
+	}
+
+	/**
+	 * Write the values of a MatrixBlock as a dense row-major array of the given value type into a memory mapped file.
+	 *
+	 * @param mb        The MatrixBlock to write
+	 * @param path      The path to the file, the file is resized to the size of the dense array
+	 * @param valueType The value type of the written values, FP64, FP32, INT32 or UINT8
+	 * @throws IOException If the file could not be written
+	 */
+	public static void convertMBToMMap(MatrixBlock mb, String path, Types.ValueType valueType) throws IOException {
+		mb = CompressedMatrixBlock.getUncompressed(mb, "Python result transfer");
+		final int rlen = mb.getNumRows();
+		final int clen = mb.getNumColumns();
+		final int times = getTypeSize(valueType);
+		try(FileChannel channel = FileChannel.open(Paths.get(path), StandardOpenOption.READ,
+			StandardOpenOption.WRITE)) {
+			channel.truncate(0);
+			if(rlen == 0 || clen == 0)
+				return;
+			// a single mapping is limited to 2GB, therefore map the file in segments of whole rows,
+			// mapping beyond the end of the file grows it with zeros, so empty cells are not written
+			final int segmentRows = Math.max(1, Integer.MAX_VALUE / times / clen);
+			for(int rl = 0; rl < rlen; rl += segmentRows) {
+				final int ru = Math.min(rlen, rl + segmentRows);
+				MappedByteBuffer buf = channel.map(MapMode.READ_WRITE, (long) rl * clen * times,
+					(long) (ru - rl) * clen * times);
+				if(!mb.isEmptyBlock(false))
+					writeRows(mb, buf.order(ByteOrder.nativeOrder()), rl, ru, clen, valueType);
+			}
+		}
+	}
+
+	private static void writeRows(MatrixBlock mb, ByteBuffer buf, int rl, int ru, int clen,
+		Types.ValueType valueType) {
+		if(valueType == Types.ValueType.FP64) {
+			writeRows(mb, buf.asDoubleBuffer(), rl, ru, clen);
+			return;
+		}
+		final int times = getTypeSize(valueType);
+		if(mb.isInSparseFormat()) {
+			SparseBlock sb = mb.getSparseBlock();
+			for(int r = rl; r < ru; r++) {
+				if(sb.isEmpty(r))
+					continue;
+				final int apos = sb.pos(r);
+				final int alen = sb.size(r);
+				final int[] aix = sb.indexes(r);
+				final double[] avals = sb.values(r);
+				final int off = (r - rl) * clen;
+				for(int k = apos; k < apos + alen; k++)
+					writeValue(buf, (off + aix[k]) * times, avals[k], valueType);
+			}
+		}
+		else {
+			DenseBlock db = mb.getDenseBlock();
+			for(int r = rl; r < ru; r++) {
+				final double[] avals = db.values(r);
+				final int apos = db.pos(r);
+				final int off = (r - rl) * clen;
+				for(int c = 0; c < clen; c++)
+					writeValue(buf, (off + c) * times, avals[apos + c], valueType);
+			}
+		}
+	}
+
+	private static void writeValue(ByteBuffer buf, int pos, double v, Types.ValueType valueType) {
+		switch(valueType) {
+			case UINT8:
+				buf.put(pos, (byte) (int) v);
+				break;
+			case INT32:
+				buf.putInt(pos, (int) v);
+				break;
+			case FP32:
+				buf.putFloat(pos, (float) v);
+				break;
+			default:
+				throw new DMLRuntimeException("Unsupported value type: " + valueType.name());
+		}
+	}
+
+	private static void writeRows(MatrixBlock mb, DoubleBuffer buf, int rl, int ru, int clen) {
+		if(mb.isInSparseFormat()) {
+			SparseBlock sb = mb.getSparseBlock();
+			for(int r = rl; r < ru; r++) {
+				if(sb.isEmpty(r))
+					continue;
+				final int apos = sb.pos(r);
+				final int alen = sb.size(r);
+				final int[] aix = sb.indexes(r);
+				final double[] avals = sb.values(r);
+				final int off = (r - rl) * clen;
+				for(int k = apos; k < apos + alen; k++)
+					buf.put(off + aix[k], avals[k]);
+			}
+		}
+		else {
+			DenseBlock db = mb.getDenseBlock();
+			for(int r = rl; r < ru; r++) {
+				buf.position((r - rl) * clen);
+				buf.put(db.values(r), db.pos(r), clen);
+			}
+		}
+	}
 }
@@ -20,5 +20,6 @@
 # -------------------------------------------------------------
 
 from systemds.context.systemds_context import SystemDSContext
+from systemds.context.systemds_context_pool import SystemDSContextPool
 
-__all__ = ["SystemDSContext"]
+__all__ = ["SystemDSContext", "SystemDSContextPool"]
@@ -24,19 +24,24 @@ __all__ = ["SystemDSContext"]
 import json
 import logging
 import os
-import socket
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from glob import glob
-from queue import Queue
+from queue import Empty, Queue
 from subprocess import PIPE, Popen
-from threading import Thread
-from time import sleep
+from threading import Lock, RLock, Thread, current_thread
+from time import perf_counter
 from typing import Dict, Iterable, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from py4j.java_gateway import GatewayParameters, JavaGateway, Py4JNetworkError
+from py4j.java_gateway import (
+    GatewayParameters,
+    JavaGateway,
+    JavaObject,
+    Py4JNetworkError,
+)
 from systemds.operator import (
     Frame,
     List,
@@ -48,8 +53,32 @@ from systemds.operator import (
     MultiReturn,
 )
 from systemds.script_building import DMLScript
-from systemds.utils.consts import VALID_INPUT_TYPES
+from systemds.utils.consts import (
+    ASYNC_THREAD_PREFIX,
+    DEFAULT_ASYNC_WORKERS,
+    HANDSHAKE_PREFIX,
+    VALID_INPUT_TYPES,
+)
+from systemds.utils.converters import is_scipy_sparse
 from systemds.utils.helpers import get_module_dir, valuetype_from_str
+from systemds.utils.input_cache import (
+    DEFAULT_INPUT_CACHE_BYTES,
+    InputCache,
+    input_key_scope,
+)
+from systemds.utils.result_cache import DEFAULT_RESULT_CACHE_BYTES, ResultCache
+from systemds.utils.script_cache import DEFAULT_SCRIPT_CACHE_SIZE, ScriptCache
+from systemds.utils.jvm_options import (
+    CDS_DUMP_TIMEOUT,
+    cds_archive_path,
+    cds_options,
+    jvm_tuning_options,
+)
+from systemds.utils.output_buffer import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_LINES,
+    OutputBuffer,
+)
 
 
 class SystemDSContext(object):
@@ -60,12 +89,29 @@ class SystemDSContext(object):
     all the different objects and adding them to the execution.
     """
 
-    java_gateway: JavaGateway
+    _java_gateway: JavaGateway = None
+    _jmlc_connection: JavaObject = None
+    _startup_thread: Thread = None
+    _startup_error: Exception = None
+    _session_id: int = None
+    _attached: bool = False
+    _shared_memory_transfer: bool = True
+    _arrow_transfer: bool = True
+    _port: int = -1
+    _startup_times: Dict[str, float] = {}
+    _startup_timeout: float = 60.0
+    _jvm_options: Sequence[str] = []
+    __cds_dump: Tuple[str, str] = None
     _capture_statistics: bool = False
     _statistics: str = ""
     _log: logging.Logger
-    __stdout: Queue = None
-    __stderr: Queue = None
+    __stdout: OutputBuffer = None
+    __stderr: OutputBuffer = None
+    _input_cache: InputCache = None
+    _script_cache: ScriptCache = None
+    _result_cache: ResultCache = None
+    _compute_lock: RLock = None
+    _executor: ThreadPoolExecutor = None
 
     def __init__(
         self,
@@ -74,11 +120,27 @@ class SystemDSContext(object):
         capture_stdout: bool = False,
         logging_level: int = 20,
         py4j_logging_level: int = 50,
+        attach: str = None,
+        daemon: bool = False,
+        lazy_start: bool = False,
+        capture_max_lines: int = DEFAULT_MAX_LINES,
+        capture_max_bytes: int = DEFAULT_MAX_BYTES,
+        capture_spill_path: str = None,
+        tune_jvm: bool = True,
+        jvm_memory: str = None,
+        jvm_threads: int = None,
+        jvm_options: Iterable[str] = None,
+        class_data_sharing: bool = True,
+        input_cache_bytes: int = DEFAULT_INPUT_CACHE_BYTES,
+        script_cache_size: int = DEFAULT_SCRIPT_CACHE_SIZE,
+        result_cache_bytes: int = DEFAULT_RESULT_CACHE_BYTES,
+        async_workers: int = DEFAULT_ASYNC_WORKERS,
     ):
         """Starts a new instance of SystemDSContext, in which the connection to a JVM systemds instance is handled
-        Any new instance of this SystemDS Context, would start a separate new JVM.
+        Any new instance of this SystemDS Context, would start a separate new JVM, unless attach is specified,
+        in which case the context connects to an already running daemon JVM.
 
-        Standard out and standard error form the JVM is also handled in this class, filling up Queues,
+        Standard out and standard error form the JVM is also handled in this class, filling up bounded buffers,
         that can be read from to get the printed statements from the JVM.
 
         :param port: default -1, giving a random port for communication with JVM
@@ -88,40 +150,197 @@ class SystemDSContext(object):
             The logging levels are as follows: 10 DEBUG, 20 INFO, 30 WARNING, 40 ERROR, 50 CRITICAL.
         :param py4j_logging_level: The logging level for Py4j to use, since all communication to the JVM is done through this,
             it can be verbose if not set high.
+        :param attach: Address "host:port" of a running daemon JVM to attach to instead of starting a new JVM.
+            The context gets its own session in the daemon, isolating its variables and prepared scripts from
+            other clients, and close() only detaches from the daemon without stopping it.
+        :param daemon: Start the JVM in daemon mode, such that other processes can attach to it via the
+            port of this context (see get_port()). The daemon is stopped when this context is closed.
+        :param lazy_start: Return immediately and start the JVM in a background thread. Building the
+            operation DAG does not need the JVM, therefore it overlaps with the startup, and the first
+            call that needs the JVM (e.g. compute) waits until the JVM is ready.
+        :param capture_max_lines: The maximum number of lines kept of each captured stdout and stderr,
+            older lines are evicted, -1 for unlimited.
+        :param capture_max_bytes: The maximum number of bytes kept of each captured stdout and stderr,
+            older lines are evicted, -1 for unlimited.
+        :param capture_spill_path: Optional path prefix, if set, evicted lines of the captured output
+            are appended to the files <path>.out and <path>.err instead of being dropped.
+        :param tune_jvm: Size the JVM heap, garbage collector and parallelism to the available memory and cores.
+        :param jvm_memory: The maximum heap of the JVM e.g. "8g", overriding the size derived from the available memory.
+        :param jvm_threads: The number of cores the JVM uses, overriding the available cores.
+        :param jvm_options: Additional options passed to the JVM, taking precedence over the tuned options.
+        :param class_data_sharing: Create and reuse a class data sharing archive of the SystemDS classes to
+            reduce the JVM startup time. The archive is created when the first JVM using it is closed.
+        :param input_cache_bytes: The memory budget in bytes for Python local inputs (numpy arrays, scipy
+            matrices and pandas DataFrames) kept in the JVM, such that repeated computations over the
+            same data skip the transfer. Inputs are identified by their content and the least recently
+            used are released first. 0 disables the cache.
+        :param script_cache_size: The number of compiled scripts kept for reuse, such that computing
+            the same operations again, e.g. on new input data, skips parsing and compiling the DML.
+            The least recently used scripts are released first. 0 disables the cache.
+        :param result_cache_bytes: The memory budget in bytes for computed results kept in Python, such
+            that computing a node again returns its result without execution, as long as its Python local
+            inputs are unchanged. Only results of deterministic operations are kept, and not if a Python
+            local input is larger than the budget. Cached results are returned as read-only arrays.
+            The least recently used results are released first. 0 disables the cache.
+        :param async_workers: The number of computations started with compute_async that are
+            executed concurrently, further computations wait for a free worker.
         """
         self.__setup_logging(logging_level, py4j_logging_level)
-        self.__start(port, capture_stdout)
-        self.capture_stats(capture_statistics)
-        self._log.debug("Started JVM and SystemDS python context manager")
+        self._input_cache = InputCache(input_cache_bytes)
+        self._script_cache = ScriptCache(script_cache_size)
+        self._result_cache = ResultCache(result_cache_bytes)
+        self._compute_lock = RLock()
+        self.__async_workers = async_workers
+        self.__executor_lock = Lock()
+        self.__tune_jvm = tune_jvm
+        self.__jvm_memory = jvm_memory
+        self.__jvm_threads = jvm_threads
+        self.__extra_jvm_options = list(jvm_options) if jvm_options else []
+        self.__class_data_sharing = class_data_sharing
+        if capture_stdout:
+            self.__stdout = OutputBuffer(
+                capture_max_lines,
+                capture_max_bytes,
+                capture_spill_path + ".out" if capture_spill_path else None,
+            )
+            self.__stderr = OutputBuffer(
+                capture_max_lines,
+                capture_max_bytes,
+                capture_spill_path + ".err" if capture_spill_path else None,
+            )
+        self._capture_statistics = capture_statistics
+        if lazy_start:
+            self._startup_thread = Thread(
+                target=self.__startup,
+                args=(port, capture_stdout, attach, daemon),
+                daemon=True,
+            )
+            self._startup_thread.start()
+        else:
+            self.__startup(port, capture_stdout, attach, daemon)
+
+    def __startup(self, port: int, capture_stdout: bool, attach: str, daemon: bool):
+        """Start or attach to the JVM and configure the connection of this context.
+        When started lazily this runs in a background thread, and any error is kept
+        to be raised on the first access to the JVM."""
+        try:
+            if attach is not None:
+                self.__attach(attach)
+            else:
+                self.__start(port, capture_stdout, daemon)
+                self._jmlc_connection = self._java_gateway.entry_point.getConnection()
+            self.__set_statistics(self._capture_statistics)
+            # outputs are bound directly, generated scripts contain no write statements
+            self._jmlc_connection.setOutputBinding(True)
+            self._log.debug("Started JVM and SystemDS python context manager")
+        except Exception as e:
+            if self._startup_thread is None:
+                raise
+            self._startup_error = e
+
+    def __wait_for_startup(self):
+        """Block until a lazily started JVM is ready, and raise if its startup failed."""
+        if self._startup_thread is not None:
+            self._startup_thread.join()
+        if self._startup_error is not None:
+            raise RuntimeError(
+                "Failed startup of SystemDS JVM"
+            ) from self._startup_error
+
+    @property
+    def java_gateway(self) -> JavaGateway:
+        """The gateway to the JVM, waits for the JVM if it is started lazily and not yet ready."""
+        self.__wait_for_startup()
+        return self._java_gateway
+
+    @property
+    def _connection(self) -> JavaObject:
+        """The JMLC connection scripts are prepared with, waits for the JVM if necessary."""
+        self.__wait_for_startup()
+        return self._jmlc_connection
+
+    def is_started(self) -> bool:
+        """Get if the JVM is ready, without waiting for a lazily started JVM."""
+        return self._java_gateway is not None and self._jmlc_connection is not None
 
     def get_stdout(self, lines: int = -1):
         """Getter for the stdout of the java subprocess
-        The output is taken from the stdout queue and returned in a new list.
-        :param lines: The number of lines to try to read from the stdout queue.
-        default -1 prints all current lines in the queue.
+        The output is taken from the stdout buffer and returned in a new list.
+        :param lines: The number of lines to try to read from the stdout buffer.
+        default -1 prints all current lines in the buffer.
         """
-        if self.__stdout:
-            if lines == -1 or self.__stdout.qsize() < lines:
-                return [self.__stdout.get() for x in range(self.__stdout.qsize())]
-            else:
-                return [self.__stdout.get() for x in range(lines)]
+        if self.__stdout is not None:
+            return self.__stdout.take(lines)
         else:
             return []
 
     def get_stderr(self, lines: int = -1):
         """Getter for the stderr of the java subprocess
-        The output is taken from the stderr queue and returned in a new list.
-        :param lines: The number of lines to try to read from the stderr queue.
-        default -1 prints all current lines in the queue.
+        The output is taken from the stderr buffer and returned in a new list.
+        :param lines: The number of lines to try to read from the stderr buffer.
+        default -1 prints all current lines in the buffer.
         """
-        if self.__stderr:
-            if lines == -1 or self.__stderr.qsize() < lines:
-                return [self.__stderr.get() for x in range(self.__stderr.qsize())]
-            else:
-                return [self.__stderr.get() for x in range(lines)]
+        if self.__stderr is not None:
+            return self.__stderr.take(lines)
+        else:
+            return []
+
+    def tail_stdout(self, lines: int = 10):
+        """Get the most recent lines of the stdout of the java subprocess,
+        without removing them from the stdout buffer.
+        :param lines: The number of lines to return.
+        """
+        if self.__stdout is not None:
+            return self.__stdout.tail(lines)
         else:
             return []
 
+    def tail_stderr(self, lines: int = 10):
+        """Get the most recent lines of the stderr of the java subprocess,
+        without removing them from the stderr buffer.
+        :param lines: The number of lines to return.
+        """
+        if self.__stderr is not None:
+            return self.__stderr.tail(lines)
+        else:
+            return []
+
+    def input_cache_statistics(self) -> Dict[str, int]:
+        """Get the statistics of the cache of Python local inputs kept in the JVM.
+
+        :return: A dict of the number of cache hits, misses and evicted inputs, and the
+            number and size in bytes of the cached inputs.
+        """
+        return self._input_cache.statistics()
+
+    def clear_input_cache(self):
+        """Release all Python local inputs kept in the JVM."""
+        self._input_cache.clear()
+
+    def script_cache_statistics(self) -> Dict[str, int]:
+        """Get the statistics of the cache of compiled scripts.
+
+        :return: A dict of the number of cache hits, misses and evicted scripts, and the
+            number of cached scripts.
+        """
+        return self._script_cache.statistics()
+
+    def clear_script_cache(self):
+        """Release all compiled scripts kept for reuse."""
+        self._script_cache.clear()
+
+    def result_cache_statistics(self) -> Dict[str, int]:
+        """Get the statistics of the cache of computed results.
+
+        :return: A dict of the number of cache hits, misses and evicted results, and the
+            number and size in bytes of the cached results.
+        """
+        return self._result_cache.statistics()
+
+    def clear_result_cache(self):
+        """Release all computed results kept for reuse."""
+        self._result_cache.clear()
+
     def exception_and_close(self, exception, trace_back_limit: int = None):
         """
         Method for printing exception, printing stdout and error, while also closing the context correctly.
@@ -142,35 +361,42 @@ class SystemDSContext(object):
         self.close()
         raise RuntimeError(message)
 
-    def __try_startup(self, command: str, capture_stdout: bool) -> Popen:
+    def __try_startup(self, command: str, capture_stdout: bool) -> Tuple[Popen, Queue]:
+        """Spawn the JVM process. Standard out is always piped, since the JVM reports
+        the port it bound and that it is ready on it, all other lines of standard out are
+        either captured in the stdout queue or forwarded to the standard out of python.
+
+        :param command: The command to start the JVM with.
+        :param capture_stdout: If the output of the JVM should be captured.
+        :return: The process and the queue the handshake port is reported in.
+        """
+        handshake = Queue()
         if capture_stdout:
             process = Popen(command, stdout=PIPE, stdin=PIPE, stderr=PIPE)
 
-            # Handle Std out from the subprocess.
-            self.__stdout = Queue()
-            self.__stderr = Queue()
-
-            self.__stdout_thread = Thread(
-                target=self.__enqueue_output,
-                args=(process.stdout, self.__stdout),
-                daemon=True,
-            )
-
+            # Handle Std err from the subprocess.
             self.__stderr_thread = Thread(
                 target=self.__enqueue_output,
                 args=(process.stderr, self.__stderr),
                 daemon=True,
             )
-
-            self.__stdout_thread.start()
             self.__stderr_thread.start()
-            return process
         else:
-            return Popen(command)
+            process = Popen(command, stdout=PIPE)
 
-    def __build_startup_command(self, port: int):
+        self.__stdout_thread = Thread(
+            target=self.__enqueue_output,
+            args=(process.stdout, self.__stdout, handshake),
+            daemon=True,
+        )
+        self.__stdout_thread.start()
+        return process, handshake
+
+    def __build_startup_command(self, port: int, daemon: bool = False):
         """Build the command line argument for the startup of the JVM
-        :param port: The port address to use if -1 chose random port."""
+        :param port: The port address to use if -1 chose random port.
+        :param daemon: If the JVM should be started as a daemon other processes can attach to.
+        """
 
         # Base command
         command = ["java", "-cp"]
@@ -223,6 +449,29 @@ class SystemDSContext(object):
 
         command.append(classpath)
 
+        # Allow Arrow to access direct buffers for the exchange of frames.
+        command.append("--add-opens=java.base/java.nio=ALL-UNNAMED")
+
+        # Tune the JVM to the available resources, and share class data across launches.
+        jvm_options = []
+        if self.__tune_jvm:
+            jvm_options.extend(
+                jvm_tuning_options(self.__jvm_memory, self.__jvm_threads)
+            )
+        if self.__class_data_sharing:
+            archive = cds_archive_path(classpath)
+            if archive is not None:
+                if not os.path.exists(archive):
+                    dump_file = f"{archive}.{os.getpid()}.{id(self)}.tmp"
+                    self.__cds_dump = (dump_file, archive)
+                    jvm_options.extend(cds_options(archive, dump_file))
+                else:
+                    jvm_options.extend(cds_options(archive))
+        jvm_options.extend(self.__extra_jvm_options)
+        command.extend(jvm_options)
+        self._jvm_options = jvm_options
+        self._log.info("JVM options: " + " ".join(jvm_options))
+
         # Find the logging configuration file.
         if os.environ.get("LOG4JPROP") == None:
             files = glob(os.path.join(root, "conf", "log4j*.properties"))
@@ -265,80 +514,126 @@ class SystemDSContext(object):
             command.append("-config")
             command.append(files[0])
 
-        if port == -1:
-            actual_port = self.__get_open_port()
-        else:
-            actual_port = port
-
+        # Port 0 lets the JVM bind an ephemeral port, which it reports back on startup.
         command.append("--python")
-        command.append(str(actual_port))
+        command.append(str(port if port != -1 else 0))
+
+        if daemon:
+            command.append("-daemon")
 
         self._log.info("Command " + str(command))
-        self._log.info("Port used for communication: " + str(actual_port))
 
-        return command, actual_port
+        return command
 
-    def __start(self, port: int, capture_stdout: bool, retry: int = 0):
-        """Starts the JVM and establishes connection to it via calls to:
-        jvm.System.currentTimeMillis()
-        If the connection is not established the connection is
-        tried to be established multiple times,
-        and if this fails new JVMs are allocated up to a total of 3 times.
+    def __start(
+        self, port: int, capture_stdout: bool, daemon: bool = False, retry: int = 0
+    ):
+        """Starts the JVM and establishes connection to it.
+        The JVM binds the port itself and reports it together with a ready signal
+        on its standard out, therefore no port probing or polling of the gateway is needed.
+        If the JVM terminates or does not report readiness in time,
+        new JVMs are allocated up to a total of 3 times.
 
         :param port: The port to try, if -1 chose random.
         :param capture_stdout: If the output of the JVM should be captured.
+        :param daemon: If the JVM should be started in daemon mode.
         :param retry: The Retry number of the current startup.
         """
         if retry > 3:
             raise Exception("Failed startup of SystemDS Context with 3 repeats")
 
-        if port != -1 and self.__is_port_in_use(port):
-            port = -1
-        command, actual_port = self.__build_startup_command(port)
+        times = {}
+        start = perf_counter()
+        command = self.__build_startup_command(port, daemon)
+        times["build_command"] = perf_counter() - start
 
-        # Verify the port intended is available.
-        while self.__is_port_in_use(actual_port):
-            (
-                command,
-                actual_port,
-            ) = self.__build_startup_command(actual_port)
+        phase = perf_counter()
+        process, handshake = self.__try_startup(command, capture_stdout)
+        times["spawn_process"] = perf_counter() - phase
 
-        process = self.__try_startup(command, capture_stdout)
-
-        # Eager load to test connection to the JVM via calls to currentTimeMillis
-        gwp = GatewayParameters(port=actual_port, eager_load=True)
         try:
-            connect_retry = 1
-            max_retry = 25
-            while connect_retry < max_retry:
-                # Increasing sleep time to establish connection.
-                sleep_time = 0.04 * connect_retry
-                sleep(sleep_time)
-                try:
-                    self.java_gateway = JavaGateway(
-                        gateway_parameters=gwp, java_process=process
-                    )
-                    # Successful startup.
-                    return
-                except Py4JNetworkError as pe:
-                    m = str(pe)
-                    if (
-                        "An error occurred while trying to connect to the Java server"
-                        in m
-                    ):
-                        # Here the startup failed because the java process is not ready.
-                        connect_retry += 1
-                    else:  # unknown new error or java process crashed
-                        raise pe
-                except Exception as e:
-                    raise Exception(
-                        "Exception hit when connecting to JavaGateway, perhaps the JVM terminated because of port",
-                        e,
-                    )
-            raise Exception("Failed to connect to process, making a new JVM")
-        except Exception:
+            phase = perf_counter()
+            try:
+                ready = handshake.get(timeout=self._startup_timeout)
+            except Empty:
+                raise Exception("JVM did not report ready in time")
+            if ready is None:
+                # Here the JVM terminated before being ready, e.g. because the port was in use.
+                raise Exception("JVM terminated during startup")
+            actual_port, jvm_uptime = ready
+            times["wait_for_jvm"] = perf_counter() - phase
+            times["jvm_startup"] = jvm_uptime
+
+            phase = perf_counter()
+            gwp = GatewayParameters(port=actual_port, eager_load=True)
+            self._java_gateway = JavaGateway(
+                gateway_parameters=gwp, java_process=process
+            )
+            times["connect_gateway"] = perf_counter() - phase
+        except Exception as e:
+            self._log.debug("Failed startup, retrying with random port: " + str(e))
             self.__kill_Popen(process)
-            self.__start(-1, capture_stdout, retry + 1)
+            self.__start(-1, capture_stdout, daemon, retry + 1)
+            return
+
+        times["total"] = perf_counter() - start
+        times["retries"] = retry
+        self._startup_times = times
+        self._port = actual_port
+        self._log.info("Port used for communication: " + str(actual_port))
+        self._log.debug("Startup times: " + str(times))
+
+    def __attach(self, address: str):
+        """Attach to an already running daemon JVM and open a new session in it.
+
+        :param address: The address of the daemon in the format "host:port".
+        """
+        host, sep, port = address.rpartition(":")
+        if not sep or not port.isdigit():
+            raise ValueError(
+                "Invalid attach address, expected 'host:port' but got: " + address
+            )
+        host = host if host else "localhost"
+        gwp = GatewayParameters(address=host, port=int(port), eager_load=True)
+        try:
+            self._java_gateway = JavaGateway(gateway_parameters=gwp)
+        except Py4JNetworkError as pe:
+            raise Exception(
+                "Failed to attach to SystemDS daemon at " + address, pe
+            ) from pe
+        entry_point = self._java_gateway.entry_point
+        if not entry_point.isDaemon():
+            self._java_gateway.close()
+            raise ValueError("The JVM at " + address + " is not running in daemon mode")
+        self._port = int(port)
+        self._attached = True
+        # Data is exchanged via memory mapped files only if the daemon shares the file system.
+        self._shared_memory_transfer = host in ["localhost", "127.0.0.1", "::1"]
+        self._session_id = entry_point.openSession()
+        self._jmlc_connection = entry_point.getSession(self._session_id)
+        self._log.debug(
+            "Attached to SystemDS daemon at "
+            + address
+            + " with session "
+            + str(self._session_id)
+        )
+
+    def get_port(self) -> int:
+        """Get the port the JVM of this context is listening on, this is the port
+        other processes can attach to if the context was started with daemon=True."""
+        return self._port
+
+    def get_startup_times(self) -> Dict[str, float]:
+        """Get the time in seconds spent in each phase of starting the JVM of this context.
+        The phases are build_command, spawn_process, wait_for_jvm (until the JVM reported
+        ready), jvm_startup (the JVM uptime when it got ready, as reported by the JVM),
+        connect_gateway and total. Additionally retries contains the number of restarted JVMs.
+        For contexts attached to a daemon the dictionary is empty."""
+        return dict(self._startup_times)
+
+    def is_attached(self) -> bool:
+        """Get if this context is attached to a daemon JVM it does not own."""
+        return self._attached
 
     def __enter__(self):
         return self
@@ -349,10 +644,35 @@ class SystemDSContext(object):
         return None
 
     def close(self):
-        """Close the connection to the java process and do necessary cleanup."""
-        if hasattr(self, "java_gateway"):
-            self.__kill_Popen(self.java_gateway.java_process)
-            self.java_gateway.shutdown()
+        """Close the connection to the java process and do necessary cleanup.
+        If the context is attached to a daemon, only the session is closed and the daemon keeps running.
+        A lazily started JVM is waited for before it is stopped.
+        """
+        if self._startup_thread is not None:
+            self._startup_thread.join()
+        if self._executor is not None:
+            # wait for running computations, unless closing due to an error in one of them
+            self._executor.shutdown(
+                wait=not current_thread().name.startswith(ASYNC_THREAD_PREFIX)
+            )
+        self._input_cache.clear()
+        self._script_cache.clear()
+        self._result_cache.clear()
+        if self.is_attached():
+            if self._session_id is not None:
+                try:
+                    self._java_gateway.entry_point.closeSession(self._session_id)
+                except Py4JNetworkError:
+                    self._log.warning("Daemon was unreachable while closing session")
+                self._java_gateway.close()
+            self._session_id = None
+            return
+        if self._java_gateway is not None:
+            if self.__cds_dump is not None:
+                self.__shutdown_and_dump_cds()
+            else:
+                self.__kill_Popen(self._java_gateway.java_process)
+                self._java_gateway.shutdown()
         if hasattr(self, "__process"):
             logging.error("Has process variable")
             self.__kill_Popen(self.__process)
@@ -360,6 +680,30 @@ class SystemDSContext(object):
             self.__stdout_thread.join(0)
         if hasattr(self, "__stderr_thread") and self.__stderr_thread.is_alive():
             self.__stderr_thread.join(0)
+        if self.__stdout is not None:
+            self.__stdout.close()
+        if self.__stderr is not None:
+            self.__stderr.close()
+
+    def __shutdown_and_dump_cds(self):
+        """Shut down the JVM gracefully such that it dumps the class data sharing archive
+        on exit, and move the archive in place for the next JVMs to use."""
+        dump_file, archive = self.__cds_dump
+        self.__cds_dump = None
+        process = self._java_gateway.java_process
+        try:
+            self._java_gateway.shutdown()
+            process.wait(timeout=CDS_DUMP_TIMEOUT)
+        except Exception as e:
+            self._log.warning("Failed to dump class data sharing archive: " + str(e))
+        self.__kill_Popen(process)
+        if os.path.exists(dump_file):
+            os.replace(dump_file, archive)
+            self._log.debug("Created class data sharing archive: " + archive)
+
+    def get_jvm_options(self) -> Sequence[str]:
+        """Get the JVM options chosen when starting the JVM of this context."""
+        return list(self._jvm_options)
 
     def __kill_Popen(self, process: Popen):
         """Stop the process at the Popen.
@@ -367,29 +711,28 @@ class SystemDSContext(object):
         process.kill()
         process.__exit__(None, None, None)
 
-    def __enqueue_output(self, out, queue):
+    def __enqueue_output(self, out, buffer: OutputBuffer, handshake: Queue = None):
         """Method for handling the output from java.
         It is locating the string handling inside a different thread, since the 'out.readline' is a blocking command.
+
+        :param out: The stream to read from.
+        :param buffer: The buffer to put lines in, if None the lines are forwarded to the python standard out.
+        :param handshake: If given, the ready signal of the JVM is expected on this stream and the
+            port and JVM uptime reported are put into this queue, or None if the stream ends before.
         """
         for line in iter(out.readline, b""):
             line_string = line.decode("utf-8")
-            queue.put(line_string.strip())
-
-    def __get_open_port(self):
-        """Get a random available port.
-        and hope that no other process steals it while we wait for the JVM to startup
-        """
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.bind(("", 0))
-            s.listen(1)
-            return s.getsockname()[1]
-
-    def __is_port_in_use(self, port: int) -> bool:
-        """Get if the given port is in use.
-        :param port: The port to analyze"""
-        # https://stackoverflow.com/questions/2470971/fast-way-to-test-if-a-port-is-in-use-using-python
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            return s.connect_ex(("localhost", port)) == 0
+            if handshake is not None and line_string.startswith(HANDSHAKE_PREFIX):
+                port, uptime = line_string[len(HANDSHAKE_PREFIX) :].strip().split(":")
+                handshake.put((int(port), int(uptime) / 1000))
+                handshake = None
+            elif buffer is None:
+                sys.stdout.write(line_string)
+                sys.stdout.flush()
+            else:
+                buffer.append(line_string.strip(), len(line))
+        if handshake is not None:
+            handshake.put(None)
 
     def _execution_completed(self, script: DMLScript):
         """
@@ -397,8 +740,9 @@ class SystemDSContext(object):
         Used to update statistics.
         :param script: The script that got executed
         """
-        if self._capture_statistics:
-            self._statistics += script.prepared_script.statistics()
+        if script.statistics is not None:
+            with self._compute_lock:
+                self._statistics += script.statistics
 
     def capture_stats(self, enable: bool = True):
         """
@@ -406,7 +750,20 @@ class SystemDSContext(object):
         :param enable: if `True` enable capturing, else disable it
         """
         self._capture_statistics = enable
-        self.java_gateway.entry_point.getConnection().setStatistics(enable)
+        self.__wait_for_startup()
+        self.__set_statistics(enable)
+
+    def __set_statistics(self, enable: bool):
+        """Request statistics for the session of this context. Statistics are gathered
+        JVM-wide while any session of a daemon requests them, therefore a context never
+        switches them off for other attached contexts."""
+        session = 0 if self._session_id is None else self._session_id
+        self._java_gateway.entry_point.setStatistics(session, enable)
+
+    def _enable_lineage(self):
+        """Enable lineage tracing in the JVM, without resetting the lineage traced by
+        other sessions if it is already enabled."""
+        self.java_gateway.entry_point.enableLineage()
 
     @contextmanager
     def capture_stats_context(self):
@@ -454,6 +811,97 @@ class SystemDSContext(object):
         """Clears the captured statistics."""
         self._statistics = ""
 
+    def compute(self, *nodes: OperationNode, verbose: bool = False) -> Tuple:
+        """Compute several nodes together in one script and return all their results.
+
+        Operations shared between the nodes are only executed once, and all results are
+        returned from one execution. Matrices are returned as numpy arrays with the
+        default options of compute.
+
+        Example:
+
+        # ```Python
+        # loss, accuracy, weights = sds.compute(loss, accuracy, weights)
+        # ```
+
+        :param nodes: The nodes to compute
+        :param verbose: Print the generated script and the output of the execution
+        :return: A tuple of the results, in the order of the nodes
+        """
+        # each input is hashed once, for the result keys and the input cache
+        with input_key_scope():
+            return self.__compute(nodes, verbose)
+
+    def __compute(self, nodes: Tuple[OperationNode], verbose: bool) -> Tuple:
+        results = [None] * len(nodes)
+        executed = []
+        for idx, node in enumerate(nodes):
+            if node.is_python_local_data:
+                results[idx] = node.compute()
+                continue
+            key = None
+            if not node._datatype_is_none and self._result_cache.enabled:
+                key = node._result_key()
+                if key is not None:
+                    found, result = self._result_cache.get(node, key)
+                    if found:
+                        results[idx] = result
+                        continue
+            executed.append((idx, node, key))
+
+        if len(executed) == 0:
+            return tuple(results)
+
+        script = DMLScript(self)
+        with self._compute_lock:
+            script.build_code_multiple([node for _, node, _ in executed])
+            for _, node, _ in executed:
+                script.clear(node)
+        if verbose:
+            print("SCRIPT:")
+            print(script.dml_script)
+
+        result_variables = script.execute()
+        self._execution_completed(script)
+
+        for idx, node, key in executed:
+            if result_variables is not None and not node._datatype_is_none:
+                results[idx] = node._parse_output_result_variables(
+                    result_variables, script, node._result_options()
+                )
+                if key is not None:
+                    self._result_cache.put(node, key, results[idx])
+
+        if verbose:
+            for x in self.get_stdout():
+                print(x)
+            for y in self.get_stderr():
+                print(y)
+
+        return tuple(results)
+
+    def compute_async(self, *nodes: OperationNode, verbose: bool = False) -> Future:
+        """Compute several nodes together in a background thread, see compute().
+
+        :param nodes: The nodes to compute
+        :param verbose: Print the generated script and the output of the execution
+        :return: A future of the tuple of the results, in the order of the nodes
+        """
+        return self._submit(self.compute, *nodes, verbose=verbose)
+
+    def _submit(self, fn, *args, **kwargs) -> Future:
+        """Run a computation in a worker thread of this context.
+        Concurrent computations use separate connections of the gateway to the JVM.
+
+        :return: The future of the result of the computation
+        """
+        with self.__executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.__async_workers, thread_name_prefix=ASYNC_THREAD_PREFIX
+                )
+        return self._executor.submit(fn, *args, **kwargs)
+
     def full(self, shape: Tuple[int, int], value: Union[float, int]) -> "Matrix":
         """Generates a matrix completely filled with a value
 
@@ -649,6 +1097,30 @@ class SystemDSContext(object):
         named_params.update(kwargs)
         return Matrix(self, "read", unnamed_params, named_params, local_data=mat)
 
+    def from_scipy(
+        self,
+        mat,
+        *args: Sequence[VALID_INPUT_TYPES],
+        **kwargs: Dict[str, VALID_INPUT_TYPES],
+    ) -> Matrix:
+        """Generate DAGNode representing matrix with data given by a scipy sparse matrix (e.g., COO, CSR or CSC),
+        which will be sent to SystemDS on need without converting it to dense.
+
+        :param mat: the scipy sparse matrix
+        :param args: unnamed parameters
+        :param kwargs: named parameters
+        :return: A Matrix
+        """
+        if not is_scipy_sparse(mat):
+            raise ValueError(
+                "Expected a scipy sparse matrix but got: " + str(type(mat))
+            )
+        unnamed_params = ["'./tmp/{file_name}'"]
+        named_params = {"rows": mat.shape[0], "cols": mat.shape[1]}
+        unnamed_params.extend(args)
+        named_params.update(kwargs)
+        return Matrix(self, "read", unnamed_params, named_params, local_data=mat)
+
     def from_pandas(
         self,
         df: pd.DataFrame,
@@ -0,0 +1,193 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+__all__ = ["SystemDSContextPool"]
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from queue import Queue
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List
+
+from systemds.context.systemds_context import SystemDSContext
+from systemds.utils.jvm_options import jvm_pool_resources
+
+
+class SystemDSContextPool(object):
+    """A pool of SystemDSContexts, each with its own JVM, to execute independent
+    scripts in parallel from a single Python process.
+
+    A single SystemDSContext funnels all executions through one gateway and JVM,
+    therefore independent pipelines serialize on it. The pool instead starts
+    a fixed number of JVMs and hands out idle contexts, either explicitly via
+    lease(), or implicitly via submit() and map() that run a function building
+    and computing a DAG on the next idle context.
+
+    Example:
+
+    # ```Python
+    # with SystemDSContextPool(4) as pool:
+    #     futures = [pool.submit(lambda sds, x: (sds.from_numpy(x) * 2).compute(), x) for x in xs]
+    #     results = [f.result() for f in futures]
+    # ```
+    """
+
+    _contexts: List[SystemDSContext]
+    _idle: Queue
+    _executor: ThreadPoolExecutor
+    _lock: Lock
+    _busy_time: List[float]
+    _num_tasks: List[int]
+    _start_time: float
+
+    def __init__(self, size: int = 2, **kwargs: Dict[str, Any]):
+        """Start a pool of SystemDSContexts, all JVMs are started concurrently.
+
+        :param size: The number of JVMs to start.
+        :param kwargs: Arguments passed to each SystemDSContext, e.g. capture_stdout or logging_level.
+            Unless jvm_memory or jvm_threads are given, the memory and cores are divided between the JVMs.
+        """
+        if size < 1:
+            raise ValueError("Invalid pool size, must be at least 1: " + str(size))
+        if "attach" in kwargs or "port" in kwargs:
+            raise ValueError("A pool starts its own JVMs, attach and port are invalid")
+
+        if kwargs.get("tune_jvm", True):
+            memory, threads = jvm_pool_resources(size)
+            kwargs = dict(kwargs)
+            if kwargs.get("jvm_memory") is None:
+                kwargs["jvm_memory"] = memory
+            if kwargs.get("jvm_threads") is None:
+                kwargs["jvm_threads"] = threads
+
+        self._log = logging.getLogger(self.__class__.__name__)
+        self._executor = ThreadPoolExecutor(
+            max_workers=size, thread_name_prefix="SystemDSContextPool"
+        )
+        starting = [
+            self._executor.submit(SystemDSContext, **kwargs) for _ in range(size)
+        ]
+        # wait for all JVMs, such that none is left running if another fails to start
+        self._contexts = []
+        error = None
+        for f in starting:
+            try:
+                self._contexts.append(f.result())
+            except Exception as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            for sds in self._contexts:
+                sds.close()
+            self._executor.shutdown()
+            raise RuntimeError("Failed to start SystemDSContextPool") from error
+
+        self._idle = Queue()
+        for idx in range(size):
+            self._idle.put(idx)
+        self._lock = Lock()
+        self._busy_time = [0.0] * size
+        self._num_tasks = [0] * size
+        self._start_time = perf_counter()
+        self._log.debug("Started SystemDSContextPool with " + str(size) + " JVMs")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return None
+
+    @property
+    def size(self) -> int:
+        return len(self._contexts)
+
+    @contextmanager
+    def lease(self, timeout: float = None):
+        """Lease an idle context of the pool for exclusive use inside a `with` statement.
+        The context is returned to the pool afterwards and must not be used after.
+
+        :param timeout: The maximum seconds to wait for an idle context, default None waits forever.
+        :return: a context object to be used in a `with` statement
+        """
+        idx = self._idle.get(timeout=timeout)
+        start = perf_counter()
+        try:
+            yield self._contexts[idx]
+        finally:
+            with self._lock:
+                self._busy_time[idx] += perf_counter() - start
+                self._num_tasks[idx] += 1
+            self._idle.put(idx)
+
+    def submit(
+        self, func: Callable[..., Any], *args: Iterable[Any], **kwargs: Dict[str, Any]
+    ) -> Future:
+        """Run a function on the next idle context of the pool.
+        The function gets the leased context as first argument, and should build
+        and compute its DAG on it.
+
+        :param func: the function to execute, called as func(sds, *args, **kwargs)
+        :return: A future containing the return value of the function
+        """
+
+        def run():
+            with self.lease() as sds:
+                return func(sds, *args, **kwargs)
+
+        return self._executor.submit(run)
+
+    def map(self, func: Callable[..., Any], *iterables: Iterable[Any]) -> List[Any]:
+        """Apply a function to every element of the given iterables in parallel
+        over all contexts of the pool, see submit().
+
+        :param func: the function to execute, called as func(sds, *elements)
+        :return: The results in order of the inputs
+        """
+        futures = [self.submit(func, *args) for args in zip(*iterables)]
+        return [f.result() for f in futures]
+
+    def utilization(self) -> List[Dict[str, Any]]:
+        """Get the utilization of each JVM of the pool since its start.
+
+        :return: A list containing per JVM the port, the number of executed tasks,
+            the seconds it was leased, and the fraction of time it was leased.
+        """
+        elapsed = perf_counter() - self._start_time
+        with self._lock:
+            return [
+                {
+                    "port": sds.get_port(),
+                    "tasks": self._num_tasks[idx],
+                    "busy_seconds": self._busy_time[idx],
+                    "utilization": self._busy_time[idx] / elapsed if elapsed else 0.0,
+                }
+                for idx, sds in enumerate(self._contexts)
+            ]
+
+    def close(self):
+        """Wait for all submitted tasks and close all contexts of the pool."""
+        self._executor.shutdown(wait=True)
+        for sds in self._contexts:
+            sds.close()
+        self._contexts = []
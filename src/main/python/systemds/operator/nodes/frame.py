@@ -31,6 +31,7 @@ from systemds.operator.operation_node import OperationNode
 from systemds.operator.nodes.multi_return import MultiReturn
 from systemds.operator.nodes.scalar import Scalar
 from systemds.operator.nodes.matrix import Matrix
+from systemds.script_building.script import DMLScript
 from systemds.utils.consts import VALID_INPUT_TYPES
 from systemds.utils.converters import frame_block_to_pandas, pandas_to_frame_block
 from systemds.utils.helpers import (
@@ -87,9 +88,11 @@ class Frame(OperationNode):
             self.is_python_local_data
         ), "Can only pass data to prepared script if it is python local!"
         if self._is_pandas():
-            prepared_script.setFrame(
-                var_name, pandas_to_frame_block(sds, self._pd_dataframe), True
-            )  # True for reuse
+            fb = sds._input_cache.get(
+                self._pd_dataframe,
+                lambda: pandas_to_frame_block(sds, self._pd_dataframe),
+            )
+            prepared_script.setFrame(var_name, fb, True)  # True for reuse
 
     def code_line(
         self,
@@ -109,10 +112,12 @@ class Frame(OperationNode):
         else:
             return super().compute(verbose, lineage)
 
-    def _parse_output_result_variables(self, result_variables):
+    def _parse_output_result_variables(
+        self, result_variables, script: DMLScript, options: Tuple
+    ):
         return frame_block_to_pandas(
             self.sds_context,
-            result_variables.getFrameBlock(self._script.out_var_name[0]),
+            result_variables.getFrameBlock(script.output_names(self)[0]),
         )
 
     def _is_pandas(self) -> bool:
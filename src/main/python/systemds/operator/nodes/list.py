@@ -85,9 +85,10 @@ class List(OperationNode):
             self.is_python_local_data
         ), "Can only pass data to prepared script if it is python local!"
         if self._is_numpy():
-            prepared_script.setMatrix(
-                var_name, numpy_to_matrix_block(sds, self._np_array), True
-            )  # True for reuse
+            mb = sds._input_cache.get(
+                self._np_array, lambda: numpy_to_matrix_block(sds, self._np_array)
+            )
+            prepared_script.setMatrix(var_name, mb, True)  # True for reuse
 
     def compute(self, verbose: bool = False, lineage: bool = False) -> np.array:
         return super().compute(verbose, lineage)
@@ -52,6 +52,10 @@ class ListAccess(OperationNode):
     ) -> str:
         return f"{var_name}={self._list_source._dml_name}[{self._key}];"
 
+    def _is_deterministic(self) -> bool:
+        # accessing an element, the list itself is checked as an input
+        return True
+
     def as_matrix(self) -> Matrix:
         ent = self._list_source[self._key]
         res = Matrix(self.sds_context, "as.matrix", [ent])
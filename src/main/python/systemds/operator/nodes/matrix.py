@@ -21,19 +21,26 @@
 
 __all__ = ["Matrix"]
 
-from typing import TYPE_CHECKING, Dict, Iterable, Sequence, Union
+from typing import TYPE_CHECKING, Dict, Iterable, Sequence, Tuple, Union
 
 import numpy as np
 from py4j.java_gateway import JavaObject
 from systemds.operator.operation_node import OperationNode
 from systemds.operator.nodes.multi_return import MultiReturn
 from systemds.operator.nodes.scalar import Scalar
+from systemds.script_building.script import DMLScript
 from systemds.utils.consts import (
     BINARY_OPERATIONS,
     VALID_ARITHMETIC_TYPES,
     VALID_INPUT_TYPES,
 )
-from systemds.utils.converters import matrix_block_to_numpy, numpy_to_matrix_block
+from systemds.utils.converters import (
+    is_scipy_sparse,
+    matrix_block_to_numpy,
+    matrix_block_to_scipy,
+    numpy_to_matrix_block,
+    scipy_to_matrix_block,
+)
 from systemds.utils.helpers import (
     check_is_empty_slice,
     check_no_less_than_zero,
@@ -84,10 +91,16 @@ class Matrix(OperationNode):
         assert (
             self.is_python_local_data
         ), "Can only pass data to prepared script if it is python local!"
-        if self._is_numpy():
-            prepared_script.setMatrix(
-                var_name, numpy_to_matrix_block(sds, self._np_array), True
-            )  # True for reuse
+        if is_scipy_sparse(self._np_array):
+            mb = sds._input_cache.get(
+                self._np_array, lambda: scipy_to_matrix_block(sds, self._np_array)
+            )
+            prepared_script.setMatrix(var_name, mb, True)  # True for reuse
+        elif self._is_numpy():
+            mb = sds._input_cache.get(
+                self._np_array, lambda: numpy_to_matrix_block(sds, self._np_array)
+            )
+            prepared_script.setMatrix(var_name, mb, True)  # True for reuse
 
     def code_line(
         self,
@@ -100,17 +113,51 @@ class Matrix(OperationNode):
             code_line = code_line.format(file_name=var_name)
         return code_line
 
-    def compute(self, verbose: bool = False, lineage: bool = False) -> np.array:
+    def compute(
+        self,
+        verbose: bool = False,
+        lineage: bool = False,
+        sparse: bool = False,
+        dtype=None,
+    ) -> np.array:
+        """Compute the matrix.
+
+        :param verbose: Print the generated script and the output of the execution
+        :param lineage: Also return the lineage trace of the result
+        :param sparse: Return a scipy CSR matrix instead of a numpy array, sparse results are
+            transferred without converting them to dense
+        :param dtype: The dtype of the returned numpy array, float64 by default. float32, int32
+            and uint8 results are returned directly, without transferring float64 values
+        :return: The numpy array, or scipy CSR matrix, of the result
+        """
         if self._is_numpy():
             self.sds_context._log.info("Numpy Array - No Compilation necessary")
+            if sparse and not is_scipy_sparse(self._np_array):
+                from scipy.sparse import csr_matrix
+
+                return csr_matrix(self._np_array, dtype=dtype)
+            elif dtype is not None:
+                return self._np_array.astype(dtype, copy=False)
             return self._np_array
         else:
-            return super().compute(verbose, lineage)
-
-    def _parse_output_result_variables(self, result_variables):
+            return self._compute(verbose, lineage, self._result_options(sparse, dtype))
+
+    def _result_options(self, sparse: bool = False, dtype=None) -> Tuple:
+        return sparse, None if dtype is None else np.dtype(dtype).str
+
+    def _parse_output_result_variables(
+        self, result_variables, script: DMLScript, options: Tuple
+    ):
+        sparse, dtype = options
+        mb = result_variables.getMatrixBlock(script.output_names(self)[0])
+        if sparse:
+            ret = matrix_block_to_scipy(self.sds_context.java_gateway.jvm, mb)
+            return ret if dtype is None else ret.astype(dtype)
         return matrix_block_to_numpy(
             self.sds_context.java_gateway.jvm,
-            result_variables.getMatrixBlock(self._script.out_var_name[0]),
+            mb,
+            self.sds_context._shared_memory_transfer,
+            dtype,
         )
 
     def _is_numpy(self) -> bool:
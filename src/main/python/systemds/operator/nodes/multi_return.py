@@ -26,6 +26,7 @@ from typing import Dict, Iterable, List, Sequence, Tuple, Union
 import numpy as np
 from py4j.java_gateway import JavaObject
 from systemds.operator import OperationNode
+from systemds.script_building.script import DMLScript
 from systemds.utils.consts import VALID_INPUT_TYPES
 from systemds.utils.converters import frame_block_to_pandas, matrix_block_to_numpy
 from systemds.utils.helpers import create_params_string
@@ -74,18 +75,26 @@ class MultiReturn(OperationNode):
 
         return f"{output}={self.operation}({inputs_comma_sep});"
 
-    def _parse_output_result_variables(self, result_variables):
+    def _parse_output_result_variables(
+        self, result_variables, script: DMLScript, options: Tuple
+    ):
         result_var = []
         jvmV = self.sds_context.java_gateway.jvm
-        for idx, v in enumerate(self._script.out_var_name):
+        for idx, v in enumerate(script.output_names(self)):
             output = self._outputs[idx]
             if str(output) == "MatrixNode":
                 result_var.append(
-                    matrix_block_to_numpy(jvmV, result_variables.getMatrixBlock(v))
+                    matrix_block_to_numpy(
+                        jvmV,
+                        result_variables.getMatrixBlock(v),
+                        self.sds_context._shared_memory_transfer,
+                    )
                 )
             elif str(output) == "FrameNode":
                 result_var.append(
-                    frame_block_to_pandas(jvmV, result_variables.getFrameBlock(v))
+                    frame_block_to_pandas(
+                        self.sds_context, result_variables.getFrameBlock(v)
+                    )
                 )
             elif str(output) == "ScalarNode":
                 result_var.append(result_variables.getDouble(v))
@@ -27,6 +27,7 @@ from typing import TYPE_CHECKING, Dict, Iterable, Optional, Sequence, Tuple, Uni
 import numpy as np
 from py4j.java_gateway import JavaObject, JVMView
 from systemds.operator.operation_node import OperationNode
+from systemds.script_building.script import DMLScript
 from systemds.utils.consts import (
     BINARY_OPERATIONS,
     VALID_ARITHMETIC_TYPES,
@@ -82,8 +83,13 @@ class Scalar(OperationNode):
     def compute(self, verbose: bool = False, lineage: bool = False):
         return super().compute(verbose, lineage)
 
-    def _parse_output_result_variables(self, result_variables):
-        scalar_object = result_variables.getScalarObject(self._script.out_var_name[0])
+    def _is_deterministic(self) -> bool:
+        return self.__assign or super()._is_deterministic()
+
+    def _parse_output_result_variables(
+        self, result_variables, script: DMLScript, options: Tuple
+    ):
+        scalar_object = result_variables.getScalarObject(script.output_names(self)[0])
         value_type = scalar_object.getValueType().toString()
         if value_type in ["FP64", "FP32"]:
             return scalar_object.getDoubleValue()
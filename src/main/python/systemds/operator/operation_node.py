@@ -19,19 +19,25 @@
 #
 # -------------------------------------------------------------
 
+import asyncio
+from concurrent.futures import Future
 from multiprocessing import Process
+from threading import Lock
 from typing import TYPE_CHECKING, Dict, Iterable, Optional, Sequence, Tuple, Union
 
 import numpy as np
 from py4j.java_gateway import JavaObject, JVMView
 from systemds.script_building.dag import DAGNode
-from systemds.script_building.script import DMLScript
+from systemds.script_building.script import DMLScript, dag_nodes
 from systemds.utils.consts import (
     BINARY_OPERATIONS,
+    DETERMINISTIC_OPERATIONS,
+    SEEDED_OPERATIONS,
     VALID_ARITHMETIC_TYPES,
     VALID_INPUT_TYPES,
 )
 from systemds.utils.helpers import create_params_string
+from systemds.utils.input_cache import input_key, input_key_scope, input_size
 
 if TYPE_CHECKING:
     # to avoid cyclic dependencies during runtime
@@ -48,6 +54,7 @@ class OperationNode(DAGNode):
     _source_node: Optional["DAGNode"]
     _brackets: bool
     _datatype_is_unknown: bool
+    _async_lock: Lock
 
     def __init__(
         self,
@@ -88,29 +95,63 @@ class OperationNode(DAGNode):
         self.dml_name = ""
         self._datatype_is_unknown = is_datatype_unknown
         self._datatype_is_none = is_datatype_none
+        self._async_lock = Lock()
 
     def compute(
         self, verbose: bool = False, lineage: bool = False
     ) -> Union[float, np.array, Tuple[Union[float, np.array], str]]:
+        return self._compute(verbose, lineage, self._result_options())
 
-        if self._result_var is None or self._lineage_trace is None:
-            self._script = DMLScript(self.sds_context)
-            self._script.build_code(self)
+    def _compute(self, verbose: bool, lineage: bool, options: Tuple):
+        """Compute the node, parsing the result with the given result options.
+        The script and options are passed along instead of stored on the node,
+        such that computations of shared nodes can run concurrently.
+        """
+        # each input is hashed once, for the result key and the input cache
+        with input_key_scope():
+            return self.__compute(verbose, lineage, options)
+
+    def __compute(self, verbose: bool, lineage: bool, options: Tuple):
+        result_cache = self.sds_context._result_cache
+        key = None
+        if not lineage and not self._datatype_is_none and result_cache.enabled:
+            key = self._result_key(options)
+            if key is not None:
+                found, result = result_cache.get(self, key)
+                if found:
+                    self.sds_context._log.debug("Result cache hit, no execution")
+                    return result
+
+        if lineage and self._result_var is not None and self._lineage_trace is not None:
+            result = self._result_var
+        else:
+            script = DMLScript(self.sds_context)
+            with self.sds_context._compute_lock:
+                # the names of the nodes are only used while building the script,
+                # therefore shared nodes can be built by other computations afterwards
+                script.build_code(self)
+                script.clear(self)
+            self._script = script
             if verbose:
                 print("SCRIPT:")
-                print(self._script.dml_script)
+                print(script.dml_script)
 
             if lineage:
-                result_variables, self._lineage_trace = (
-                    self._script.execute_with_lineage()
-                )
+                result_variables, self._lineage_trace = script.execute_with_lineage()
             else:
-                result_variables = self._script.execute()
+                result_variables = script.execute()
 
-            self.sds_context._execution_completed(self._script)
+            self.sds_context._execution_completed(script)
 
+            result = None
             if result_variables is not None:
-                self._result_var = self._parse_output_result_variables(result_variables)
+                result = self._parse_output_result_variables(
+                    result_variables, script, options
+                )
+            if lineage:
+                self._result_var = result
+            elif key is not None:
+                result_cache.put(self, key, result)
 
         if verbose:
             for x in self.sds_context.get_stdout():
@@ -118,13 +159,83 @@ class OperationNode(DAGNode):
             for y in self.sds_context.get_stderr():
                 print(y)
 
-        self._script.clear(self)
         if lineage:
-            return self._result_var, self._lineage_trace
+            return result, self._lineage_trace
         else:
-            return self._result_var
+            return result
+
+    def compute_async(self, *args, **kwargs) -> Future:
+        """Compute the node in a background thread of the context, such that Python code
+        continues to run while the script is executed, e.g. preparing the next batch of data.
+        Computations of different nodes run concurrently, while computations of the same
+        node run one after another.
+
+        :param args: The arguments of compute
+        :param kwargs: The keyword arguments of compute
+        :return: A future of the result of compute
+        """
+        return self.sds_context._submit(self.__compute_exclusive, *args, **kwargs)
 
-    def _parse_output_result_variables(self, result_variables):
+    async def acompute(self, *args, **kwargs):
+        """Awaitable variant of compute_async, for use in asyncio coroutines.
+
+        :param args: The arguments of compute
+        :param kwargs: The keyword arguments of compute
+        :return: The result of compute
+        """
+        return await asyncio.wrap_future(self.compute_async(*args, **kwargs))
+
+    def __compute_exclusive(self, *args, **kwargs):
+        with self._async_lock:
+            return self.compute(*args, **kwargs)
+
+    def _result_key(self, options: Optional[Tuple] = None) -> Optional[Tuple]:
+        """Get the key a computed result is cached with, consisting of the content
+        of all Python local inputs of the DAG and the compute options.
+        Only DAGs of deterministic operations are cached, results of DAGs reading files,
+        calling sourced functions or builtins, or using randomness without a seed, are not.
+        Neither are results of DAGs with inputs larger than the result cache budget.
+
+        :param options: The result options of the compute call, the defaults if None
+        :return: the key, or None if the result can not be cached
+        """
+        max_bytes = self.sds_context._result_cache.max_bytes
+        inputs = []
+        for node in dag_nodes(self):
+            if node.is_python_local_data:
+                data = getattr(node, "_np_array", None)
+                if data is None:
+                    data = getattr(node, "_pd_dataframe", None)
+                # inputs larger than the budget are not hashed on every computation
+                if data is None or input_size(data) > max_bytes:
+                    return None
+                key = input_key(data)
+                if key is None:
+                    return None
+                inputs.append(key[:2])
+                continue
+            # sourced DML functions can change with their source file
+            if node._source_node is not None or not node._is_deterministic():
+                return None
+        if options is None:
+            options = self._result_options()
+        return tuple(inputs), options
+
+    def _is_deterministic(self) -> bool:
+        """Get if the operation of this node computes the same result for the same inputs."""
+        seed_name = SEEDED_OPERATIONS.get(self.operation)
+        if seed_name is not None:
+            seed = self.named_input_nodes.get(seed_name, -1)
+            return not isinstance(seed, DAGNode) and seed not in (-1, "-1")
+        return self.operation in DETERMINISTIC_OPERATIONS
+
+    def _result_options(self) -> Tuple:
+        """The default options of compute that change the result, e.g. its dtype."""
+        return ()
+
+    def _parse_output_result_variables(
+        self, result_variables, script: DMLScript, options: Tuple
+    ):
         if self._datatype_is_none:
             return None
         else:
@@ -137,7 +248,9 @@ class OperationNode(DAGNode):
         """
         if self._lineage_trace is None:
             self._script = DMLScript(self.sds_context)
-            self._script.build_code(self)
+            with self.sds_context._compute_lock:
+                self._script.build_code(self)
+                self._script.clear(self)
             self._lineage_trace = self._script.get_lineage()
 
         return self._lineage_trace
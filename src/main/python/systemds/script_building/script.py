@@ -27,6 +27,7 @@ from typing import (
     KeysView,
     List,
     Optional,
+    Sequence,
     Tuple,
     Union,
 )
@@ -36,7 +37,7 @@ from py4j.java_collections import JavaArray
 from py4j.java_gateway import JavaGateway, JavaObject
 
 from systemds.script_building.dag import DAGNode
-from systemds.utils.consts import VALID_INPUT_TYPES
+from systemds.utils.consts import PURE_OPERATIONS, VALID_INPUT_TYPES
 
 if TYPE_CHECKING:
     # to avoid cyclic dependencies during runtime
@@ -49,26 +50,36 @@ class DMLScript:
     """
 
     sds_context: "SystemDSContext"
-    dml_script: str
+    _code: List[str]
     inputs: Dict[str, DAGNode]
     prepared_script: Optional[Any]
     out_var_name: List[str]
+    _outputs: Dict[int, List[str]]
     _variable_counter: int
+    _expressions: Dict[Tuple, str]
 
     def __init__(self, context: "SystemDSContext") -> None:
         self.sds_context = context
-        self.dml_script = ""
+        self._code = []
         self.inputs = {}
         self.prepared_script = None
+        self.statistics = None
         self.out_var_name = []
+        self._outputs = {}
         self._variable_counter = 0
+        self._expressions = {}
+
+    @property
+    def dml_script(self) -> str:
+        """The DML code of the script, joined from its code lines."""
+        return "".join(self._code)
 
     def add_code(self, code: str) -> None:
         """Add a dml code line to our script
 
         :param code: the dml code line
         """
-        self.dml_script += code + "\n"
+        self._code.append(code + "\n")
 
     def add_input_from_python(self, var_name: str, input_var: DAGNode) -> None:
         """Add an input for our preparedScript. Should only be executed for data that is python local.
@@ -88,8 +99,14 @@ class DMLScript:
         # sent to the entry_point, but this is safer
 
         try:
+            key = self._cache_key()
+            if self.prepared_script is None:
+                self.prepared_script = self.sds_context._script_cache.take(key)
             self.__prepare_script()
             ret = self.prepared_script.executeScript()
+            # read the statistics before other computations can take the script from the cache
+            self.__read_statistics()
+            self.sds_context._script_cache.put(key, self.prepared_script)
             return ret
         except Py4JNetworkError:
             exception_str = "Py4JNetworkError: no connection to JVM, most likely due to previous crash or closed JVM from calls to close()"
@@ -108,9 +125,10 @@ class DMLScript:
         # we could use the gateway directly, non defined functions will be automatically
         # sent to the entry_point, but this is safer
         try:
-            connection = self.__prepare_script()
-            connection.setLineage(True)
+            self.__prepare_script()
+            self.sds_context._enable_lineage()
             ret = self.prepared_script.executeScript()
+            self.__read_statistics()
 
             if len(self.out_var_name) == 1:
                 return ret, self.prepared_script.getLineageTrace(self.out_var_name[0])
@@ -128,12 +146,15 @@ class DMLScript:
             trace_back_limit = None
         self.sds_context.exception_and_close(exception_str, trace_back_limit)
 
+    def __read_statistics(self):
+        if self.sds_context._capture_statistics:
+            self.statistics = self.prepared_script.statistics()
+
     def __prepare_script(self):
         gateway = self.sds_context.java_gateway
-        entry_point = gateway.entry_point
         if self.prepared_script is None:
             input_names = self.inputs.keys()
-            connection = entry_point.getConnection()
+            connection = self.sds_context._connection
             self.prepared_script = connection.prepareScript(
                 self.dml_script,
                 _list_to_java_array(gateway, input_names),
@@ -143,14 +164,39 @@ class DMLScript:
                 input_node.pass_python_data_to_prepared_script(
                     self.sds_context, name, self.prepared_script
                 )
-            return connection
+        else:
+            # a cached prepared script, only the inputs are bound again
+            for name, input_node in self.inputs.items():
+                input_node.pass_python_data_to_prepared_script(
+                    self.sds_context, name, self.prepared_script
+                )
+
+    def _cache_key(self) -> Tuple:
+        """Get the key of the prepared script in the script cache of the context.
+        Frames are compiled with their schema, therefore the schema of pandas inputs
+        is part of the key, while matrix inputs are identified by their dimensions
+        in the DML code.
+
+        :return: the key of the DML code, inputs and outputs of this script
+        """
+        schemas = tuple(
+            tuple(map(str, node._pd_dataframe.dtypes))
+            for node in self.inputs.values()
+            if getattr(node, "_pd_dataframe", None) is not None
+        )
+        return (
+            self.dml_script,
+            tuple(self.inputs.keys()),
+            tuple(self.out_var_name),
+            schemas,
+            self.sds_context._capture_statistics,
+        )
 
     def get_lineage(self) -> str:
         gateway = self.sds_context.java_gateway
-        entry_point = gateway.entry_point
         if self.prepared_script is None:
             input_names = self.inputs.keys()
-            connection = entry_point.getConnection()
+            connection = self.sds_context._connection
             self.prepared_script = connection.prepareScript(
                 self.dml_script,
                 _list_to_java_array(gateway, input_names),
@@ -158,10 +204,10 @@ class DMLScript:
             )
             for name, input_node in self.inputs.items():
                 input_node.pass_python_data_to_prepared_script(
-                    gateway.jvm, name, self.prepared_script
+                    self.sds_context, name, self.prepared_script
                 )
 
-            connection.setLineage(True)
+            self.sds_context._enable_lineage()
 
         self.prepared_script.executeScript()
         if len(self.out_var_name) == 1:
@@ -177,77 +223,111 @@ class DMLScript:
 
         :param dag_root: the topmost operation of our DAG, result of operation will be output
         """
-        baseOutVarString = self._dfs_dag_nodes(dag_root)
-        if not dag_root._datatype_is_none:
+        self.build_code_multiple([dag_root])
+
+    def build_code_multiple(self, dag_roots: Sequence[DAGNode]) -> None:
+        """Builds the code of several DAGs into one script, such that nodes shared
+        between the DAGs are only computed once.
+
+        :param dag_roots: the topmost operations of the DAGs, results of the operations will be outputs
+        """
+        for dag_root in dag_roots:
+            baseOutVarString = self._dfs_dag_nodes(dag_root)
+            if dag_root._datatype_is_none:
+                self._outputs[id(dag_root)] = []
+                continue
             if str(dag_root) == "MultiReturnNode":
-                self.out_var_name = []
-                for idx, output_node in enumerate(dag_root._outputs):
-                    self.add_code(f"write({baseOutVarString}_{idx}, './tmp_{idx}');")
-                    self.out_var_name.append(f"{baseOutVarString}_{idx}")
+                names = [
+                    f"{baseOutVarString}_{idx}" for idx in range(len(dag_root._outputs))
+                ]
             else:
-                self.out_var_name.append(baseOutVarString)
-                self.add_code(f"write({baseOutVarString}, './tmp');")
+                names = [baseOutVarString]
+            self._outputs[id(dag_root)] = names
+            # outputs are bound by the connection, therefore no write statements
+            # are added, and roots computing the same value share their output
+            for name in names:
+                if name not in self.out_var_name:
+                    self.out_var_name.append(name)
+
+    def output_names(self, dag_root: DAGNode) -> List[str]:
+        """Get the names of the output variables of a DAG built into this script.
+
+        :param dag_root: the topmost operation of the DAG
+        :return: the output variable names, in the order of the outputs of the operation
+        """
+        return self._outputs[id(dag_root)]
 
     def clear(self, dag_root: DAGNode):
         self._dfs_clear_dag_nodes(dag_root)
         self._variable_counter = 0
+        self._expressions = {}
 
     def _dfs_dag_nodes(self, dag_node: VALID_INPUT_TYPES) -> str:
-        """Uses Depth-First-Search to create code from DAG
+        """Uses Depth-First-Search to create code from DAG. The search is iterative,
+        such that long chains of operations do not exceed the recursion limit, and
+        every node is only expanded once, since it is named when its code is added.
 
         :param dag_node: current DAG node
         :return: the variable name the current DAG node operation created
         """
         if not isinstance(dag_node, DAGNode):
-            if isinstance(dag_node, bool):
-                return "TRUE" if dag_node else "FALSE"
-            return str(dag_node)
-
-        # If the node already have a name then it is already defined
-        # in the script, therefore reuse.
-        if dag_node.dml_name != "":
-            return dag_node.dml_name
-
-        if dag_node._source_node is not None:
-            self._dfs_dag_nodes(dag_node._source_node)
-        # for each node do the dfs operation and save the variable names in `input_var_names`
-        # get variable names of unnamed parameters
-
-        unnamed_input_vars = []
-        for un_node in dag_node.unnamed_input_nodes:
-            unnamed_input_vars.append(self._dfs_dag_nodes(un_node))
-
-        named_input_vars = {}
-        for name, input_node in dag_node.named_input_nodes.items():
-            named_input_vars[name] = self._dfs_dag_nodes(input_node)
-
-        # check if the node gets a name after multireturns
-        # If it has, great, return that name
-        if dag_node.dml_name != "":
-            return dag_node.dml_name
-
-        dag_node.dml_name = self._next_unique_var()
-
-        if dag_node.is_python_local_data:
-            self.add_input_from_python(dag_node.dml_name, dag_node)
+            return _literal(dag_node)
+
+        # the stack holds (node, expanded), a node is expanded before its inputs
+        # and its code is added once all inputs are defined in the script.
+        stack = [(dag_node, False)]
+        while stack:
+            node, expanded = stack.pop()
+            # If the node already have a name then it is already defined
+            # in the script, therefore reuse.
+            if node.dml_name != "":
+                continue
+            if not expanded:
+                stack.append((node, True))
+                # push the inputs in reverse, such that they are defined in order
+                inputs = _dag_inputs(node)
+                for input_node in reversed(inputs):
+                    if input_node.dml_name == "":
+                        stack.append((input_node, False))
+                continue
+
+            unnamed_input_vars = [_var_name(n) for n in node.unnamed_input_nodes]
+            named_input_vars = {
+                name: _var_name(n) for name, n in node.named_input_nodes.items()
+            }
+
+            # structurally identical pure nodes reuse the variable of the first one
+            key = _expression_key(node, unnamed_input_vars, named_input_vars)
+            if key is not None:
+                if key in self._expressions:
+                    node.dml_name = self._expressions[key]
+                    continue
+                self._expressions[key] = node.dml_name = self._next_unique_var()
+            else:
+                node.dml_name = self._next_unique_var()
 
-        code_line = dag_node.code_line(
-            dag_node.dml_name, unnamed_input_vars, named_input_vars
-        )
+            if node.is_python_local_data:
+                self.add_input_from_python(node.dml_name, node)
 
-        self.add_code(code_line)
+            code_line = node.code_line(
+                node.dml_name, unnamed_input_vars, named_input_vars
+            )
+            self.add_code(code_line)
         return dag_node.dml_name
 
-    def _dfs_clear_dag_nodes(self, dag_node: VALID_INPUT_TYPES) -> str:
+    def _dfs_clear_dag_nodes(self, dag_node: VALID_INPUT_TYPES) -> None:
+        """Reset the variable names of all nodes of the DAG, visiting every node once."""
         if not isinstance(dag_node, DAGNode):
             return
-        dag_node.dml_name = ""
-        for n in dag_node.unnamed_input_nodes:
-            self._dfs_clear_dag_nodes(n)
-        for name, n in dag_node.named_input_nodes.items():
-            self._dfs_clear_dag_nodes(n)
-        if dag_node._source_node is not None:
-            self._dfs_clear_dag_nodes(dag_node._source_node)
+        visited = {id(dag_node)}
+        stack = [dag_node]
+        while stack:
+            node = stack.pop()
+            node.dml_name = ""
+            for input_node in _dag_inputs(node):
+                if id(input_node) not in visited:
+                    visited.add(id(input_node))
+                    stack.append(input_node)
 
     def _next_unique_var(self) -> str:
         """Gets the next unique variable name
@@ -260,6 +340,79 @@ class DMLScript:
 
 
 # Helper Functions
+def _literal(value: VALID_INPUT_TYPES) -> str:
+    """Convert a python value to its DML literal."""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    return str(value)
+
+
+def _var_name(value: VALID_INPUT_TYPES) -> str:
+    """Get the DML variable name of a defined node, or the literal of a python value."""
+    if isinstance(value, DAGNode):
+        return value.dml_name
+    return _literal(value)
+
+
+def _expression_key(
+    dag_node: DAGNode, unnamed_input_vars: List[str], named_input_vars: Dict[str, str]
+) -> Optional[Tuple]:
+    """Get the key identifying the value of a node by its operation and inputs, used to
+    eliminate common subexpressions. Nodes with python local data, side effects or
+    nondeterministic results, e.g. rand or sourced functions, have no key.
+
+    :return: the key of the node or None if the node is not deduplicated
+    """
+    operation = getattr(dag_node, "operation", None)
+    brackets = getattr(dag_node, "_brackets", False)
+    if (
+        dag_node.is_python_local_data
+        or dag_node._datatype_is_none
+        or dag_node._source_node is not None
+        or not (brackets or operation in PURE_OPERATIONS)
+    ):
+        return None
+    return (
+        type(dag_node),
+        operation,
+        brackets,
+        tuple(unnamed_input_vars),
+        tuple(named_input_vars.items()),
+    )
+
+
+def dag_nodes(dag_root: DAGNode) -> List[DAGNode]:
+    """Get all nodes of the DAG, each once, in the order they are found.
+
+    :param dag_root: the topmost operation of the DAG
+    :return: the nodes of the DAG
+    """
+    ret = []
+    visited = {id(dag_root)}
+    stack = [dag_root]
+    while stack:
+        node = stack.pop()
+        ret.append(node)
+        for input_node in _dag_inputs(node):
+            if id(input_node) not in visited:
+                visited.add(id(input_node))
+                stack.append(input_node)
+    return ret
+
+
+def _dag_inputs(dag_node: DAGNode) -> List[DAGNode]:
+    """Get the nodes the given node depends on, the source node first, then the
+    unnamed and named inputs in order."""
+    inputs = []
+    if dag_node._source_node is not None:
+        inputs.append(dag_node._source_node)
+    inputs.extend(n for n in dag_node.unnamed_input_nodes if isinstance(n, DAGNode))
+    inputs.extend(
+        n for n in dag_node.named_input_nodes.values() if isinstance(n, DAGNode)
+    )
+    return inputs
+
+
 def _list_to_java_array(
     gateway: JavaGateway, py_list: Union[Collection[str], KeysView[str]]
 ) -> JavaArray:
@@ -24,3 +24,49 @@ MODULE_NAME = "systemds"
 VALID_INPUT_TYPES = Union["DAGNode", str, int, float, bool]
 BINARY_OPERATIONS = ["+", "-", "/", "//", "*", "<", "<=", ">", ">=", "==", "!=", "%*%"]
 VALID_ARITHMETIC_TYPES = Union["DAGNode", int, float]
+# Deterministic operations without side effects, structurally identical nodes of these
+# operations compute the same value and are therefore only added once to a script.
+PURE_OPERATIONS = frozenset(
+    BINARY_OPERATIONS
+    + ["abs", "acos", "asin", "atan", "ceil", "cos", "cosh", "exp", "floor", "log"]
+    + ["round", "sign", "sin", "sinh", "sqrt", "tan", "tanh", "isInf", "isNA", "isNaN"]
+    + ["sum", "mean", "median", "max", "min", "prod", "var", "sd", "moment", "quantile"]
+    + ["rowSums", "rowMeans", "rowMaxs", "rowMins", "rowProds", "rowVars"]
+    + ["colSums", "colMeans", "colMaxs", "colMins", "colProds", "colVars"]
+    + ["rowIndexMax", "rowIndexMin", "cummax", "cummin", "cumprod", "cumsum"]
+    + ["cumsumprod", "countDistinct", "rowCountDistinct", "colCountDistinct"]
+    + ["nrow", "ncol", "t", "rev", "diag", "trace", "inv", "cholesky", "cbind", "rbind"]
+    + ["matrix", "table", "unique", "toOneHot", "as.scalar", "as.matrix", "as.frame"]
+)
+# Operations computing the same result for the same inputs, results of DAGs are only
+# cached if all their operations are listed here or are seeded operations with a seed.
+# Indexing and the outputs of multi-return functions have an empty operation.
+DETERMINISTIC_OPERATIONS = PURE_OPERATIONS | frozenset(
+    ["", "list", "as.integer", "as.logical", "toString", "seq", "order", "roll"]
+    + ["removeEmpty", "replace", "lower.tri", "upper.tri", "transformapply"]
+    + ["transformencode", "eigen", "svd", "qr", "lu", "fft", "ifft"]
+)
+# Operations with their seed parameter, these are only deterministic with a given seed,
+# if the seed is omitted or -1 a random seed is used. Builtins that use randomness
+# the seed does not control, e.g. decisionTree or ffTrain with shuffling, are not listed.
+SEEDED_OPERATIONS = {
+    "rand": "seed",
+    "sample": "seed",
+    "adasyn": "seed",
+    "als": "seed",
+    "alsCG": "seed",
+    "alsDS": "seed",
+    "gmm": "seed",
+    "imputeByKNN": "seed",
+    "kmeans": "seed",
+    "pageRank": "seed",
+    "split": "seed",
+    "tSNE": "seed",
+}
+# Prefix of the line the JVM prints on standard out once the python gateway is ready,
+# followed by "<port>:<jvm uptime in ms>", see PythonDMLScript.
+HANDSHAKE_PREFIX = "SystemDS Python gateway ready on port:"
+
+# number of threads executing computations started with compute_async
+DEFAULT_ASYNC_WORKERS = 4
+ASYNC_THREAD_PREFIX = "systemds-compute"
@@ -19,13 +19,74 @@
 #
 # -------------------------------------------------------------
 
-import struct
+import os
+import sys
+import tempfile
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
 import concurrent.futures
 from py4j.java_gateway import JavaClass, JavaGateway, JavaObject, JVMView
 
+# Arrays of at least this many bytes are exchanged with the JVM through a memory mapped
+# file instead of the Py4J socket, smaller arrays are faster to send directly.
+SHARED_MEMORY_THRESHOLD = 1024 * 1024
+
+# Arrays larger than this many bytes are sent over the Py4J socket in blocks of rows,
+# which avoids the 2GB limit of Java arrays and allows to send blocks in parallel.
+TRANSFER_CHUNK_SIZE = 64 * 1024 * 1024
+
+# The number of parallel Py4J connections used to send blocks of rows.
+TRANSFER_THREADS = min(4, os.cpu_count() or 1)
+
+# The row blocks are aligned with the default block size of SystemDS.
+BLOCK_SIZE = 1000
+
+# The maximum number of bytes of a Java array, frames are sent in groups of columns below it.
+MAX_ARRAY_SIZE = 2**31 - 16
+
+
+def shared_memory_file() -> str:
+    """Create a new empty file to exchange data with the JVM. The file is placed in
+    shared memory (/dev/shm) if available, otherwise in the temporary directory.
+    The caller is responsible to remove the file.
+
+    :return: The path of the file.
+    """
+    directory = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+    fd, path = tempfile.mkstemp(prefix="systemds_", suffix=".bin", dir=directory)
+    os.close(fd)
+    return path
+
+
+def remove_shared_memory_file(path: str):
+    """Remove a file used to exchange data with the JVM.
+    On some platforms the file can not be removed while the JVM still maps it,
+    in this case it is left to the temporary directory cleanup.
+
+    :param path: The path of the file.
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def row_blocks(rows: int, cols: int, item_size: int):
+    """Split rows into ranges of at most TRANSFER_CHUNK_SIZE bytes. The ranges are aligned
+    to BLOCK_SIZE rows, unless a single block of rows is already larger.
+
+    :param rows: The number of rows.
+    :param cols: The number of columns.
+    :param item_size: The number of bytes per value.
+    :return: A list of (first row inclusive, last row exclusive) tuples.
+    """
+    block_rows = max(1, TRANSFER_CHUNK_SIZE // max(1, cols * item_size))
+    if block_rows >= BLOCK_SIZE:
+        block_rows -= block_rows % BLOCK_SIZE
+    return [(rl, min(rows, rl + block_rows)) for rl in range(0, rows, block_rows)]
+
 
 def numpy_to_matrix_block(sds, np_arr: np.array):
     """Converts a given numpy array, to internal matrix block representation.
@@ -43,70 +104,397 @@ def numpy_to_matrix_block(sds, np_arr: np.array):
 
     jvm: JVMView = sds.java_gateway.jvm
 
-    # flatten and prepare byte buffer.
+    # select the value type, other types are converted to float64.
     if np_arr.dtype is np.dtype(np.uint8):
-        arr = np_arr.ravel()
+        dtype = np.uint8
         value_type = jvm.org.apache.sysds.common.Types.ValueType.UINT8
     elif np_arr.dtype is np.dtype(np.int32):
-        arr = np_arr.ravel()
+        dtype = np.int32
         value_type = jvm.org.apache.sysds.common.Types.ValueType.INT32
     elif np_arr.dtype is np.dtype(np.float32):
-        arr = np_arr.ravel()
+        dtype = np.float32
         value_type = jvm.org.apache.sysds.common.Types.ValueType.FP32
     else:
-        arr = np_arr.ravel().astype(np.float64)
+        dtype = np.float64
         value_type = jvm.org.apache.sysds.common.Types.ValueType.FP64
-    buf = bytearray(arr.tobytes())
+    np_arr = np_arr.reshape((rows, cols))
+    nbytes = rows * cols * np.dtype(dtype).itemsize
 
     # Send data to java.
     try:
         j_class: JavaClass = jvm.org.apache.sysds.runtime.util.Py4jConverterUtils
+        if nbytes >= SHARED_MEMORY_THRESHOLD and sds._shared_memory_transfer:
+            # Write the values once into shared memory the JVM maps and reads directly.
+            path = shared_memory_file()
+            try:
+                with open(path, "wb") as f:
+                    for rl, ru in row_blocks(rows, cols, np.dtype(dtype).itemsize):
+                        np.ascontiguousarray(np_arr[rl:ru], dtype=dtype).tofile(f)
+                return j_class.convertMMapToMB(path, rows, cols, value_type)
+            finally:
+                remove_shared_memory_file(path)
+        elif nbytes > TRANSFER_CHUNK_SIZE:
+            mb = j_class.allocateDenseOrSparse(rows, cols, False)
+
+            def send(block):
+                rl, ru = block
+                buf = bytearray(
+                    np.ascontiguousarray(np_arr[rl:ru], dtype=dtype).tobytes()
+                )
+                j_class.setRowBlock(mb, buf, rl, ru, value_type)
+
+            with concurrent.futures.ThreadPoolExecutor(TRANSFER_THREADS) as executor:
+                list(
+                    executor.map(send, row_blocks(rows, cols, np.dtype(dtype).itemsize))
+                )
+            return j_class.completeDenseMB(mb)
+        buf = bytearray(np.ascontiguousarray(np_arr, dtype=dtype).tobytes())
         return j_class.convertPy4JArrayToMB(buf, rows, cols, value_type)
     except Exception as e:
         sds.exception_and_close(e)
 
 
-def matrix_block_to_numpy(jvm: JVMView, mb: JavaObject):
-    """Converts a MatrixBlock object in the JVM to a numpy array.
+def is_scipy_sparse(obj) -> bool:
+    """Check if the given object is a scipy sparse matrix or array,
+    without importing scipy if it was not used before.
+
+    :param obj: The object to check.
+    """
+    sparse = sys.modules.get("scipy.sparse")
+    return sparse is not None and sparse.issparse(obj)
+
+
+def scipy_to_matrix_block(sds, sp_mat):
+    """Converts a given scipy sparse matrix in any format (e.g., COO, CSR, CSC),
+    to a sparse matrix block, without converting it to dense.
+
+    :param sds: The current systemds context.
+    :param sp_mat: the scipy sparse matrix to convert to matrixblock.
+    """
+    # canonical format without duplicates and with sorted indexes
+    coo = sp_mat.tocsr().tocoo()
+    rows, cols = coo.shape
+    data = bytearray(np.ascontiguousarray(coo.data, dtype=np.float64).tobytes())
+    row = bytearray(np.ascontiguousarray(coo.row, dtype=np.int32).tobytes())
+    col = bytearray(np.ascontiguousarray(coo.col, dtype=np.int32).tobytes())
+    try:
+        j_class: JavaClass = (
+            sds.java_gateway.jvm.org.apache.sysds.runtime.util.Py4jConverterUtils
+        )
+        return j_class.convertSciPyCOOToMB(data, row, col, rows, cols, coo.nnz)
+    except Exception as e:
+        sds.exception_and_close(e)
+
+
+def matrix_block_to_scipy(jvm: JVMView, mb: JavaObject):
+    """Converts a MatrixBlock object in the JVM to a scipy CSR matrix.
+    Sparse blocks are transferred without converting them to dense.
 
     :param jvm: The current JVM instance running systemds.
     :param mb: A pointer to the JVM's MatrixBlock object.
     """
+    from scipy.sparse import csr_matrix
+
     num_ros = mb.getNumRows()
     num_cols = mb.getNumColumns()
-    buf = jvm.org.apache.sysds.runtime.util.Py4jConverterUtils.convertMBtoPy4JDenseArr(
-        mb
+    buf = jvm.org.apache.sysds.runtime.util.Py4jConverterUtils.convertMBToPy4JCSR(mb)
+    indptr = np.frombuffer(buf, dtype=np.int32, count=num_ros + 1)
+    nnz = int(indptr[-1])
+    offset = (num_ros + 1) * 4
+    indices = np.frombuffer(buf, dtype=np.int32, count=nnz, offset=offset)
+    data = np.frombuffer(buf, dtype=np.float64, count=nnz, offset=offset + nnz * 4)
+    return csr_matrix((data, indices, indptr), shape=(num_ros, num_cols))
+
+
+# The numpy dtypes the JVM can return directly, other dtypes are converted from float64.
+RESULT_VALUE_TYPES = {
+    np.dtype(np.float64): "FP64",
+    np.dtype(np.float32): "FP32",
+    np.dtype(np.int32): "INT32",
+    np.dtype(np.uint8): "UINT8",
+}
+
+
+def matrix_block_to_numpy(
+    jvm: JVMView, mb: JavaObject, shared_memory: bool = False, dtype=None
+):
+    """Converts a MatrixBlock object in the JVM to a numpy array.
+
+    Large blocks are written by the JVM into a memory mapped file if shared_memory is enabled,
+    the values are read from this file into the returned array instead of copying them over Py4J.
+
+    :param jvm: The current JVM instance running systemds.
+    :param mb: A pointer to the JVM's MatrixBlock object.
+    :param shared_memory: If the JVM shares the file system and memory mapped files can be used.
+    :param dtype: The dtype of the returned array, float64 by default. float32, int32 and uint8
+        are returned directly by the JVM, reducing the memory and transfer size.
+    """
+    dtype = np.dtype(np.float64 if dtype is None else dtype)
+    transfer_dtype = dtype if dtype in RESULT_VALUE_TYPES else np.dtype(np.float64)
+    value_type = jvm.org.apache.sysds.common.Types.ValueType.valueOf(
+        RESULT_VALUE_TYPES[transfer_dtype]
     )
-    return np.frombuffer(buf, count=num_ros * num_cols, dtype=np.float64).reshape(
+    ret = _matrix_block_to_numpy(jvm, mb, shared_memory, transfer_dtype, value_type)
+    return ret if transfer_dtype == dtype else ret.astype(dtype)
+
+
+def _matrix_block_to_numpy(jvm, mb, shared_memory, dtype, value_type):
+    num_ros = mb.getNumRows()
+    num_cols = mb.getNumColumns()
+    j_class: JavaClass = jvm.org.apache.sysds.runtime.util.Py4jConverterUtils
+    nbytes = num_ros * num_cols * dtype.itemsize
+    if shared_memory and nbytes >= SHARED_MEMORY_THRESHOLD:
+        path = shared_memory_file()
+        try:
+            j_class.convertMBToMMap(mb, path, value_type)
+            # Read into a regular array, such that the file is not mapped anymore
+            # and can be removed on all platforms.
+            count = num_ros * num_cols
+            return np.fromfile(path, dtype=dtype, count=count).reshape(
+                (num_ros, num_cols)
+            )
+        finally:
+            remove_shared_memory_file(path)
+    elif nbytes > TRANSFER_CHUNK_SIZE:
+        # Fetch blocks of rows in parallel, each block is a separate Java array.
+        mb = (
+            jvm.org.apache.sysds.runtime.compress.CompressedMatrixBlock.getUncompressed(
+                mb
+            )
+        )
+        ret = np.empty((num_ros, num_cols), dtype=dtype)
+
+        def fetch(block):
+            rl, ru = block
+            buf = j_class.convertMBtoPy4JDenseArr(mb, rl, ru, value_type)
+            ret[rl:ru] = np.frombuffer(buf, dtype=dtype).reshape((ru - rl, num_cols))
+
+        with concurrent.futures.ThreadPoolExecutor(TRANSFER_THREADS) as executor:
+            list(executor.map(fetch, row_blocks(num_ros, num_cols, dtype.itemsize)))
+        return ret
+    buf = j_class.convertMBtoPy4JDenseArr(mb, value_type)
+    return np.frombuffer(buf, count=num_ros * num_cols, dtype=dtype).reshape(
         (num_ros, num_cols)
     )
 
 
-def convert_column(jvm, rows, j, col_type, pd_col, fb, col_name):
-    """Converts a given pandas column to a FrameBlock representation.
+def encode_strings(pd_col: pd.Series) -> bytearray:
+    """Encodes a column of strings in a single buffer, containing the byte lengths of
+    all strings as little endian int32 values (-1 for missing values), followed by the
+    concatenated UTF-8 bytes of all strings.
 
-    :param jvm: The JVMView of the current SystemDS context.
-    :param rows: The number of rows in the pandas DataFrame.
-    :param j: The current column index.
-    :param col_type: The ValueType of the column.
-    :param pd_col: The pandas column to convert.
+    :param pd_col: The pandas column to encode, values are converted to str.
+    :return: The encoded column.
     """
-    if col_type == jvm.org.apache.sysds.common.Types.ValueType.STRING:
-        byte_data = bytearray()
-        for value in pd_col.astype(str):
-            encoded_value = value.encode("utf-8")
-            byte_data.extend(struct.pack(">I", len(encoded_value)))
-            byte_data.extend(encoded_value)
+    mask = pd_col.isna().to_numpy()
+    values = pd_col.astype(str).to_numpy(dtype=object)
+    values[mask] = ""
+    joined = "".join(values)
+    data = joined.encode("utf-8")
+    if len(data) == len(joined):
+        # only ascii characters, the byte lengths are the string lengths
+        lengths = np.fromiter(map(len, values), dtype="<i4", count=len(values))
     else:
-        col_data = pd_col.fillna("").to_numpy()
-        byte_data = bytearray(col_data.tobytes())
+        lengths = np.fromiter(
+            (len(v.encode("utf-8")) for v in values), dtype="<i4", count=len(values)
+        )
+    lengths[mask] = -1
+    return bytearray(lengths.tobytes()) + data
+
+
+def decode_strings(buf: bytes, num_rows: int) -> np.ndarray:
+    """Decodes a column of strings encoded by encode_strings, or by the JVM.
 
-    converted_array = jvm.org.apache.sysds.runtime.util.Py4jConverterUtils.convert(
-        byte_data, rows, col_type
+    :param buf: The encoded column.
+    :param num_rows: The number of strings.
+    :return: An object array of the strings, with None for missing values.
+    """
+    lengths = np.frombuffer(buf, dtype="<i4", count=num_rows)
+    ends = np.cumsum(np.maximum(lengths, 0), dtype=np.int64) + num_rows * 4
+    starts = ends - np.maximum(lengths, 0)
+    data = memoryview(buf)
+    ret = np.empty(num_rows, dtype=object)
+    ret[:] = [bytes(data[s:e]).decode("utf-8") for s, e in zip(starts, ends)]
+    ret[lengths < 0] = None
+    return ret
+
+
+def encode_column(pd_col: pd.Series, value_type: str) -> bytes:
+    """Encodes a pandas column in the format the JVM converts it from.
+
+    :param pd_col: The pandas column to encode.
+    :param value_type: The name of the SystemDS ValueType of the column.
+    :return: The encoded column.
+    """
+    if value_type == "STRING":
+        return encode_strings(pd_col)
+    elif value_type == "BOOLEAN":
+        return np.packbits(pd_col.to_numpy(dtype=bool), bitorder="little").tobytes()
+    elif pd.api.types.is_datetime64_any_dtype(pd_col.dtype):
+        # timestamps as int64 nanoseconds since the epoch (UTC)
+        return pd_col.to_numpy(dtype="datetime64[ns]").view(np.int64).tobytes()
+    else:
+        return np.ascontiguousarray(pd_col.to_numpy()).tobytes()
+
+
+def pack_columns(columns):
+    """Packs encoded columns into a single buffer with the offsets of the columns.
+
+    :param columns: The encoded columns.
+    :return: A tuple of the packed columns and the little endian int32 offsets,
+        which include the end offset of the last column.
+    """
+    offsets = np.zeros(len(columns) + 1, dtype="<i4")
+    np.cumsum([len(c) for c in columns], out=offsets[1:])
+    return bytearray().join(columns), bytearray(offsets.tobytes())
+
+
+@lru_cache(maxsize=1)
+def arrow_available() -> bool:
+    """Check if pyarrow is installed, which enables the Arrow exchange of frames."""
+    try:
+        import pyarrow  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+def arrow_compatible_type(t):
+    """Get the type a pyarrow column is sent to the JVM as.
+
+    :param t: The pyarrow DataType of the column.
+    :return: The supported pyarrow DataType.
+    """
+    import pyarrow as pa
+
+    supported = [pa.int32(), pa.int64(), pa.float32(), pa.float64(), pa.bool_()]
+    supported += [pa.string(), pa.large_string()]
+    if t in supported:
+        return t
+    elif t in [pa.int8(), pa.int16(), pa.uint8(), pa.uint16()]:
+        return pa.int32()
+    elif t in [pa.uint32(), pa.uint64()]:
+        return pa.int64()
+    elif t == pa.float16():
+        return pa.float32()
+    elif pa.types.is_timestamp(t) or pa.types.is_duration(t):
+        # sent as int64 nanoseconds since the epoch
+        return pa.int64()
+    elif pa.types.is_dictionary(t):
+        # categoricals keep their codes, only the dictionary values are converted
+        return pa.dictionary(t.index_type, arrow_compatible_type(t.value_type))
+    else:
+        return pa.string()
+
+
+def arrow_compatible(table):
+    """Cast the columns of a pyarrow Table to the types supported by the JVM.
+    Small integers are widened, timestamps are sent as int64 epoch nanoseconds,
+    categoricals stay dictionary encoded, and other types are sent as strings.
+
+    :param table: The pyarrow Table.
+    :return: The pyarrow Table with supported column types.
+    """
+    import pyarrow as pa
+
+    for i, field in enumerate(table.schema):
+        t = field.type
+        target = arrow_compatible_type(t)
+        if target == t:
+            continue
+        col = table.column(i)
+        if pa.types.is_timestamp(t):
+            col = col.cast(pa.timestamp("ns", tz=t.tz))
+        elif pa.types.is_duration(t):
+            col = col.cast(pa.duration("ns"))
+        table = table.set_column(i, field.name, col.cast(target))
+    return table
+
+
+def arrow_to_pandas(table) -> pd.DataFrame:
+    """Convert a pyarrow Table returned by the JVM to a pandas DataFrame.
+    Integer and boolean columns with missing values are returned as the nullable
+    pandas dtypes, instead of float64 and object columns.
+
+    :param table: The pyarrow Table.
+    :return: The pandas DataFrame.
+    """
+    import pyarrow as pa
+
+    nullable = {
+        pa.int32(): pd.Int32Dtype(),
+        pa.int64(): pd.Int64Dtype(),
+        pa.bool_(): pd.BooleanDtype(),
+    }
+    df = table.to_pandas()
+    for i, field in enumerate(table.schema):
+        if field.type in nullable and table.column(i).null_count > 0:
+            col = table.select([i]).to_pandas(types_mapper=nullable.get)
+            df.isetitem(i, col.iloc[:, 0])
+    return df
+
+
+def pandas_to_frame_block_arrow(sds, pd_df: pd.DataFrame):
+    """Converts a given pandas DataFrame to a FrameBlock, by sending it to the JVM
+    as a single Arrow IPC stream. Missing values are preserved.
+
+    :param sds: The current SystemDS context.
+    :param pd_df: The pandas DataFrame to convert to FrameBlock.
+    :return: The FrameBlock, or None if the DataFrame can not be represented in Arrow.
+    """
+    import pyarrow as pa
+
+    try:
+        table = pa.Table.from_pandas(pd_df, preserve_index=False)
+        table = arrow_compatible(table).combine_chunks()
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # e.g., object columns with mixed types
+        return None
+    # Arrow requires string column names
+    table = table.rename_columns([str(c) for c in pd_df.columns])
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    buf = sink.getvalue()
+
+    j_class: JavaClass = (
+        sds.java_gateway.jvm.org.apache.sysds.runtime.util.Py4jArrowUtils
     )
+    if buf.size >= SHARED_MEMORY_THRESHOLD and sds._shared_memory_transfer:
+        path = shared_memory_file()
+        try:
+            with open(path, "wb") as f:
+                f.write(buf)
+            return j_class.convertArrowFileToFrameBlock(path)
+        finally:
+            remove_shared_memory_file(path)
+    return j_class.convertArrowToFrameBlock(buf.to_pybytes())
+
 
-    fb.setColumnName(j, str(col_name))
-    fb.setColumn(j, converted_array)
+def frame_block_to_pandas_arrow(sds, fb: JavaObject) -> pd.DataFrame:
+    """Converts a FrameBlock object in the JVM to a pandas dataframe,
+    by receiving it as a single Arrow IPC stream.
+
+    :param sds: The current systemds context.
+    :param fb: A pointer to the JVM's FrameBlock object.
+    """
+    import pyarrow as pa
+
+    j_class: JavaClass = (
+        sds.java_gateway.jvm.org.apache.sysds.runtime.util.Py4jArrowUtils
+    )
+    size = fb.getNumRows() * fb.getNumColumns() * 8
+    if size >= SHARED_MEMORY_THRESHOLD and sds._shared_memory_transfer:
+        path = shared_memory_file()
+        try:
+            j_class.convertFrameBlockToArrowFile(fb, path)
+            with pa.memory_map(path) as source:
+                return arrow_to_pandas(pa.ipc.open_stream(source).read_all())
+        finally:
+            remove_shared_memory_file(path)
+    buf = j_class.convertFrameBlockToArrow(fb)
+    return arrow_to_pandas(pa.ipc.open_stream(buf).read_all())
 
 
 def pandas_to_frame_block(sds, pd_df: pd.DataFrame):
@@ -124,15 +512,14 @@ def pandas_to_frame_block(sds, pd_df: pd.DataFrame):
 
     # pandas type mapping to systemds Valuetypes
     data_type_mapping = {
-        np.dtype(np.object_): jvm.org.apache.sysds.common.Types.ValueType.STRING,
-        np.dtype(np.int64): jvm.org.apache.sysds.common.Types.ValueType.INT64,
-        np.dtype(np.float64): jvm.org.apache.sysds.common.Types.ValueType.FP64,
-        np.dtype(np.bool_): jvm.org.apache.sysds.common.Types.ValueType.BOOLEAN,
-        np.dtype("<M8[ns]"): jvm.org.apache.sysds.common.Types.ValueType.STRING,
-        np.dtype(np.int32): jvm.org.apache.sysds.common.Types.ValueType.INT32,
-        np.dtype(np.float32): jvm.org.apache.sysds.common.Types.ValueType.FP32,
-        np.dtype(np.uint8): jvm.org.apache.sysds.common.Types.ValueType.UINT8,
-        np.dtype(np.str_): jvm.org.apache.sysds.common.Types.ValueType.CHARACTER,
+        np.dtype(np.object_): "STRING",
+        np.dtype(np.int64): "INT64",
+        np.dtype(np.float64): "FP64",
+        np.dtype(np.bool_): "BOOLEAN",
+        np.dtype(np.int32): "INT32",
+        np.dtype(np.float32): "FP32",
+        np.dtype(np.uint8): "UINT8",
+        np.dtype(np.str_): "CHARACTER",
     }
     schema = []
     col_names = []
@@ -141,39 +528,56 @@ def pandas_to_frame_block(sds, pd_df: pd.DataFrame):
         col_names.append(col_name)
         if dtype in data_type_mapping.keys():
             schema.append(data_type_mapping[dtype])
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            schema.append("INT64")
         else:
-            schema.append(jvm.org.apache.sysds.common.Types.ValueType.STRING)
+            schema.append("STRING")
     try:
+        if sds._arrow_transfer and arrow_available():
+            fb = pandas_to_frame_block_arrow(sds, pd_df)
+            if fb is not None:
+                return fb
+
         jc_ValueType = jvm.org.apache.sysds.common.Types.ValueType
         jc_String = jvm.java.lang.String
         jc_FrameBlock = jvm.org.apache.sysds.runtime.frame.data.FrameBlock
-        j_valueTypeArray = java_gate.new_array(jc_ValueType, len(schema))
 
         # execution speed increases with optimized code when the number of rows exceeds 4
-        if rows > 4:
-            for i in range(len(schema)):
-                j_valueTypeArray[i] = schema[i]
-
-            fb = jc_FrameBlock(j_valueTypeArray, rows)
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                executor.map(
-                    lambda j, col_name: convert_column(
-                        jvm, rows, j, schema[j], pd_df[col_name], fb, col_name
-                    ),
-                    range(len(col_names)),
-                    col_names,
-                )
-
+        if rows > 4 and cols > 0:
+            j_class: JavaClass = jvm.org.apache.sysds.runtime.util.Py4jConverterUtils
+            columns = [encode_column(pd_df.iloc[:, j], schema[j]) for j in range(cols)]
+            # all columns are sent in a single call, unless they exceed a Java array
+            groups = [[]]
+            size = 0
+            for j, column in enumerate(columns):
+                if groups[-1] and size + len(column) > MAX_ARRAY_SIZE:
+                    groups.append([])
+                    size = 0
+                groups[-1].append(j)
+                size += len(column)
+
+            fb = None
+            for group in groups:
+                data, offsets = pack_columns([columns[j] for j in group])
+                names = encode_strings(pd.Series([str(col_names[j]) for j in group]))
+                types = ",".join(schema[j] for j in group)
+                part = j_class.convertFrameBlock(data, offsets, rows, types, names)
+                fb = part if fb is None else fb.append(part, True)
             return fb
         else:
             j_dataArray = java_gate.new_array(jc_String, rows, cols)
             j_colNameArray = java_gate.new_array(jc_String, len(col_names))
 
+            j_valueTypeArray = java_gate.new_array(jc_ValueType, len(schema))
             for j, col_name in enumerate(col_names):
-                j_valueTypeArray[j] = schema[j]
+                j_valueTypeArray[j] = getattr(jc_ValueType, schema[j])
                 j_colNameArray[j] = str(col_names[j])
-                col_data = pd_df[col_name].fillna("").to_numpy(dtype=str)
+                pd_col = pd_df[col_name]
+                if pd.api.types.is_datetime64_any_dtype(pd_col.dtype):
+                    pd_col = pd.Series(
+                        pd_col.to_numpy(dtype="datetime64[ns]").view(np.int64)
+                    )
+                col_data = pd_col.fillna("").to_numpy(dtype=str)
 
                 for i in range(col_data.shape[0]):
                     if col_data[i]:
@@ -193,44 +597,78 @@ def frame_block_to_pandas(sds, fb: JavaObject):
     :param fb: A pointer to the JVM's FrameBlock object.
     """
 
+    if sds._arrow_transfer and arrow_available():
+        return frame_block_to_pandas_arrow(sds, fb)
+
     num_rows = fb.getNumRows()
     num_cols = fb.getNumColumns()
-    df = pd.DataFrame()
-
-    for c_index in range(num_cols):
-        col_array = fb.getColumn(c_index)
-
-        d_type = col_array.getValueType().toString()
-        if d_type == "STRING":
-            ret = []
-            for row in range(num_rows):
-                ent = col_array.getIndexAsBytes(row)
-                if ent:
-                    ent = ent.decode()
-                    ret.append(ent)
-                else:
-                    ret.append(None)
-        elif d_type == "INT32":
-            byteArray = fb.getColumn(c_index).getAsByteArray()
-            ret = np.frombuffer(byteArray, dtype=np.int32)
-        elif d_type == "INT64":
-            byteArray = fb.getColumn(c_index).getAsByteArray()
-            ret = np.frombuffer(byteArray, dtype=np.int64)
-        elif d_type == "FP64":
-            byteArray = fb.getColumn(c_index).getAsByteArray()
-            ret = np.frombuffer(byteArray, dtype=np.float64)
-        elif d_type == "BOOLEAN":
-            # TODO maybe it is more efficient to bit pack the booleans.
-            # https://stackoverflow.com/questions/5602155/numpy-boolean-array-with-1-bit-entries
-            byteArray = fb.getColumn(c_index).getAsByteArray()
-            ret = np.frombuffer(byteArray, dtype=np.dtype("?"))
-        elif d_type == "CHARACTER":
-            byteArray = fb.getColumn(c_index).getAsByteArray()
-            ret = np.frombuffer(byteArray, dtype=np.char)
+    j_class: JavaClass = (
+        sds.java_gateway.jvm.org.apache.sysds.runtime.util.Py4jConverterUtils
+    )
+
+    # all columns are returned in a single call, through a file for large frames
+    if (
+        sds._shared_memory_transfer
+        and num_rows * num_cols * 8 >= SHARED_MEMORY_THRESHOLD
+    ):
+        path = shared_memory_file()
+        try:
+            j_class.convertFrameBlockToFile(fb, path)
+            with open(path, "rb") as f:
+                buf = f.read()
+        finally:
+            remove_shared_memory_file(path)
+    else:
+        buf = j_class.convertFrameBlockToPy4J(fb)
+    return decode_frame(buf, num_rows)
+
+
+def decode_frame(buf: bytes, num_rows: int) -> pd.DataFrame:
+    """Decodes the columns of a FrameBlock encoded by the JVM into a pandas DataFrame.
+    String columns are decoded in parallel.
+
+    :param buf: The encoded FrameBlock.
+    :param num_rows: The number of rows.
+    :return: The pandas DataFrame.
+    """
+    view = memoryview(buf)
+    num_cols, meta_len = np.frombuffer(buf, dtype="<i4", count=2)
+    meta = decode_strings(view[8 : 8 + meta_len], 2 * num_cols)
+    types, names = meta[:num_cols], meta[num_cols:]
+    start = 8 + meta_len + 8 * (num_cols + 1)
+    offsets = np.frombuffer(buf, dtype="<i8", count=num_cols + 1, offset=8 + meta_len)
+    offsets = offsets + start
+
+    numeric_types = {"FP64": "<f8", "FP32": "<f4", "INT64": "<i8", "INT32": "<i4"}
+    columns = [None] * num_cols
+    strings = []
+    for j in range(num_cols):
+        s, e = offsets[j], offsets[j + 1]
+        if types[j] in numeric_types:
+            columns[j] = np.frombuffer(
+                buf, dtype=numeric_types[types[j]], count=num_rows, offset=s
+            )
+        elif types[j] == "BOOLEAN":
+            bits = np.frombuffer(view[s:e], dtype=np.uint8)
+            columns[j] = np.unpackbits(bits, count=num_rows, bitorder="little").astype(
+                bool
+            )
         else:
-            raise NotImplementedError(
-                f"Not Implemented {d_type} for systemds to pandas parsing"
+            strings.append(j)
+
+    if len(strings) > 1:
+        with concurrent.futures.ThreadPoolExecutor(TRANSFER_THREADS) as executor:
+            decoded = executor.map(
+                lambda j: decode_strings(view[offsets[j] : offsets[j + 1]], num_rows),
+                strings,
             )
-        df[fb.getColumnName(c_index)] = ret
+            for j, col in zip(strings, decoded):
+                columns[j] = col
+    else:
+        for j in strings:
+            columns[j] = decode_strings(view[offsets[j] : offsets[j + 1]], num_rows)
 
+    # the DataFrame is built once, positional keys keep duplicate column names
+    df = pd.DataFrame(dict(enumerate(columns)), index=pd.RangeIndex(num_rows))
+    df.columns = list(names)
     return df
@@ -0,0 +1,230 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import concurrent.futures
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from py4j.java_gateway import JavaObject
+
+DEFAULT_INPUT_CACHE_BYTES = 1024 * 1024 * 1024
+
+# Buffers are hashed in chunks of this many bytes on multiple threads.
+HASH_CHUNK_SIZE = 64 * 1024 * 1024
+HASH_THREADS = 4
+
+# The keys of inputs memoized per thread within an input_key_scope.
+_scope = threading.local()
+
+
+def hash_buffers(*buffers) -> bytes:
+    """Hash the content of buffers. Large buffers are hashed in chunks in parallel,
+    hashlib releases the GIL while hashing.
+
+    :param buffers: Objects supporting the buffer protocol, e.g. contiguous numpy arrays.
+    :return: The digest of all buffers.
+    """
+    chunks = []
+    for buf in buffers:
+        view = memoryview(buf).cast("B")
+        chunks.extend(
+            view[i : i + HASH_CHUNK_SIZE]
+            for i in range(0, max(len(view), 1), HASH_CHUNK_SIZE)
+        )
+    if len(chunks) > 1:
+        with concurrent.futures.ThreadPoolExecutor(HASH_THREADS) as executor:
+            digests = list(executor.map(lambda c: hashlib.sha256(c).digest(), chunks))
+    else:
+        digests = [hashlib.sha256(c).digest() for c in chunks]
+    return hashlib.sha256(b"".join(digests)).digest()
+
+
+def input_size(data) -> int:
+    """Get the size in bytes of Python local input data, without reading its content.
+
+    :param data: A numpy array, scipy sparse matrix or pandas DataFrame.
+    :return: The size in bytes.
+    """
+    if isinstance(data, np.ndarray):
+        return data.nbytes
+    elif isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(index=False, deep=True).sum())
+    else:
+        # scipy sparse matrix
+        csr = data.tocsr()
+        return csr.data.nbytes + csr.indices.nbytes + csr.indptr.nbytes
+
+
+@contextmanager
+def input_key_scope():
+    """Memoize the keys of input data on the current thread within the scope, such that
+    a computation hashes each input only once, for its result key and the input cache.
+    The data must not be modified within the scope.
+    """
+    if getattr(_scope, "keys", None) is not None:
+        yield
+        return
+    _scope.keys = {}
+    try:
+        yield
+    finally:
+        _scope.keys = None
+
+
+def input_key(data) -> Optional[Tuple[str, bytes, int]]:
+    """Get the content key of Python local input data, and its size in bytes.
+    Equal data gets the same key, independent of the object holding it, and
+    modifying the data changes the key.
+
+    :param data: A numpy array, scipy sparse matrix or pandas DataFrame.
+    :return: A tuple of the kind of data, the content hash and the size in bytes,
+        or None if the data cannot be hashed.
+    """
+    keys = getattr(_scope, "keys", None)
+    if keys is None:
+        return _hash_input(data)
+    entry = keys.get(id(data))
+    if entry is None or entry[0] is not data:
+        # the data is kept in the entry, such that its id is not reused within the scope
+        entry = (data, _hash_input(data))
+        keys[id(data)] = entry
+    return entry[1]
+
+
+def _hash_input(data) -> Optional[Tuple[str, bytes, int]]:
+    if isinstance(data, np.ndarray):
+        if data.dtype.hasobject:
+            return None
+        arr = np.ascontiguousarray(data)
+        meta = f"{arr.shape}{arr.dtype.str}".encode()
+        return "matrix", hash_buffers(meta, arr), arr.nbytes
+    elif isinstance(data, pd.DataFrame):
+        meta = f"{list(data.columns)}{list(data.dtypes)}{data.shape}".encode()
+        rows = pd.util.hash_pandas_object(data, index=False).to_numpy()
+        return "frame", hash_buffers(meta, rows), input_size(data)
+    else:
+        # scipy sparse matrix
+        csr = data.tocsr()
+        parts = [csr.data, csr.indices, csr.indptr]
+        meta = f"{csr.shape}{csr.dtype.str}".encode()
+        size = sum(p.nbytes for p in parts)
+        return "sparse", hash_buffers(meta, *parts), size
+
+
+class InputCache(object):
+    """A cache of the JVM objects of Python local inputs, e.g. the MatrixBlocks of numpy arrays.
+
+    Holding the Py4J reference of a JVM object keeps it alive in the JVM, therefore repeated
+    computations over the same input data skip the transfer to the JVM. Entries are keyed by
+    the content of the data, and the least recently used entries are evicted when the total
+    size exceeds the budget.
+    """
+
+    _entries: "OrderedDict[Tuple[str, bytes], Tuple[JavaObject, int]]"
+    _bytes: int
+
+    def __init__(self, max_bytes: int = DEFAULT_INPUT_CACHE_BYTES):
+        """Create a new input cache.
+
+        :param max_bytes: The maximum size of the cached inputs in bytes, 0 disables the cache.
+        """
+        if max_bytes < 0:
+            raise ValueError("Input cache size must be positive or 0 to disable it")
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
+        self._lock = Lock()
+
+    def get(self, data, create: Callable[[], JavaObject]) -> JavaObject:
+        """Get the JVM object of the data, creating and caching it if it is not cached.
+
+        :param data: The numpy array, scipy sparse matrix or pandas DataFrame.
+        :param create: Function transferring the data to the JVM, returning the JVM object.
+        :return: The JVM object of the data.
+        """
+        if self._max_bytes == 0:
+            return create()
+        # data larger than the budget is never cached, therefore it is not hashed
+        if input_size(data) > self._max_bytes:
+            return create()
+        key = input_key(data)
+        if key is None:
+            return create()
+        kind, digest, size = key
+        key = (kind, digest)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+        j_obj = create()
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (j_obj, size)
+                self._bytes += size
+                while self._bytes > self._max_bytes:
+                    self.__evict()
+        return j_obj
+
+    def __evict(self):
+        _, (_, size) = self._entries.popitem(last=False)
+        self._bytes -= size
+        self._evicted += 1
+
+    def clear(self):
+        """Remove all entries, releasing the JVM objects."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def statistics(self) -> Dict[str, int]:
+        """Get the statistics of the cache.
+
+        :return: A dict of the number of hits, misses and evicted entries, and the
+            number and size in bytes of the cached entries.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evicted": self._evicted,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of the cached inputs."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,176 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import hashlib
+import os
+import shutil
+import tempfile
+from typing import List, Optional, Tuple
+
+# The fraction of the available memory used as maximum JVM heap, the remainder
+# is left to the python process, which holds the local numpy and pandas data.
+JVM_HEAP_FRACTION = 0.6
+# Below these limits the serial garbage collector has the lowest overhead.
+SMALL_JVM_MEMORY = 2 * 1024 * 1024 * 1024
+SMALL_JVM_CORES = 2
+# Seconds to wait for a JVM to exit while it dumps the class data sharing archive.
+CDS_DUMP_TIMEOUT = 30
+
+
+def available_memory() -> Optional[int]:
+    """Get the memory in bytes available to processes started from here,
+    respecting cgroup (container) limits.
+
+    :return: The available memory or None if it can not be determined.
+    """
+    limits = []
+    try:
+        limits.append(os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES"))
+    except (AttributeError, ValueError, OSError):
+        pass
+    for path in [
+        "/sys/fs/cgroup/memory.max",
+        "/sys/fs/cgroup/memory/memory.limit_in_bytes",
+    ]:
+        limit = _read_cgroup_value(path)
+        if limit is not None:
+            limits.append(limit)
+    return min(limits) if limits else None
+
+
+def available_cores() -> int:
+    """Get the number of cores available to processes started from here,
+    respecting cpu affinity and cgroup (container) quotas.
+
+    :return: The number of available cores, at least 1.
+    """
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cores = min(cores, max(1, int(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return max(1, cores)
+
+
+def _read_cgroup_value(path: str) -> Optional[int]:
+    try:
+        with open(path) as f:
+            value = f.read().strip()
+    except OSError:
+        return None
+    # cgroup v1 reports unlimited as a very large number, v2 as max
+    if value == "max" or not value.isdigit() or int(value) >= 1 << 60:
+        return None
+    return int(value)
+
+
+def jvm_tuning_options(memory: str = None, threads: int = None) -> List[str]:
+    """Get the JVM options sizing heap, garbage collector and parallelism
+    to the available memory and cores.
+
+    :param memory: The maximum heap size e.g. "4g", default derived from the available memory.
+    :param threads: The number of cores the JVM should use, default all available cores.
+    :return: The list of JVM options
+    """
+    options = []
+    mem_bytes = available_memory()
+    if memory is not None:
+        options.append("-Xmx" + memory)
+    elif mem_bytes is not None:
+        options.append("-Xmx" + _heap_size(mem_bytes))
+
+    cores = available_cores()
+    if threads is not None:
+        cores = threads
+        # SystemDS derives its degree of parallelism from the processors of the JVM.
+        options.append("-XX:ActiveProcessorCount=" + str(threads))
+
+    if cores <= SMALL_JVM_CORES or (
+        mem_bytes is not None and mem_bytes < SMALL_JVM_MEMORY
+    ):
+        options.append("-XX:+UseSerialGC")
+    else:
+        options.append("-XX:+UseParallelGC")
+        options.append("-XX:ParallelGCThreads=" + str(cores))
+    return options
+
+
+def jvm_pool_resources(size: int) -> Tuple[Optional[str], int]:
+    """Get the heap size and cores of each JVM in a pool of the given size, such that
+    all JVMs of the pool together use the memory and cores of a single tuned JVM.
+
+    :param size: The number of JVMs in the pool.
+    :return: The maximum heap e.g. "2048m", or None if the memory is unknown, and the number of cores.
+    """
+    mem_bytes = available_memory()
+    memory = None if mem_bytes is None else _heap_size(mem_bytes // size)
+    return memory, max(1, available_cores() // size)
+
+
+def _heap_size(mem_bytes: int) -> str:
+    heap_mb = max(256, int(mem_bytes * JVM_HEAP_FRACTION) // (1024 * 1024))
+    return str(heap_mb) + "m"
+
+
+def cds_archive_path(classpath: str) -> Optional[str]:
+    """Get the path of the class data sharing archive for the given classpath.
+    The archive name is derived from the java executable and the classpath files,
+    such that a new archive is created after updates of either.
+
+    :param classpath: The classpath the JVM is started with.
+    :return: The path of the archive or None if java or the classpath is not found.
+    """
+    java = shutil.which("java")
+    if java is None:
+        return None
+    key = hashlib.sha1(os.path.realpath(java).encode())
+    for path in classpath.split(os.pathsep):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key.update(f"{os.path.realpath(path)}:{stat.st_size}:{stat.st_mtime}".encode())
+    directory = os.path.join(tempfile.gettempdir(), "systemds")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, "SystemDS-" + key.hexdigest()[:16] + ".jsa")
+
+
+def cds_options(archive: str, dump_file: str = None) -> List[str]:
+    """Get the JVM options to use a class data sharing archive, or to dump one
+    when the JVM exits if the archive does not exist yet.
+    Unrecognized options are ignored to stay compatible with JVMs without AppCDS support.
+
+    :param archive: The path of the archive to use.
+    :param dump_file: The path to dump the archive to if it does not exist, if None no archive is dumped.
+    :return: The list of JVM options
+    """
+    options = ["-XX:+IgnoreUnrecognizedVMOptions", "-Xshare:auto"]
+    if os.path.exists(archive):
+        options.append("-XX:SharedArchiveFile=" + archive)
+    elif dump_file is not None:
+        options.append("-XX:ArchiveClassesAtExit=" + dump_file)
+    return options
@@ -0,0 +1,139 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+from collections import deque
+from threading import Lock
+from typing import List
+
+DEFAULT_MAX_LINES = 10000
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+class OutputBuffer(object):
+    """A bounded buffer for the lines printed by the JVM.
+
+    The buffer keeps the most recent lines, limited both in number of lines and in bytes.
+    When a limit is exceeded the oldest lines are evicted, and if a spill file is given the
+    evicted lines are appended to it instead of being dropped.
+    Appending, taking from the front and reading the tail are all constant time per line.
+    """
+
+    _lines: deque
+    _sizes: deque
+    _bytes: int
+    _evicted: int
+    _spill_file: str
+
+    def __init__(
+        self,
+        max_lines: int = DEFAULT_MAX_LINES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        spill_file: str = None,
+    ):
+        """Create a new output buffer.
+
+        :param max_lines: The maximum number of lines kept in memory, -1 for unlimited.
+        :param max_bytes: The maximum number of bytes kept in memory, -1 for unlimited.
+        :param spill_file: Optional path of a file evicted lines are appended to.
+        """
+        if max_lines == 0 or max_bytes == 0:
+            raise ValueError(
+                "Output buffer limits must be positive or -1 for unlimited"
+            )
+        self._max_lines = max_lines
+        self._max_bytes = max_bytes
+        self._lines = deque()
+        self._sizes = deque()
+        self._bytes = 0
+        self._evicted = 0
+        self._spill_file = spill_file
+        self._spill = None
+        self._lock = Lock()
+
+    def append(self, line: str, size: int = None):
+        """Append a line, evicting the oldest lines if the buffer is full.
+
+        :param line: The line to append.
+        :param size: The size of the line in bytes, default the length of the line.
+        """
+        size = len(line) if size is None else size
+        with self._lock:
+            self._lines.append(line)
+            self._sizes.append(size)
+            self._bytes += size
+            while len(self._lines) > 1 and (
+                (self._max_lines != -1 and len(self._lines) > self._max_lines)
+                or (self._max_bytes != -1 and self._bytes > self._max_bytes)
+            ):
+                self.__evict()
+
+    def __evict(self):
+        line = self._lines.popleft()
+        self._bytes -= self._sizes.popleft()
+        self._evicted += 1
+        if self._spill_file is not None:
+            if self._spill is None:
+                self._spill = open(self._spill_file, "a", encoding="utf-8")
+            self._spill.write(line + "\n")
+
+    def take(self, lines: int = -1) -> List[str]:
+        """Remove and return the oldest lines of the buffer.
+
+        :param lines: The number of lines to take, default -1 takes all lines.
+        :return: The lines in the order they were printed.
+        """
+        with self._lock:
+            if lines == -1 or lines > len(self._lines):
+                lines = len(self._lines)
+            ret = [self._lines.popleft() for _ in range(lines)]
+            for _ in range(lines):
+                self._bytes -= self._sizes.popleft()
+            return ret
+
+    def tail(self, lines: int = 10) -> List[str]:
+        """Return the most recent lines of the buffer without removing them.
+
+        :param lines: The number of lines to return.
+        :return: The lines in the order they were printed.
+        """
+        with self._lock:
+            lines = min(lines, len(self._lines))
+            return [self._lines[-i] for i in range(lines, 0, -1)]
+
+    @property
+    def evicted(self) -> int:
+        """The number of lines evicted from the buffer because of the limits."""
+        return self._evicted
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes currently kept in the buffer."""
+        return self._bytes
+
+    def close(self):
+        """Close the spill file if one was opened."""
+        with self._lock:
+            if self._spill is not None:
+                self._spill.close()
+                self._spill = None
+
+    def __len__(self) -> int:
+        return len(self._lines)
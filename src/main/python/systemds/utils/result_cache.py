@@ -0,0 +1,219 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import weakref
+from collections import OrderedDict
+from threading import RLock
+from typing import Any, Dict, Hashable, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_RESULT_CACHE_BYTES = 1024 * 1024 * 1024
+
+
+def result_size(result: Any) -> int:
+    """Estimate the size of a computed result in bytes.
+
+    :param result: A numpy array, scipy sparse matrix, pandas DataFrame, scalar, or a list of them.
+    :return: The size in bytes.
+    """
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    elif isinstance(result, pd.DataFrame):
+        return int(result.memory_usage(index=False, deep=True).sum())
+    elif isinstance(result, (list, tuple)):
+        return sum(result_size(r) for r in result)
+    elif hasattr(result, "indptr"):
+        # scipy compressed sparse matrix
+        return result.data.nbytes + result.indices.nbytes + result.indptr.nbytes
+    else:
+        return 64
+
+
+def copy_result(result: Any) -> Any:
+    """Copy a computed result, such that modifying it does not modify the cached result.
+
+    :param result: A numpy array, scipy sparse matrix, pandas DataFrame, scalar, or a list of them.
+    :return: The copy, scalars are returned as they are.
+    """
+    if isinstance(result, list):
+        return [copy_result(r) for r in result]
+    elif isinstance(result, tuple):
+        return tuple(copy_result(r) for r in result)
+    elif hasattr(result, "copy") and not isinstance(result, (str, bytes)):
+        return result.copy()
+    else:
+        return result
+
+
+def readonly_result(result: Any) -> Any:
+    """Get a view of a cached result that cannot modify the cached result, without copying
+    its values where possible. numpy arrays are returned as read-only views, DataFrames as
+    shallow copies if pandas uses copy-on-write, and other results are copied.
+
+    :param result: A numpy array, scipy sparse matrix, pandas DataFrame, scalar, or a list of them.
+    :return: The view.
+    """
+    if isinstance(result, np.ndarray):
+        view = result.view()
+        view.flags.writeable = False
+        return view
+    elif isinstance(result, pd.DataFrame) and _copy_on_write():
+        return result.copy(deep=False)
+    elif isinstance(result, list):
+        return [readonly_result(r) for r in result]
+    elif isinstance(result, tuple):
+        return tuple(readonly_result(r) for r in result)
+    else:
+        return copy_result(result)
+
+
+def _copy_on_write() -> bool:
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except KeyError:
+        return False
+
+
+class ResultCache(object):
+    """A cache of the computed results of operation nodes.
+
+    A result is cached for a node together with the key of its inputs and compute options,
+    e.g. the content hashes of the Python local inputs. Computing the node again returns the
+    cached result while the key is the same. The cache owns a private copy of each result and
+    returns read-only views of it (see readonly_result), such that a returned result cannot
+    modify the cache and cached results are returned without copying their values.
+    Results of nodes that are garbage collected are released, and the least recently used
+    results are evicted when the total size exceeds the budget.
+    """
+
+    _entries: "OrderedDict[int, Tuple[weakref.ref, Hashable, Any, int]]"
+    _bytes: int
+
+    def __init__(self, max_bytes: int = DEFAULT_RESULT_CACHE_BYTES):
+        """Create a new result cache.
+
+        :param max_bytes: The maximum size of the cached results in bytes, 0 disables the cache.
+        """
+        if max_bytes < 0:
+            raise ValueError("Result cache size must be positive or 0 to disable it")
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
+        # reentrant, since garbage collection can release entries while the lock is held
+        self._lock = RLock()
+
+    @property
+    def enabled(self) -> bool:
+        """If results are cached."""
+        return self._max_bytes > 0
+
+    @property
+    def max_bytes(self) -> int:
+        """The budget of the cached results in bytes."""
+        return self._max_bytes
+
+    def get(self, node, key: Hashable) -> Tuple[bool, Any]:
+        """Get the cached result of a node.
+
+        :param node: The operation node.
+        :param key: The key of the inputs and options of the computation.
+        :return: A tuple if the result is cached, and a read-only view of the result.
+        """
+        with self._lock:
+            entry = self._entries.get(id(node))
+            if entry is None or entry[0]() is not node or entry[1] != key:
+                self._misses += 1
+                return False, None
+            self._entries.move_to_end(id(node))
+            self._hits += 1
+            result = entry[2]
+        return True, readonly_result(result)
+
+    def put(self, node, key: Hashable, result: Any):
+        """Cache the result of a node, replacing a previous result of the node.
+
+        :param node: The operation node.
+        :param key: The key of the inputs and options of the computation.
+        :param result: The computed result, the cache keeps a copy of it.
+        """
+        if not self.enabled:
+            return
+        size = result_size(result)
+        if size > self._max_bytes:
+            return
+        result = copy_result(result)
+        node_id = id(node)
+        ref = weakref.ref(node, lambda r: self.__release(node_id, r))
+        with self._lock:
+            self.__remove(node_id)
+            self._entries[node_id] = (ref, key, result, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, _, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evicted += 1
+
+    def __release(self, node_id: int, ref: weakref.ref):
+        with self._lock:
+            entry = self._entries.get(node_id)
+            if entry is not None and entry[0] is ref:
+                self.__remove(node_id)
+
+    def __remove(self, node_id: int):
+        entry = self._entries.pop(node_id, None)
+        if entry is not None:
+            self._bytes -= entry[3]
+
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def statistics(self) -> Dict[str, int]:
+        """Get the statistics of the cache.
+
+        :return: A dict of the number of hits, misses and evicted results, and the
+            number and size in bytes of the cached results.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evicted": self._evicted,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of the cached results."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,112 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Hashable, Optional
+
+from py4j.java_gateway import JavaObject
+
+DEFAULT_SCRIPT_CACHE_SIZE = 64
+
+
+class ScriptCache(object):
+    """A cache of prepared scripts, keyed by the DML code and the names of the inputs and outputs.
+
+    Repeated computations of the same script, e.g. scoring loops with new input data, take the
+    compiled script from the cache and only bind their inputs, instead of parsing, validating and
+    compiling the DML again. A prepared script is taken out of the cache while it is executed, such
+    that concurrent computations never share one, and put back afterwards. The least recently used
+    scripts are evicted when the number of scripts exceeds the limit.
+    """
+
+    _entries: "OrderedDict[Hashable, JavaObject]"
+
+    def __init__(self, max_entries: int = DEFAULT_SCRIPT_CACHE_SIZE):
+        """Create a new script cache.
+
+        :param max_entries: The maximum number of cached scripts, 0 disables the cache.
+        """
+        if max_entries < 0:
+            raise ValueError("Script cache size must be positive or 0 to disable it")
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
+        self._lock = Lock()
+
+    def take(self, key: Hashable) -> Optional[JavaObject]:
+        """Take a prepared script out of the cache.
+
+        :param key: The key of the script.
+        :return: The prepared script, or None if it is not cached.
+        """
+        if self._max_entries == 0:
+            return None
+        with self._lock:
+            script = self._entries.pop(key, None)
+            if script is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return script
+
+    def put(self, key: Hashable, script: JavaObject):
+        """Put a prepared script into the cache, after it is executed.
+        The inputs and results bound to the script are released, such that cached
+        scripts do not keep data in the JVM, e.g. inputs evicted from the input cache.
+
+        :param key: The key of the script.
+        :param script: The prepared script.
+        """
+        if self._max_entries == 0:
+            return
+        script.clearParameters()
+        script.clearPinnedData()
+        with self._lock:
+            self._entries[key] = script
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evicted += 1
+
+    def clear(self):
+        """Remove all prepared scripts."""
+        with self._lock:
+            self._entries.clear()
+
+    def statistics(self) -> Dict[str, int]:
+        """Get the statistics of the cache.
+
+        :return: A dict of the number of hits, misses and evicted scripts, and the
+            number of cached scripts.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evicted": self._evicted,
+                "entries": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
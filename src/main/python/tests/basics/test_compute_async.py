@@ -0,0 +1,117 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import asyncio
+import unittest
+from concurrent.futures import Future
+
+import numpy as np
+from systemds.context import SystemDSContext
+
+
+class TestComputeAsync(unittest.TestCase):
+
+    sds: SystemDSContext = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sds = SystemDSContext(result_cache_bytes=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sds.close()
+
+    def test_future(self):
+        a = np.random.default_rng(7).random((10, 10))
+        future = (self.sds.from_numpy(a) @ self.sds.from_numpy(a)).compute_async()
+        self.assertIsInstance(future, Future)
+        self.assertTrue(np.allclose(a @ a, future.result()))
+
+    def test_arguments(self):
+        node = self.sds.from_numpy(np.ones((3, 3))) + 1
+        future = node.compute_async(dtype=np.float32)
+        self.assertEqual(np.float32, future.result().dtype)
+
+    def test_concurrent_shared_nodes(self):
+        a = np.random.default_rng(7).random((50, 20))
+        x = self.sds.from_numpy(a)
+        gram = x.t() @ x
+        nodes = [gram + i for i in range(8)] + [gram.sum(), (x * 2).sum()]
+        futures = [node.compute_async() for node in nodes]
+        for i in range(8):
+            self.assertTrue(np.allclose(a.T @ a + i, futures[i].result()))
+        self.assertAlmostEqual((a.T @ a).sum(), futures[8].result())
+        self.assertAlmostEqual(a.sum() * 2, futures[9].result())
+
+    def test_same_node(self):
+        node = self.sds.from_numpy(np.ones((3, 3))) * 3
+        futures = [
+            node.compute_async(dtype=np.float32 if i % 2 else np.float64)
+            for i in range(6)
+        ]
+        for i, future in enumerate(futures):
+            result = future.result()
+            self.assertEqual(np.float32 if i % 2 else np.float64, result.dtype)
+            self.assertTrue(np.array_equal(np.full((3, 3), 3), result))
+
+    def test_context_compute_async(self):
+        x = self.sds.from_numpy(np.arange(6.0).reshape(2, 3))
+        total, maximum = self.sds.compute_async(x.sum(), x.max()).result()
+        self.assertEqual(15, total)
+        self.assertEqual(5, maximum)
+
+    def test_mixed_compute_shared_nodes(self):
+        a = np.random.default_rng(7).random((20, 10))
+        x = self.sds.from_numpy(a)
+        gram = x.t() @ x
+        total = gram.sum()
+        futures = []
+        for i in range(4):
+            futures.append(self.sds.compute_async(gram, total))
+            futures.append(gram.compute_async(dtype=np.float32))
+            futures.append(gram.compute_async(sparse=True))
+        direct = gram.compute()
+        self.assertEqual(np.float64, direct.dtype)
+        self.assertTrue(np.allclose(a.T @ a, direct))
+        for i in range(4):
+            dense, value = futures[3 * i].result()
+            self.assertEqual(np.float64, dense.dtype)
+            self.assertTrue(np.allclose(a.T @ a, dense))
+            self.assertAlmostEqual((a.T @ a).sum(), value)
+            single = futures[3 * i + 1].result()
+            self.assertEqual(np.float32, single.dtype)
+            self.assertTrue(np.allclose(a.T @ a, single, rtol=1e-5))
+            self.assertTrue(np.allclose(a.T @ a, futures[3 * i + 2].result().toarray()))
+
+    def test_acompute(self):
+        a = np.random.default_rng(7).random((10, 10))
+        x = self.sds.from_numpy(a)
+
+        async def run():
+            return await asyncio.gather(x.sum().acompute(), (x + 1).acompute())
+
+        total, plus_one = asyncio.run(run())
+        self.assertAlmostEqual(a.sum(), total)
+        self.assertTrue(np.allclose(a + 1, plus_one))
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
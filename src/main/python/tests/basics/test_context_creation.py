@@ -22,6 +22,8 @@
 import unittest
 import logging
 
+import numpy as np
+
 from systemds.context import SystemDSContext
 
 
@@ -61,6 +63,35 @@ class TestContextCreation(unittest.TestCase):
         c.close()
         d.close()
 
+    def test_startup_times(self):
+        sds = SystemDSContext()
+        times = sds.get_startup_times()
+        sds.close()
+        for phase in ["spawn_process", "wait_for_jvm", "connect_gateway", "total"]:
+            self.assertGreaterEqual(times[phase], 0)
+        self.assertLessEqual(times["wait_for_jvm"], times["total"])
+        self.assertGreater(times["jvm_startup"], 0)
+
+    def test_lazy_start(self):
+        sds = SystemDSContext(lazy_start=True)
+        # Building the DAG does not wait for the JVM.
+        m = np.arange(4, dtype=np.float64).reshape(2, 2)
+        node = sds.from_numpy(m) * 3
+        self.assertTrue(np.allclose(m * 3, node.compute()))
+        self.assertTrue(sds.is_started())
+        sds.close()
+
+    def test_capture_stdout_bounded(self):
+        sds = SystemDSContext(capture_stdout=True, capture_max_lines=2)
+        for i in range(4):
+            sds.scalar(i).print().compute()
+        self.assertEqual(["3"], sds.tail_stdout(1))
+        self.assertEqual(["2", "3"], sds.get_stdout())
+        sds.close()
+
+    def test_lazy_start_close_before_ready(self):
+        SystemDSContext(lazy_start=True).close()
+
 
 if __name__ == "__main__":
     unittest.main(exit=False)
@@ -0,0 +1,88 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import unittest
+
+import numpy as np
+from systemds.context import SystemDSContext
+
+
+class TestContextDaemon(unittest.TestCase):
+
+    daemon: SystemDSContext = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.daemon = SystemDSContext(daemon=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.daemon.close()
+
+    def address(self):
+        return "localhost:" + str(self.daemon.get_port())
+
+    def test_attach_and_compute(self):
+        with SystemDSContext(attach=self.address()) as sds:
+            self.assertTrue(sds.is_attached())
+            m = np.array([[1, 2], [3, 4]], dtype=np.float64)
+            res = (sds.from_numpy(m) + 1).compute()
+            self.assertTrue(np.allclose(m + 1, res))
+
+    def test_attach_does_not_stop_daemon(self):
+        SystemDSContext(attach=self.address()).close()
+        with SystemDSContext(attach=self.address()) as sds:
+            self.assertEqual(5, sds.scalar(5).compute())
+
+    def test_sessions_are_isolated(self):
+        a = SystemDSContext(attach=self.address())
+        b = SystemDSContext(attach=self.address())
+        self.assertNotEqual(a._session_id, b._session_id)
+        self.assertEqual(2, self.daemon.java_gateway.entry_point.getNumSessions())
+        a.close()
+        b.close()
+        self.assertEqual(0, self.daemon.java_gateway.entry_point.getNumSessions())
+
+    def test_statistics_per_session(self):
+        with SystemDSContext(attach=self.address(), capture_statistics=True) as a:
+            entry_point = a.java_gateway.entry_point
+            with SystemDSContext(attach=self.address()) as b:
+                self.assertTrue(entry_point.isStatistics(a._session_id))
+                self.assertFalse(entry_point.isStatistics(b._session_id))
+                (b.from_numpy(np.ones((3, 3))) + 1).compute()
+                (a.from_numpy(np.ones((3, 3))) * 2).compute()
+                self.assertIn("Heavy hitter instructions", a.take_stats())
+                self.assertEqual("", b.get_stats())
+            self.assertTrue(entry_point.isStatistics(a._session_id))
+
+    def test_invalid_address(self):
+        self.assertRaises(ValueError, lambda: SystemDSContext(attach="localhost"))
+
+    def test_attach_non_daemon(self):
+        with SystemDSContext() as sds:
+            self.assertRaises(
+                ValueError,
+                lambda: SystemDSContext(attach="localhost:" + str(sds.get_port())),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,134 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from systemds.context import SystemDSContextPool, systemds_context_pool
+from systemds.utils.jvm_options import available_cores, jvm_pool_resources
+
+
+class TestContextPool(unittest.TestCase):
+
+    pool: SystemDSContextPool = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = SystemDSContextPool(2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def test_lease(self):
+        with self.pool.lease() as sds:
+            m = np.arange(6, dtype=np.float64).reshape(2, 3)
+            self.assertTrue(np.allclose(m * 2, (sds.from_numpy(m) * 2).compute()))
+
+    def test_map(self):
+        inputs = [np.full((3, 3), i, dtype=np.float64) for i in range(6)]
+        res = self.pool.map(lambda sds, x: sds.from_numpy(x).sum().compute(), inputs)
+        self.assertEqual([9.0 * i for i in range(6)], res)
+
+    def test_different_jvms(self):
+        ports = set(u["port"] for u in self.pool.utilization())
+        self.assertEqual(2, len(ports))
+
+    def test_utilization(self):
+        self.pool.submit(lambda sds: sds.scalar(1).compute()).result()
+        utilization = self.pool.utilization()
+        self.assertEqual(2, len(utilization))
+        self.assertGreaterEqual(sum(u["tasks"] for u in utilization), 1)
+        for u in utilization:
+            self.assertGreaterEqual(u["utilization"], 0.0)
+            self.assertLessEqual(u["utilization"], 1.0)
+
+    def test_invalid_size(self):
+        self.assertRaises(ValueError, lambda: SystemDSContextPool(0))
+
+
+class TestContextPoolStartupFailure(unittest.TestCase):
+
+    def test_close_started_contexts(self):
+        started = []
+        lock = threading.Lock()
+
+        class Context(object):
+            def __init__(self, **kwargs):
+                with lock:
+                    first = len(started) == 0
+                    started.append(self)
+                if first:
+                    raise RuntimeError("failed startup")
+                # the other contexts finish after the failure
+                time.sleep(0.2)
+                self.closed = False
+
+            def close(self):
+                self.closed = True
+
+        with patch.object(systemds_context_pool, "SystemDSContext", Context):
+            self.assertRaises(RuntimeError, lambda: SystemDSContextPool(3))
+        self.assertEqual(3, len(started))
+        self.assertTrue(all(sds.closed for sds in started[1:]))
+
+
+class TestContextPoolResources(unittest.TestCase):
+
+    def start(self, size, **kwargs):
+        options = []
+
+        class Context(object):
+            def __init__(self, **kwargs):
+                options.append(kwargs)
+
+            def close(self):
+                pass
+
+        with patch.object(systemds_context_pool, "SystemDSContext", Context):
+            SystemDSContextPool(size, **kwargs).close()
+        return options
+
+    def test_divided_resources(self):
+        options = self.start(4)
+        self.assertEqual(4, len(options))
+        memory, threads = jvm_pool_resources(4)
+        for o in options:
+            self.assertEqual(memory, o["jvm_memory"])
+            self.assertEqual(threads, o["jvm_threads"])
+        self.assertEqual(max(1, available_cores() // 4), threads)
+
+    def test_explicit_resources(self):
+        for o in self.start(2, jvm_memory="1g", jvm_threads=3):
+            self.assertEqual("1g", o["jvm_memory"])
+            self.assertEqual(3, o["jvm_threads"])
+
+    def test_untuned(self):
+        for o in self.start(2, tune_jvm=False):
+            self.assertNotIn("jvm_memory", o)
+            self.assertNotIn("jvm_threads", o)
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,192 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from systemds.context import SystemDSContext
+from systemds.utils import input_cache
+from systemds.utils.input_cache import (
+    InputCache,
+    hash_buffers,
+    input_key,
+    input_size,
+)
+
+
+class TestInputCache(unittest.TestCase):
+
+    def setUp(self):
+        self.created = 0
+
+    def create(self):
+        self.created += 1
+        return object()
+
+    def test_hit(self):
+        c = InputCache()
+        a = np.arange(100.0)
+        first = c.get(a, self.create)
+        self.assertIs(first, c.get(a, self.create))
+        self.assertEqual(1, self.created)
+        self.assertEqual(1, c.statistics()["hits"])
+        self.assertEqual(1, c.statistics()["misses"])
+
+    def test_equal_content(self):
+        c = InputCache()
+        a = np.arange(100.0)
+        self.assertIs(c.get(a, self.create), c.get(a.copy(), self.create))
+        self.assertEqual(1, self.created)
+
+    def test_modified(self):
+        c = InputCache()
+        a = np.arange(100.0)
+        c.get(a, self.create)
+        a[5] = -1
+        c.get(a, self.create)
+        self.assertEqual(2, self.created)
+
+    def test_shape_and_dtype(self):
+        a = np.arange(100.0)
+        self.assertNotEqual(input_key(a), input_key(a.reshape(10, 10)))
+        self.assertNotEqual(input_key(a), input_key(a.view(np.int64)))
+
+    def test_frame(self):
+        df = pd.DataFrame({"a": [1, 2, 3], "s": ["x", "y", "z"]})
+        self.assertEqual(input_key(df), input_key(df.copy()))
+        other = df.copy()
+        other.loc[1, "s"] = "w"
+        self.assertNotEqual(input_key(df), input_key(other))
+
+    def test_object_array_not_cached(self):
+        c = InputCache()
+        a = np.array(["a", 1], dtype=object)
+        c.get(a, self.create)
+        c.get(a, self.create)
+        self.assertEqual(2, self.created)
+        self.assertEqual(0, len(c))
+
+    def test_evict_least_recently_used(self):
+        c = InputCache(2000)
+        a, b, d = np.zeros(100), np.ones(100), np.full(100, 2.0)
+        c.get(a, self.create)
+        c.get(b, self.create)
+        c.get(a, self.create)
+        c.get(d, self.create)
+        self.assertEqual(1, c.statistics()["evicted"])
+        self.assertEqual(1600, c.nbytes)
+        c.get(a, self.create)
+        self.assertEqual(3, self.created)
+        c.get(b, self.create)
+        self.assertEqual(4, self.created)
+
+    def test_larger_than_budget(self):
+        c = InputCache(100)
+        c.get(np.zeros(100), self.create)
+        self.assertEqual(0, len(c))
+
+    def test_larger_than_budget_not_hashed(self):
+        c = InputCache(100)
+        with patch.object(input_cache, "hash_buffers") as hashing:
+            c.get(np.zeros(100), self.create)
+            c.get(pd.DataFrame({"a": np.zeros(100)}), self.create)
+            hashing.assert_not_called()
+        self.assertEqual(2, self.created)
+
+    def test_size(self):
+        self.assertEqual(800, input_size(np.zeros(100)))
+        self.assertEqual(input_key(np.zeros(100))[2], input_size(np.zeros(100)))
+        df = pd.DataFrame({"a": [1, 2, 3], "s": ["x", "y", "z"]})
+        self.assertEqual(input_key(df)[2], input_size(df))
+
+    def test_disabled(self):
+        c = InputCache(0)
+        a = np.zeros(10)
+        c.get(a, self.create)
+        c.get(a, self.create)
+        self.assertEqual(2, self.created)
+
+    def test_invalid_budget(self):
+        with self.assertRaises(ValueError):
+            InputCache(-1)
+
+    def test_clear(self):
+        c = InputCache()
+        c.get(np.zeros(10), self.create)
+        c.clear()
+        self.assertEqual(0, len(c))
+        self.assertEqual(0, c.nbytes)
+
+    def test_hash_chunks(self):
+        a = np.random.default_rng(1).random(1000)
+        with patch.object(input_cache, "HASH_CHUNK_SIZE", 64):
+            chunked = hash_buffers(a)
+            a[-1] = 0
+            self.assertNotEqual(chunked, hash_buffers(a))
+
+
+class TestInputCacheContext(unittest.TestCase):
+
+    sds: SystemDSContext = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sds = SystemDSContext()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sds.close()
+
+    def setUp(self):
+        self.sds.clear_input_cache()
+
+    def test_repeated_compute(self):
+        a = np.random.default_rng(2).random((100, 10))
+        m = self.sds.from_numpy(a)
+        before = self.sds.input_cache_statistics()
+        first = (m + 1).compute()
+        second = (m * 2).compute()
+        stats = self.sds.input_cache_statistics()
+        self.assertEqual(1, stats["misses"] - before["misses"])
+        self.assertEqual(1, stats["hits"] - before["hits"])
+        self.assertTrue(np.allclose(a + 1, first))
+        self.assertTrue(np.allclose(a * 2, second))
+
+    def test_modified_input(self):
+        a = np.zeros((10, 10))
+        m = self.sds.from_numpy(a)
+        self.assertEqual(0, m.sum().compute())
+        a[0, 0] = 5
+        self.assertEqual(5, m.sum().compute())
+
+    def test_frame(self):
+        df = pd.DataFrame({"a": np.arange(10.0), "s": [str(i) for i in range(10)]})
+        f = self.sds.from_pandas(df)
+        before = self.sds.input_cache_statistics()["hits"]
+        f.rbind(f).compute()
+        f.rbind(f).compute()
+        self.assertEqual(1, self.sds.input_cache_statistics()["hits"] - before)
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
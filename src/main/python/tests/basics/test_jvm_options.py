@@ -0,0 +1,90 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import os
+import shutil
+import unittest
+
+from systemds.utils.jvm_options import (
+    available_cores,
+    available_memory,
+    cds_options,
+    jvm_pool_resources,
+    jvm_tuning_options,
+)
+
+
+class TestJVMOptions(unittest.TestCase):
+
+    base_path = "tests/basics/jvm_options"
+
+    @classmethod
+    def setUpClass(cls):
+        os.makedirs(cls.base_path, exist_ok=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.base_path, ignore_errors=True)
+
+    def test_available_resources(self):
+        self.assertGreaterEqual(available_cores(), 1)
+        mem = available_memory()
+        self.assertTrue(mem is None or mem > 0)
+
+    def test_default_heap(self):
+        options = jvm_tuning_options()
+        if available_memory() is not None:
+            self.assertEqual(1, len([o for o in options if o.startswith("-Xmx")]))
+
+    def test_override_memory(self):
+        self.assertIn("-Xmx3g", jvm_tuning_options(memory="3g"))
+
+    def test_override_threads(self):
+        options = jvm_tuning_options(threads=16)
+        self.assertIn("-XX:ActiveProcessorCount=16", options)
+        if available_memory() is None or available_memory() > 2 * 1024**3:
+            self.assertIn("-XX:ParallelGCThreads=16", options)
+
+    def test_pool_resources(self):
+        memory, threads = jvm_pool_resources(2)
+        self.assertEqual(max(1, available_cores() // 2), threads)
+        if available_memory() is not None:
+            single = [o for o in jvm_tuning_options() if o.startswith("-Xmx")][0]
+            self.assertLessEqual(int(memory[:-1]), int(single[4:-1]) // 2 + 1)
+
+    def test_single_thread_serial_gc(self):
+        self.assertIn("-XX:+UseSerialGC", jvm_tuning_options(threads=1))
+
+    def test_cds_dump_if_missing(self):
+        archive = os.path.join(self.base_path, "missing.jsa")
+        options = cds_options(archive, archive + ".tmp")
+        self.assertIn("-XX:ArchiveClassesAtExit=" + archive + ".tmp", options)
+
+    def test_cds_use_if_existing(self):
+        archive = os.path.join(self.base_path, "existing.jsa")
+        open(archive, "w").close()
+        options = cds_options(archive, archive + ".tmp")
+        self.assertIn("-XX:SharedArchiveFile=" + archive, options)
+        self.assertFalse(any("ArchiveClassesAtExit" in o for o in options))
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,97 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import os
+import shutil
+import unittest
+
+from systemds.utils.output_buffer import OutputBuffer
+
+
+class TestOutputBuffer(unittest.TestCase):
+
+    base_path = "tests/basics/output_buffer"
+
+    @classmethod
+    def setUpClass(cls):
+        os.makedirs(cls.base_path, exist_ok=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.base_path, ignore_errors=True)
+
+    def fill(self, buffer: OutputBuffer, n: int):
+        for i in range(n):
+            buffer.append(str(i))
+
+    def test_take_all(self):
+        b = OutputBuffer()
+        self.fill(b, 5)
+        self.assertEqual(["0", "1", "2", "3", "4"], b.take())
+        self.assertEqual(0, len(b))
+        self.assertEqual(0, b.nbytes)
+
+    def test_take_some(self):
+        b = OutputBuffer()
+        self.fill(b, 5)
+        self.assertEqual(["0", "1"], b.take(2))
+        self.assertEqual(["2", "3", "4"], b.take(10))
+
+    def test_tail(self):
+        b = OutputBuffer()
+        self.fill(b, 5)
+        self.assertEqual(["3", "4"], b.tail(2))
+        self.assertEqual(5, len(b))
+        self.assertEqual(["0", "1", "2", "3", "4"], b.tail(100))
+
+    def test_line_limit(self):
+        b = OutputBuffer(max_lines=3)
+        self.fill(b, 10)
+        self.assertEqual(["7", "8", "9"], b.take())
+        self.assertEqual(7, b.evicted)
+
+    def test_byte_limit(self):
+        b = OutputBuffer(max_bytes=10)
+        for _ in range(4):
+            b.append("abcd")
+        self.assertEqual(2, len(b))
+        self.assertEqual(8, b.nbytes)
+
+    def test_oversized_line_is_kept(self):
+        b = OutputBuffer(max_bytes=2)
+        b.append("abcd")
+        self.assertEqual(["abcd"], b.tail(1))
+
+    def test_spill_file(self):
+        path = os.path.join(self.base_path, "spill.out")
+        b = OutputBuffer(max_lines=2, spill_file=path)
+        self.fill(b, 5)
+        b.close()
+        with open(path) as f:
+            self.assertEqual(["0", "1", "2"], f.read().splitlines())
+        self.assertEqual(["3", "4"], b.take())
+
+    def test_invalid_limit(self):
+        self.assertRaises(ValueError, lambda: OutputBuffer(max_lines=0))
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
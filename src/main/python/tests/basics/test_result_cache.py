@@ -0,0 +1,287 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import gc
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from systemds.context import SystemDSContext
+from systemds.operator import Matrix, Scalar
+from systemds.operator.algorithm import (
+    autoencoder_2layer,
+    decisionTree,
+    ffTrain,
+    garch,
+    kmeans,
+    lasso,
+    ppca,
+)
+from systemds.utils import input_cache
+from systemds.utils.input_cache import input_key_scope
+from systemds.utils.result_cache import ResultCache, readonly_result, result_size
+
+
+class Node(object):
+    pass
+
+
+class TestResultCache(unittest.TestCase):
+
+    def test_hit(self):
+        c = ResultCache()
+        node = Node()
+        c.put(node, "k", np.arange(10.0))
+        found, result = c.get(node, "k")
+        self.assertTrue(found)
+        self.assertTrue(np.array_equal(np.arange(10.0), result))
+
+    def test_other_key(self):
+        c = ResultCache()
+        node = Node()
+        c.put(node, "k", 1.0)
+        self.assertFalse(c.get(node, "other")[0])
+        self.assertFalse(c.get(Node(), "k")[0])
+
+    def test_copies(self):
+        c = ResultCache()
+        node = Node()
+        result = np.zeros(10)
+        c.put(node, "k", result)
+        result[0] = 1
+        cached = c.get(node, "k")[1]
+        self.assertEqual(0, cached[0])
+        with self.assertRaises(ValueError):
+            cached[1] = 1
+        # hits are views of the cached result, not copies
+        self.assertIs(cached.base, c.get(node, "k")[1].base)
+
+    def test_readonly_result(self):
+        frame = pd.DataFrame({"a": [1.0, 2.0]})
+        values = readonly_result([np.zeros(3), frame, 1.5])
+        self.assertFalse(values[0].flags.writeable)
+        self.assertEqual(1.5, values[2])
+        values[1].loc[0, "a"] = 3.0
+        self.assertEqual(1.0, frame.loc[0, "a"])
+
+    def test_replace(self):
+        c = ResultCache()
+        node = Node()
+        c.put(node, "a", np.zeros(10))
+        c.put(node, "b", np.zeros(20))
+        self.assertEqual(1, len(c))
+        self.assertEqual(160, c.nbytes)
+
+    def test_evict_least_recently_used(self):
+        c = ResultCache(2000)
+        a, b, d = Node(), Node(), Node()
+        c.put(a, "k", np.zeros(100))
+        c.put(b, "k", np.zeros(100))
+        c.get(a, "k")
+        c.put(d, "k", np.zeros(100))
+        self.assertTrue(c.get(a, "k")[0])
+        self.assertFalse(c.get(b, "k")[0])
+        self.assertEqual(1, c.statistics()["evicted"])
+
+    def test_release_collected_nodes(self):
+        c = ResultCache()
+        node = Node()
+        c.put(node, "k", np.zeros(10))
+        del node
+        gc.collect()
+        self.assertEqual(0, len(c))
+        self.assertEqual(0, c.nbytes)
+
+    def test_disabled(self):
+        c = ResultCache(0)
+        node = Node()
+        c.put(node, "k", 1.0)
+        self.assertFalse(c.enabled)
+        self.assertEqual(0, len(c))
+
+    def test_size(self):
+        self.assertEqual(80, result_size(np.zeros(10)))
+        self.assertEqual(160, result_size([np.zeros(10), np.zeros(10)]))
+        self.assertLess(0, result_size(pd.DataFrame({"a": ["x", "y"]})))
+
+
+class TestResultKey(unittest.TestCase):
+    """Test which DAGs are cached, building a DAG does not need the JVM."""
+
+    class Context(object):
+        _result_cache = ResultCache()
+
+    sds = Context()
+
+    def matrix(self) -> Matrix:
+        return Matrix(self.sds, "", local_data=np.ones((10, 3)))
+
+    def test_pure(self):
+        self.assertIsNotNone((self.matrix() + 1)._result_key())
+
+    def test_input_larger_than_budget(self):
+        class Context(object):
+            _result_cache = ResultCache(100)
+
+        small = Matrix(Context(), "", local_data=np.ones((3, 3))) + 1
+        self.assertIsNotNone(small._result_key())
+        with patch.object(input_cache, "hash_buffers") as hashing:
+            large = Matrix(Context(), "", local_data=np.ones((10, 10))) + 1
+            self.assertIsNone(large._result_key())
+            hashing.assert_not_called()
+
+    def test_input_hashed_once(self):
+        node = self.matrix() + 1
+        with patch.object(
+            input_cache, "hash_buffers", wraps=input_cache.hash_buffers
+        ) as hashing:
+            with input_key_scope():
+                key = node._result_key()
+                self.assertEqual(key, node._result_key())
+            self.assertEqual(1, hashing.call_count)
+            node._result_key()
+            self.assertEqual(2, hashing.call_count)
+
+    def test_builtin_without_seed(self):
+        self.assertIsNone(kmeans(self.matrix(), k=2)[0]._result_key())
+        self.assertIsNone(kmeans(self.matrix(), k=2, seed=-1)[0]._result_key())
+
+    def test_builtin_with_seed(self):
+        self.assertIsNotNone(kmeans(self.matrix(), k=2, seed=7)[0]._result_key())
+
+    def test_builtin_random_with_seed(self):
+        x = self.matrix()
+        node = garch(x, 1, 0.1, 0.1, 0.1, 1, 1, 3, False)[0]
+        self.assertIsNone(node._result_key())
+        node = ffTrain(x, x, "sigmoid", "l2", shuffle=True, seed=3)[0]
+        self.assertIsNone(node._result_key())
+        self.assertIsNone(decisionTree(x, x, x, seed=3)._result_key())
+
+    def test_builtin_without_seed_parameter(self):
+        self.assertIsNone(ppca(self.matrix())[0]._result_key())
+        self.assertIsNone(lasso(self.matrix(), self.matrix())._result_key())
+        self.assertIsNone(autoencoder_2layer(self.matrix(), 2, 2, 1)[0]._result_key())
+
+    def test_constants(self):
+        node = Matrix(self.sds, "matrix", [Scalar(self.sds, 4, assign=True), 2, 2])
+        self.assertIsNotNone(node._result_key())
+
+    def test_external(self):
+        self.assertIsNone(Matrix(self.sds, "read", ['"x.csv"'])._result_key())
+        self.assertIsNone(Matrix(self.sds, "federated", [])._result_key())
+
+
+class TestResultCacheContext(unittest.TestCase):
+
+    sds: SystemDSContext = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sds = SystemDSContext()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sds.close()
+
+    def hits(self) -> int:
+        return self.sds.result_cache_statistics()["hits"]
+
+    def test_repeated_compute(self):
+        a = np.random.default_rng(7).random((10, 10))
+        node = (self.sds.from_numpy(a) @ self.sds.from_numpy(a)).sum()
+        before = self.hits()
+        first = node.compute()
+        second = node.compute()
+        self.assertEqual(1, self.hits() - before)
+        self.assertAlmostEqual(first, second)
+
+    def test_modified_input(self):
+        a = np.zeros((10, 10))
+        node = self.sds.from_numpy(a) + 1
+        self.assertEqual(100, node.compute().sum())
+        a[0, 0] = 5
+        self.assertEqual(105, node.compute().sum())
+
+    def test_modified_result(self):
+        node = self.sds.from_numpy(np.zeros((3, 3))) + 1
+        result = node.compute()
+        result[0, 0] = 10
+        self.assertEqual(1, node.compute()[0, 0])
+
+    def test_options(self):
+        node = self.sds.from_numpy(np.zeros((3, 3))) + 1
+        self.assertEqual(np.float64, node.compute().dtype)
+        self.assertEqual(np.float32, node.compute(dtype=np.float32).dtype)
+
+    def test_random_not_cached(self):
+        node = self.sds.rand(10, 10)
+        before = self.hits()
+        self.assertFalse(np.array_equal(node.compute(), node.compute()))
+        self.assertEqual(before, self.hits())
+
+    def test_random_with_seed(self):
+        node = self.sds.rand(10, 10, seed=3)
+        before = self.hits()
+        self.assertTrue(np.array_equal(node.compute(), node.compute()))
+        self.assertEqual(1, self.hits() - before)
+
+    def test_builtin_without_seed(self):
+        x = self.sds.from_numpy(np.random.default_rng(3).random((50, 2)))
+        node = kmeans(x, k=3, runs=1)[1]
+        before = self.hits()
+        node.compute()
+        node.compute()
+        self.assertEqual(before, self.hits())
+
+    def test_random_builtins(self):
+        rng = np.random.default_rng(3)
+        x = self.sds.from_numpy(rng.random((50, 4)))
+        y = self.sds.from_numpy(rng.random((50, 1)))
+        for node in [lasso(x, y), autoencoder_2layer(x, 2, 2, 1)[0]]:
+            before = self.hits()
+            node.compute()
+            node.compute()
+            self.assertEqual(before, self.hits())
+
+    def test_sourced_function(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "f.dml")
+            with open(path, "w") as f:
+                f.write("f = function(Matrix[Double] X) return (Matrix[Double] Y) {\n")
+                f.write("  Y = X + 1\n}\n")
+            x = self.sds.from_numpy(np.ones((3, 3)))
+            node = self.sds.source(path, "s").f(x)
+            self.assertIsNone(node._result_key())
+            before = self.hits()
+            self.assertEqual(18, node.compute().sum())
+            self.assertEqual(18, node.compute().sum())
+            self.assertEqual(before, self.hits())
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
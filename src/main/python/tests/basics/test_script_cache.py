@@ -0,0 +1,196 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import gc
+import unittest
+import weakref
+
+import numpy as np
+import pandas as pd
+from systemds.context import SystemDSContext
+from systemds.script_building.script import DMLScript
+from systemds.utils.input_cache import InputCache
+from systemds.utils.script_cache import ScriptCache
+
+
+class Script(object):
+    """A prepared script binding inputs and results like the JMLC PreparedScript."""
+
+    def __init__(self):
+        self.variables = {}
+        self.pinned = {}
+        self.runs = 0
+
+    def setMatrix(self, name, mb, reuse):
+        (self.pinned if reuse else self.variables)[name] = mb
+
+    def executeScript(self):
+        self.runs += 1
+        self.variables.update(self.pinned)
+        self.variables["out"] = object()
+
+    def statistics(self):
+        return "runs: " + str(self.runs)
+
+    def clearParameters(self):
+        self.variables.clear()
+
+    def clearPinnedData(self):
+        self.pinned.clear()
+
+
+class MatrixBlock(object):
+    pass
+
+
+class TestScriptCache(unittest.TestCase):
+
+    def test_take_and_put(self):
+        c = ScriptCache()
+        self.assertIsNone(c.take("a"))
+        script = Script()
+        c.put("a", script)
+        self.assertIs(script, c.take("a"))
+        # taken scripts are not shared until put back
+        self.assertIsNone(c.take("a"))
+        stats = c.statistics()
+        self.assertEqual(1, stats["hits"])
+        self.assertEqual(2, stats["misses"])
+        self.assertEqual(0, stats["entries"])
+
+    def test_evict_least_recently_used(self):
+        c = ScriptCache(2)
+        a = Script()
+        c.put("a", a)
+        c.put("b", Script())
+        c.put("a", c.take("a"))
+        c.put("c", Script())
+        self.assertEqual(1, c.statistics()["evicted"])
+        self.assertIsNone(c.take("b"))
+        self.assertIs(a, c.take("a"))
+
+    def test_disabled(self):
+        c = ScriptCache(0)
+        c.put("a", Script())
+        self.assertIsNone(c.take("a"))
+        self.assertEqual(0, len(c))
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            ScriptCache(-1)
+
+    def test_release_bound_data(self):
+        script = Script()
+        script.setMatrix("X", MatrixBlock(), True)
+        script.executeScript()
+        ScriptCache().put("a", script)
+        self.assertEqual({}, script.variables)
+        self.assertEqual({}, script.pinned)
+
+    def test_evicted_input_not_referenced(self):
+        inputs = InputCache()
+        scripts = ScriptCache()
+        a = np.ones((10, 10))
+        script = Script()
+        script.setMatrix("X", inputs.get(a, MatrixBlock), True)
+        script.executeScript()
+        scripts.put("a", script)
+        ref = weakref.ref(inputs.get(a, MatrixBlock))
+        inputs.clear()
+        gc.collect()
+        # the cached script does not keep the evicted input alive
+        self.assertIsNone(ref())
+        self.assertIs(script, scripts.take("a"))
+
+
+class TestScriptStatistics(unittest.TestCase):
+
+    def test_statistics_before_reuse(self):
+        class ReusingCache(ScriptCache):
+            def put(self, key, script):
+                super().put(key, script)
+                # another computation takes and executes the script right away
+                self.take(key).executeScript()
+
+        class Context(object):
+            java_gateway = None
+            _capture_statistics = True
+            _script_cache = ReusingCache()
+
+        script = DMLScript(Context())
+        script.prepared_script = Script()
+        script.execute()
+        self.assertEqual("runs: 1", script.statistics)
+        self.assertEqual(2, script.prepared_script.runs)
+
+
+class TestScriptCacheContext(unittest.TestCase):
+
+    sds: SystemDSContext = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sds = SystemDSContext()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sds.close()
+
+    def setUp(self):
+        self.sds.clear_script_cache()
+
+    def score(self, a: np.ndarray) -> np.ndarray:
+        x = self.sds.from_numpy(a)
+        return ((x @ x.t()) + 1).compute()
+
+    def test_new_inputs(self):
+        rng = np.random.default_rng(6)
+        before = self.sds.script_cache_statistics()
+        for _ in range(5):
+            a = rng.random((10, 4))
+            self.assertTrue(np.allclose(a @ a.T + 1, self.score(a)))
+        stats = self.sds.script_cache_statistics()
+        self.assertEqual(1, stats["misses"] - before["misses"])
+        self.assertEqual(4, stats["hits"] - before["hits"])
+
+    def test_different_shape(self):
+        before = self.sds.script_cache_statistics()
+        self.score(np.ones((10, 4)))
+        self.score(np.ones((5, 4)))
+        stats = self.sds.script_cache_statistics()
+        self.assertEqual(2, stats["misses"] - before["misses"])
+        self.assertEqual(0, stats["hits"] - before["hits"])
+
+    def test_frame_schema(self):
+        before = self.sds.script_cache_statistics()
+        for df in [
+            pd.DataFrame({"a": np.arange(10.0)}),
+            pd.DataFrame({"a": [str(i) for i in range(10)]}),
+        ]:
+            f = self.sds.from_pandas(df)
+            result = f.rbind(f).compute()
+            self.assertEqual(20, len(result))
+        stats = self.sds.script_cache_statistics()
+        self.assertEqual(2, stats["misses"] - before["misses"])
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,143 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import unittest
+
+import numpy as np
+import pandas as pd
+from systemds.context import SystemDSContext
+from systemds.utils.converters import arrow_available
+
+
+@unittest.skipUnless(arrow_available(), "pyarrow is not installed")
+class TestArrowTransfer(unittest.TestCase):
+
+    sds: SystemDSContext = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sds = SystemDSContext()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sds.close()
+
+    def round_trip(self, df: pd.DataFrame) -> pd.DataFrame:
+        # rbind forces the frame to be sent to and returned from SystemDS
+        frame = self.sds.from_pandas(df)
+        result = frame.rbind(frame).compute()
+        self.assertEqual(2 * len(df), len(result))
+        return result.iloc[: len(df)].reset_index(drop=True)
+
+    def test_types(self):
+        df = pd.DataFrame(
+            {
+                "i32": np.arange(100, dtype=np.int32),
+                "i64": np.arange(100, dtype=np.int64),
+                "f32": np.arange(100, dtype=np.float32) / 3,
+                "f64": np.arange(100, dtype=np.float64) / 3,
+                "b": np.arange(100) % 3 == 0,
+                "s": [f"s_{i}" for i in range(100)],
+            }
+        )
+        result = self.round_trip(df)
+        self.assertEqual(list(df.columns), list(result.columns))
+        for c in df.columns:
+            self.assertEqual(df[c].dtype, result[c].dtype, c)
+            self.assertTrue((df[c].values == result[c].values).all(), c)
+
+    def test_small_integers(self):
+        df = pd.DataFrame({"u8": np.arange(10, dtype=np.uint8)})
+        result = self.round_trip(df)
+        self.assertTrue((df["u8"].values == result["u8"].values).all())
+
+    def test_nulls(self):
+        df = pd.DataFrame(
+            {
+                "s": ["a", None, "c", "d"],
+                "f": [1.0, np.nan, 3.0, 4.0],
+            }
+        )
+        result = self.round_trip(df)
+        self.assertEqual(["a", None, "c", "d"], list(result["s"]))
+        self.assertTrue(np.isnan(result["f"][1]))
+        self.assertEqual(4.0, result["f"][3])
+
+    def test_wide(self):
+        df = pd.DataFrame(
+            {f"c{i}": np.arange(20, dtype=np.float64) + i for i in range(300)}
+        )
+        result = self.round_trip(df)
+        self.assertEqual(300, result.shape[1])
+        self.assertTrue(np.allclose(df.values, result.values))
+
+    def test_large_shared_memory(self):
+        df = pd.DataFrame(
+            {
+                "f": np.random.default_rng(7).random(100000),
+                "s": [str(i) for i in range(100000)],
+            }
+        )
+        result = self.round_trip(df)
+        self.assertTrue(np.allclose(df["f"].values, result["f"].values))
+        self.assertTrue((df["s"].values == result["s"].values).all())
+
+    def test_categorical(self):
+        df = pd.DataFrame({"c": pd.Categorical(["a", "b", None, "a", "c", "b"])})
+        result = self.round_trip(df)
+        self.assertEqual("category", result["c"].dtype.name)
+        self.assertEqual(
+            ["a", "b", None, "a", "c", "b"],
+            [None if pd.isna(v) else v for v in result["c"]],
+        )
+
+    def test_nullable(self):
+        df = pd.DataFrame(
+            {
+                "i": pd.array([1, None, 3, 4], dtype="Int64"),
+                "b": pd.array([True, None, False, True], dtype="boolean"),
+            }
+        )
+        result = self.round_trip(df)
+        self.assertEqual(pd.Int64Dtype(), result["i"].dtype)
+        self.assertEqual(pd.BooleanDtype(), result["b"].dtype)
+        self.assertTrue(pd.isna(result["i"][1]))
+        self.assertTrue(pd.isna(result["b"][1]))
+        self.assertEqual(4, result["i"][3])
+        self.assertEqual(False, result["b"][2])
+
+    def test_timestamps(self):
+        ts = pd.to_datetime(["2020-01-01", "2021-06-15 12:30", None, "1999-12-31"])
+        df = pd.DataFrame({"t": ts})
+        result = self.round_trip(df)
+        self.assertEqual(pd.Int64Dtype(), result["t"].dtype)
+        self.assertTrue(pd.isna(result["t"][2]))
+        self.assertEqual(ts[0].value, result["t"][0])
+        self.assertEqual(ts[3].value, result["t"][3])
+
+    def test_fallback_mixed_objects(self):
+        df = pd.DataFrame({"m": [1, "a", 2.5, "b", None]})
+        result = self.round_trip(df)
+        self.assertEqual(5, len(result))
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,135 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from systemds.context import SystemDSContext
+from systemds.utils import converters
+
+
+class TestBulkTransfer(unittest.TestCase):
+    """Test the transfer of frames in a single call without Arrow."""
+
+    sds: SystemDSContext = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sds = SystemDSContext()
+        cls.sds._arrow_transfer = False
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sds.close()
+
+    def round_trip(self, df: pd.DataFrame) -> pd.DataFrame:
+        # rbind forces the frame to be sent to and returned from SystemDS
+        frame = self.sds.from_pandas(df)
+        result = frame.rbind(frame).compute()
+        self.assertEqual(2 * len(df), len(result))
+        return result.iloc[: len(df)].reset_index(drop=True)
+
+    def mixed_frame(self, rows: int, cols: int) -> pd.DataFrame:
+        rng = np.random.default_rng(3)
+        data = {}
+        for j in range(cols):
+            if j % 4 == 0:
+                data[f"d{j}"] = rng.random(rows)
+            elif j % 4 == 1:
+                data[f"i{j}"] = rng.integers(-1000, 1000, rows)
+            elif j % 4 == 2:
+                data[f"b{j}"] = rng.random(rows) > 0.5
+            else:
+                data[f"s{j}"] = [f"v{v}" for v in rng.integers(0, 100, rows)]
+        return pd.DataFrame(data)
+
+    def test_wide(self):
+        df = self.mixed_frame(20, 500)
+        result = self.round_trip(df)
+        self.assertEqual(list(df.columns), list(result.columns))
+        for col in df.columns:
+            self.assertTrue((df[col].values == result[col].values).all(), col)
+
+    def test_column_groups(self):
+        df = self.mixed_frame(100, 12)
+        with patch.object(converters, "MAX_ARRAY_SIZE", 1000):
+            result = self.round_trip(df)
+        self.assertEqual(list(df.columns), list(result.columns))
+        for col in df.columns:
+            self.assertTrue((df[col].values == result[col].values).all(), col)
+
+    def test_missing_strings(self):
+        df = pd.DataFrame({"s": ["a", None, "c", "d", None, "f"], "x": np.arange(6.0)})
+        result = self.round_trip(df)
+        self.assertEqual(
+            [False, True, False, False, True, False], list(result["s"].isna())
+        )
+        self.assertEqual(["a", "c", "d", "f"], list(result["s"].dropna()))
+        self.assertTrue((df["x"].values == result["x"].values).all())
+
+    def test_result_shared_memory(self):
+        df = self.mixed_frame(50, 8)
+        with patch.object(converters, "SHARED_MEMORY_THRESHOLD", 0):
+            result = self.round_trip(df)
+        for col in df.columns:
+            self.assertTrue((df[col].values == result[col].values).all(), col)
+
+    def test_result_socket(self):
+        df = self.mixed_frame(50, 8)
+        with patch.object(converters, "SHARED_MEMORY_THRESHOLD", 2**62):
+            result = self.round_trip(df)
+        for col in df.columns:
+            self.assertTrue((df[col].values == result[col].values).all(), col)
+
+    def test_result_dtypes(self):
+        df = pd.DataFrame(
+            {
+                "f": np.arange(10, dtype=np.float32),
+                "i": np.arange(10, dtype=np.int32),
+                "l": np.arange(10, dtype=np.int64),
+                "d": np.arange(10, dtype=np.float64),
+            }
+        )
+        result = self.round_trip(df)
+        self.assertEqual(list(df.dtypes), list(result.dtypes))
+
+    def test_large_integers(self):
+        values = np.array(
+            [2**53 + 1, 2**62 + 3, -(2**53) - 1, 1577836800000000001, 0, 1],
+            dtype=np.int64,
+        )
+        result = self.round_trip(pd.DataFrame({"l": values}))
+        self.assertEqual(np.int64, result["l"].dtype)
+        self.assertEqual(list(values), list(result["l"]))
+
+    def test_missing_integers(self):
+        values = pd.array([1, None, 3, 4, None, 6], dtype="Int64")
+        result = self.round_trip(pd.DataFrame({"i": values}))
+        self.assertEqual(
+            [False, True, False, False, True, False], list(result["i"].isna())
+        )
+        self.assertEqual([1, 3, 4, 6], list(result["i"].dropna()))
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
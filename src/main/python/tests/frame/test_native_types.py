@@ -0,0 +1,78 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import unittest
+
+import numpy as np
+import pandas as pd
+from systemds.context import SystemDSContext
+
+
+class TestNativeTypes(unittest.TestCase):
+    """Test the transfer of booleans and timestamps without Arrow."""
+
+    sds: SystemDSContext = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sds = SystemDSContext()
+        cls.sds._arrow_transfer = False
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sds.close()
+
+    def round_trip(self, df: pd.DataFrame) -> pd.DataFrame:
+        # rbind forces the frame to be sent to and returned from SystemDS
+        frame = self.sds.from_pandas(df)
+        result = frame.rbind(frame).compute()
+        self.assertEqual(2 * len(df), len(result))
+        return result.iloc[: len(df)].reset_index(drop=True)
+
+    def test_booleans(self):
+        values = np.random.default_rng(7).random(1001) > 0.5
+        result = self.round_trip(pd.DataFrame({"b": values}))
+        self.assertEqual(np.bool_, result["b"].dtype)
+        self.assertTrue((values == result["b"].values).all())
+
+    def test_timestamps(self):
+        ts = pd.to_datetime(["2020-01-01", "2021-06-15 12:30", "1999-12-31"] * 3)
+        result = self.round_trip(pd.DataFrame({"t": ts}))
+        self.assertTrue(
+            (
+                ts.values.astype("datetime64[ns]").view(np.int64) == result["t"].values
+            ).all()
+        )
+
+    def test_timestamps_small(self):
+        ts = pd.to_datetime(["2020-01-01", "2021-06-15 12:30"])
+        result = self.round_trip(pd.DataFrame({"t": ts}))
+        self.assertEqual(ts[1].value, result["t"][1])
+
+    def test_timestamps_nanoseconds(self):
+        # epoch nanoseconds are above 2^53 and not representable as doubles
+        ts = pd.to_datetime([1577836800000000001, 1623760200123456789] * 3)
+        result = self.round_trip(pd.DataFrame({"t": ts}))
+        self.assertEqual(list(ts.asi8), list(result["t"]))
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,82 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import unittest
+
+import numpy as np
+import pandas as pd
+from systemds.context import SystemDSContext
+from systemds.utils.converters import decode_strings, encode_strings
+
+
+class TestStringTransfer(unittest.TestCase):
+
+    sds: SystemDSContext = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sds = SystemDSContext()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sds.close()
+
+    def round_trip(self, df: pd.DataFrame) -> pd.DataFrame:
+        # rbind forces the frame to be sent to and returned from SystemDS
+        frame = self.sds.from_pandas(df)
+        result = frame.rbind(frame).compute()
+        self.assertEqual(2 * len(df), len(result))
+        return result.iloc[: len(df)]
+
+    def test_encode_decode(self):
+        col = pd.Series(["a", "bö", None, "", np.nan, "xyz"])
+        decoded = decode_strings(bytes(encode_strings(col)), len(col))
+        self.assertEqual(["a", "bö", None, "", None, "xyz"], list(decoded))
+
+    def test_ascii(self):
+        df = pd.DataFrame({"s": [f"string_{i}" for i in range(1000)]})
+        result = self.round_trip(df)
+        self.assertTrue((df.values == result.values).all())
+
+    def test_unicode(self):
+        df = pd.DataFrame({"s": [f"äöü_漢字_{i}" for i in range(100)]})
+        result = self.round_trip(df)
+        self.assertTrue((df.values == result.values).all())
+
+    def test_missing_values(self):
+        df = pd.DataFrame({"s": ["a", None, "c", "", "e", None]})
+        result = self.round_trip(df)
+        self.assertEqual(["a", None, "c", "", "e", None], list(result["s"]))
+
+    def test_mixed_columns(self):
+        df = pd.DataFrame(
+            {
+                "s1": [f"s{i}" for i in range(50)],
+                "i": list(range(50)),
+                "s2": [str(i * 2) + "ß" for i in range(50)],
+            }
+        )
+        result = self.round_trip(df)
+        self.assertTrue((df.values == result.values).all())
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -25,6 +25,7 @@ import unittest
 import numpy as np
 from py4j.java_gateway import JVMView
 from systemds.context import SystemDSContext
+from systemds.utils import converters
 from systemds.utils.converters import matrix_block_to_numpy, numpy_to_matrix_block
 
 
@@ -70,6 +71,109 @@ class Test_MatrixBlockConverter(unittest.TestCase):
         array = np.array([rng.standard_normal(n) for x in range(k)])
         self.convert_back_and_forth(array)
 
+    def test_shared_memory_fp64(self):
+        rng = np.random.default_rng(seed=7)
+        self.convert_back_and_forth(rng.standard_normal((1000, 200)))
+
+    def test_shared_memory_fp32(self):
+        rng = np.random.default_rng(seed=7)
+        array = rng.standard_normal((1000, 300)).astype(np.float32)
+        self.convert_back_and_forth(array)
+
+    def test_shared_memory_int32(self):
+        rng = np.random.default_rng(seed=7)
+        array = rng.integers(-100, 100, (1000, 300), dtype=np.int32)
+        self.convert_back_and_forth(array)
+
+    def test_shared_memory_uint8(self):
+        rng = np.random.default_rng(seed=7)
+        array = rng.integers(0, 255, (2000, 600), dtype=np.uint8)
+        self.convert_back_and_forth(array)
+
+    def test_shared_memory_non_contiguous(self):
+        rng = np.random.default_rng(seed=7)
+        self.convert_back_and_forth(rng.standard_normal((300, 1000)).T)
+
+    def test_shared_memory_result(self):
+        rng = np.random.default_rng(seed=7)
+        array = rng.standard_normal((1000, 200))
+        matrix_block = numpy_to_matrix_block(self.sds, array)
+        returned = matrix_block_to_numpy(self.sds.java_gateway.jvm, matrix_block, True)
+        self.assertTrue(np.allclose(array, returned))
+
+    def test_shared_memory_result_sparse(self):
+        array = np.zeros((1000, 300))
+        array[::7, ::3] = 4.2
+        matrix_block = numpy_to_matrix_block(self.sds, array)
+        self.assertTrue(matrix_block.isInSparseFormat())
+        returned = matrix_block_to_numpy(self.sds.java_gateway.jvm, matrix_block, True)
+        self.assertTrue(np.allclose(array, returned))
+
+    def test_shared_memory_result_compute(self):
+        rng = np.random.default_rng(seed=7)
+        array = rng.standard_normal((1000, 200))
+        returned = (self.sds.from_numpy(array) * 2).compute()
+        self.assertTrue(np.allclose(array * 2, returned))
+        # The result is a regular writable array, not backed by the exchange file.
+        self.assertIs(np.ndarray, type(returned))
+        self.assertTrue(returned.flags.writeable)
+        returned[0, 0] = 42.0
+        self.assertEqual(42.0, returned[0, 0])
+
+    def test_result_dtypes(self):
+        array = np.arange(1500000, dtype=np.float64).reshape((5000, 300)) % 251
+        matrix_block = numpy_to_matrix_block(self.sds, array)
+        jvm = self.sds.java_gateway.jvm
+        for dtype in [np.float64, np.float32, np.int32, np.uint8, np.int16]:
+            for shared_memory in [False, True]:
+                returned = matrix_block_to_numpy(
+                    jvm, matrix_block, shared_memory, dtype
+                )
+                self.assertEqual(np.dtype(dtype), returned.dtype)
+                self.assertTrue(np.array_equal(array.astype(dtype), returned))
+
+    def test_result_dtype_compute(self):
+        rng = np.random.default_rng(seed=7)
+        array = rng.standard_normal((1000, 300)).astype(np.float32)
+        returned = (self.sds.from_numpy(array) * 2).compute(dtype=np.float32)
+        self.assertEqual(np.float32, returned.dtype)
+        self.assertTrue(np.allclose(array * 2, returned))
+        images = rng.integers(0, 128, (50, 100), dtype=np.uint8)
+        returned = (self.sds.from_numpy(images) * 2).compute(dtype=np.uint8)
+        self.assertEqual(np.uint8, returned.dtype)
+        self.assertTrue(np.array_equal(images * 2, returned))
+
+    def test_result_dtype_sparse(self):
+        array = np.zeros((1000, 300))
+        array[::7, ::3] = 3.0
+        returned = (self.sds.from_numpy(array) + 0).compute(dtype=np.float32)
+        self.assertEqual(np.float32, returned.dtype)
+        self.assertTrue(np.array_equal(array.astype(np.float32), returned))
+
+    def test_row_blocks(self):
+        blocks = converters.row_blocks(10000, 1000, 8)
+        self.assertEqual((0, 8000), blocks[0])
+        self.assertEqual((8000, 10000), blocks[-1])
+        blocks = converters.row_blocks(10, 10 * 1024 * 1024, 8)
+        self.assertEqual(10, len(blocks))
+
+    def test_chunked_transfer(self):
+        rng = np.random.default_rng(seed=7)
+        array = rng.standard_normal((5500, 30))
+        chunk_size = converters.TRANSFER_CHUNK_SIZE
+        self.sds._shared_memory_transfer = False
+        try:
+            # force 1000 row blocks for both directions
+            converters.TRANSFER_CHUNK_SIZE = 1000 * 30 * 8
+            self.convert_back_and_forth(array)
+            self.convert_back_and_forth(array.astype(np.float32))
+            sparse = np.zeros((5500, 30))
+            sparse[::13, ::5] = 3.0
+            self.convert_back_and_forth(sparse)
+        finally:
+            converters.TRANSFER_CHUNK_SIZE = chunk_size
+            self.sds._shared_memory_transfer = True
+
     def convert_back_and_forth(self, array):
         matrix_block = numpy_to_matrix_block(self.sds, array)
         # use the ability to call functions on matrix_block.
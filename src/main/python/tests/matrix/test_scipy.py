@@ -0,0 +1,85 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import unittest
+
+import numpy as np
+import scipy.sparse as sp
+from systemds.context import SystemDSContext
+
+
+class TestScipy(unittest.TestCase):
+
+    sds: SystemDSContext = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sds = SystemDSContext()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sds.close()
+
+    def test_coo(self):
+        m = sp.random(100, 50, density=0.01, format="coo", random_state=7)
+        res = self.sds.from_scipy(m).compute()
+        self.assertTrue(np.allclose(m.toarray(), res))
+
+    def test_csr(self):
+        m = sp.random(100, 50, density=0.01, format="csr", random_state=7)
+        res = (self.sds.from_scipy(m) * 2).compute()
+        self.assertTrue(np.allclose(m.toarray() * 2, res))
+
+    def test_csc(self):
+        m = sp.random(100, 50, density=0.01, format="csc", random_state=7)
+        res = self.sds.from_scipy(m).t().compute()
+        self.assertTrue(np.allclose(m.toarray().T, res))
+
+    def test_duplicates(self):
+        m = sp.coo_matrix(([1.0, 2.0, 3.0], ([0, 0, 4], [1, 1, 2])), shape=(5, 3))
+        res = self.sds.from_scipy(m).compute()
+        self.assertTrue(np.allclose(m.toarray(), res))
+
+    def test_sparse_result(self):
+        m = sp.random(1000, 500, density=0.001, format="csr", random_state=7)
+        res = (self.sds.from_scipy(m) + 0).compute(sparse=True)
+        self.assertTrue(sp.issparse(res))
+        self.assertEqual(m.shape, res.shape)
+        self.assertTrue(np.allclose(m.toarray(), res.toarray()))
+
+    def test_sparse_result_dense_block(self):
+        m = np.random.default_rng(7).random((20, 10))
+        m[m < 0.5] = 0
+        res = self.sds.from_numpy(m).t().compute(sparse=True)
+        self.assertTrue(sp.issparse(res))
+        self.assertTrue(np.allclose(m.T, res.toarray()))
+
+    def test_sparse_result_empty(self):
+        res = self.sds.full((10, 5), 0).compute(sparse=True)
+        self.assertEqual(0, res.nnz)
+        self.assertEqual((10, 5), res.shape)
+
+    def test_invalid_input(self):
+        self.assertRaises(ValueError, self.sds.from_scipy, np.zeros((2, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,89 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import unittest
+
+import numpy as np
+from systemds.context import SystemDSContext
+from systemds.script_building import DMLScript
+
+
+class TestCommonSubexpressions(unittest.TestCase):
+    """Test that structurally identical nodes are only added once to a script."""
+
+    sds: SystemDSContext = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sds = SystemDSContext()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sds.close()
+
+    def build(self, node) -> str:
+        script = DMLScript(self.sds)
+        script.build_code(node)
+        code = script.dml_script
+        script.clear(node)
+        return code
+
+    def count(self, code: str, pattern: str) -> int:
+        return sum(pattern in line for line in code.splitlines())
+
+    def test_gram_matrix(self):
+        x = self.sds.rand(10, 3, seed=1)
+        code = self.build((x.t() @ x) + (x.t() @ x))
+        self.assertEqual(1, self.count(code, "t("))
+        self.assertEqual(1, self.count(code, "%*%"))
+
+    def test_scalars(self):
+        x = self.sds.rand(10, 3, seed=1)
+        code = self.build(x.nRow() + x.nRow() * x.nCol())
+        self.assertEqual(1, self.count(code, "nrow("))
+
+    def test_different_parameters(self):
+        x = self.sds.rand(10, 3, seed=1)
+        code = self.build(x.sum(axis=0) + x.sum(axis=1).t() @ x.sum(axis=0))
+        self.assertEqual(1, self.count(code, "colSums("))
+        self.assertEqual(1, self.count(code, "rowSums("))
+
+    def test_random_not_merged(self):
+        a = self.sds.rand(3, 3)
+        b = self.sds.rand(3, 3)
+        code = self.build(a + b)
+        self.assertEqual(2, self.count(code, "rand("))
+
+    def test_side_effects_not_merged(self):
+        x = self.sds.rand(3, 3, seed=1)
+        code = self.build(self.sds.combine(x.sum().print(), x.sum().print()))
+        self.assertEqual(1, self.count(code, "sum("))
+        self.assertEqual(2, self.count(code, "print("))
+
+    def test_compute(self):
+        a = np.random.default_rng(5).random((10, 3))
+        x = self.sds.from_numpy(a)
+        res = ((x.t() @ x) + (x.t() @ x)).compute()
+        self.assertTrue(np.allclose(2 * a.T @ a, res))
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,96 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+
+import unittest
+
+import numpy as np
+from systemds.context import SystemDSContext
+from systemds.script_building import DMLScript
+
+
+class TestDAGCompile(unittest.TestCase):
+    """Test the code generation of large DAGs."""
+
+    sds: SystemDSContext = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sds = SystemDSContext()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sds.close()
+
+    def build(self, node) -> str:
+        script = DMLScript(self.sds)
+        script.build_code(node)
+        code = script.dml_script
+        script.clear(node)
+        return code
+
+    def test_deep_chain(self):
+        # deeper than the recursion limit of python
+        n = 100000
+        x = self.sds.rand(3, 3, seed=1)
+        for _ in range(n):
+            x = x + 1
+        code = self.build(x)
+        # rand and n additions
+        self.assertEqual(n + 1, len(code.splitlines()))
+
+    def test_diamond(self):
+        # every level reuses the previous level twice, revisiting shared
+        # nodes would take exponential time in the depth
+        depth = 200
+        x = self.sds.rand(3, 3, seed=1)
+        for _ in range(depth):
+            x = (x + 1) * (x - 1)
+        code = self.build(x)
+        self.assertEqual(3 * depth + 1, len(code.splitlines()))
+
+    def test_clear(self):
+        x = self.sds.rand(3, 3, seed=1)
+        y = (x + 1) * (x - 1)
+        self.build(y)
+        self.assertEqual("", x.dml_name)
+        self.assertEqual("", y.dml_name)
+        # the variables are numbered from the start again
+        self.assertTrue(self.build(y).startswith("V0="))
+
+    def test_order(self):
+        x = self.sds.rand(3, 3, seed=1)
+        code = self.build((x @ x.t()) + x.sum()).splitlines()
+        self.assertTrue(code[0].startswith("V0=rand("))
+        self.assertEqual("V1=t(V0);", code[1])
+        self.assertEqual("V2=V0%*%V1", code[2])
+        self.assertEqual("V3=sum(V0);", code[3])
+        self.assertEqual("V4=V2+V3", code[4])
+
+    def test_compute_chain(self):
+        a = np.random.default_rng(4).random((5, 5))
+        x = self.sds.from_numpy(a)
+        for _ in range(1000):
+            x = x + 1
+        self.assertTrue(np.allclose(a + 1000, x.compute()))
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,103 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+import unittest
+
+import numpy as np
+import pandas as pd
+from systemds.context import SystemDSContext
+from systemds.script_building import DMLScript
+
+
+class TestMultiCompute(unittest.TestCase):
+    """Test computing several nodes together in one script."""
+
+    sds: SystemDSContext = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sds = SystemDSContext()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sds.close()
+
+    def setUp(self):
+        self.sds.clear_result_cache()
+
+    def test_shared_subgraph_built_once(self):
+        x = self.sds.rand(10, 3, seed=1)
+        gram = x.t() @ x
+        script = DMLScript(self.sds)
+        nodes = [gram.sum(), gram + 1, gram]
+        script.build_code_multiple(nodes)
+        code = script.dml_script
+        self.assertEqual(1, sum("%*%" in line for line in code.splitlines()))
+        self.assertEqual(3, len(script.out_var_name))
+        for node in nodes:
+            script.clear(node)
+
+    def test_results(self):
+        a = np.random.default_rng(3).random((10, 5))
+        x = self.sds.from_numpy(a)
+        gram = x.t() @ x
+        total, plus_one, shape = self.sds.compute(gram.sum(), gram + 1, x.nRow())
+        self.assertAlmostEqual((a.T @ a).sum(), total)
+        self.assertTrue(np.allclose(a.T @ a + 1, plus_one))
+        self.assertEqual(10, shape)
+
+    def test_single_execution(self):
+        x = self.sds.rand(10, 3, seed=1)
+        gram = x.t() @ x
+        before = self.sds.script_cache_statistics()["misses"]
+        self.sds.compute(gram.sum(), gram.min(), gram.max())
+        self.assertEqual(1, self.sds.script_cache_statistics()["misses"] - before)
+
+    def test_same_node_twice(self):
+        x = self.sds.from_numpy(np.ones((3, 3))) * 2
+        a, b = self.sds.compute(x, x)
+        self.assertTrue(np.array_equal(a, b))
+        self.assertTrue(np.array_equal(np.full((3, 3), 2.0), a))
+
+    def test_multi_return(self):
+        a = np.random.default_rng(3).random((10, 5))
+        x = self.sds.from_numpy(a)
+        (u, s, v), total = self.sds.compute(x.svd(), x.sum())
+        self.assertTrue(np.allclose(a, u @ s @ v.T))
+        self.assertAlmostEqual(a.sum(), total)
+
+    def test_python_local(self):
+        a = np.ones((3, 3))
+        df = pd.DataFrame({"a": [1, 2]})
+        m, f, s = self.sds.compute(
+            self.sds.from_numpy(a),
+            self.sds.from_pandas(df),
+            self.sds.from_numpy(a).sum(),
+        )
+        self.assertIs(a, m)
+        self.assertIs(df, f)
+        self.assertEqual(9, s)
+
+    def test_no_nodes(self):
+        self.assertEqual((), self.sds.compute())
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
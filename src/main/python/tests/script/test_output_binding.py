@@ -0,0 +1,137 @@
+# -------------------------------------------------------------
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+# -------------------------------------------------------------
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from systemds.context import SystemDSContext
+from systemds.script_building import DMLScript
+
+
+class TestOutputBinding(unittest.TestCase):
+    """Test that results are returned without writing them to disk."""
+
+    sds: SystemDSContext = None
+    cwd: str = None
+    work_dir: str = None
+
+    @classmethod
+    def setUpClass(cls):
+        # the JVM is started in an empty working directory
+        cls.cwd = os.getcwd()
+        cls.work_dir = tempfile.mkdtemp()
+        os.chdir(cls.work_dir)
+        try:
+            cls.sds = SystemDSContext()
+        finally:
+            os.chdir(cls.cwd)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sds.close()
+        shutil.rmtree(cls.work_dir, ignore_errors=True)
+
+    def setUp(self):
+        self.sds.clear_result_cache()
+
+    def files(self):
+        return sorted(
+            os.path.relpath(os.path.join(path, f), self.work_dir)
+            for path, _, files in os.walk(self.work_dir)
+            for f in files
+        )
+
+    def prepare(self, dml: str, outputs):
+        gateway = self.sds.java_gateway
+        names = gateway.new_array(gateway.jvm.java.lang.String, len(outputs))
+        for i, name in enumerate(outputs):
+            names[i] = name
+        inputs = gateway.new_array(gateway.jvm.java.lang.String, 0)
+        return self.sds._connection.prepareScript(dml, inputs, names)
+
+    def test_no_write_statements(self):
+        x = self.sds.rand(3, 3, seed=1)
+        script = DMLScript(self.sds)
+        node = x.svd()
+        script.build_code(node)
+        self.assertNotIn("write(", script.dml_script)
+        self.assertEqual(3, len(script.out_var_name))
+        script.clear(node)
+
+    def test_nothing_written(self):
+        before = self.files()
+        a = np.random.default_rng(3).random((10, 5))
+        x = self.sds.from_numpy(a)
+        self.assertTrue(np.allclose(a + 1, (x + 1).compute()))
+        self.assertAlmostEqual(a.sum(), x.sum().compute())
+        u, s, v = x.svd().compute()
+        self.assertTrue(np.allclose(a, u @ s @ v.T))
+        df = pd.DataFrame({"a": ["x", "y"], "b": [1, 2]})
+        f = self.sds.from_pandas(df)
+        self.assertEqual(4, len(f.rbind(f).compute()))
+        self.sds.compute(x.min(), x.max())
+        self.assertEqual(before, self.files())
+
+    def test_no_persistent_writes(self):
+        x = self.sds.rand(3, 3, seed=1)
+        script = DMLScript(self.sds)
+        node = x.svd()
+        script.build_code(node)
+        script.clear(node)
+        prepared = self.prepare(script.dml_script, script.out_var_name)
+        self.assertIsNone(re.search(r"\bCP write\b", prepared.explain()))
+        results = prepared.executeScript()
+        for name in script.out_var_name:
+            self.assertEqual(3, results.getMatrixBlock(name).getNumRows())
+
+    def test_bind_without_write(self):
+        # without output binding the unwritten outputs would be removed as dead code
+        prepared = self.prepare(
+            "X = rand(rows=3, cols=3, seed=1) + 1; s = sum(X);", ["X", "s"]
+        )
+        results = prepared.executeScript()
+        self.assertEqual(3, results.getMatrixBlock("X").getNumColumns())
+        self.assertLess(9, results.getDouble("s"))
+
+    def test_bind_before_control_flow(self):
+        # X and W are defined before the if block, X is only read afterwards
+        # and W is never read
+        prepared = self.prepare(
+            "X = matrix(2, rows=3, cols=3);\n"
+            "W = matrix(3, rows=2, cols=2);\n"
+            "Z = rand(rows=3, cols=3, min=1, max=2, seed=1);\n"
+            "if (sum(Z) > 0) { Y = Z * 0; } else { Y = Z; }\n"
+            "s = sum(Y) + sum(X);\n",
+            ["X", "W", "s"],
+        )
+        self.assertIsNone(re.search(r"\bCP write\b", prepared.explain()))
+        results = prepared.executeScript()
+        self.assertEqual(2, results.getMatrixBlock("X").get(0, 0))
+        self.assertEqual(3, results.getMatrixBlock("W").get(1, 1))
+        self.assertEqual(18, results.getDouble("s"))
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,77 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one
+ * or more contributor license agreements.  See the NOTICE file
+ * distributed with this work for additional information
+ * regarding copyright ownership.  The ASF licenses this file
+ * to you under the Apache License, Version 2.0 (the
+ * "License"); you may not use this file except in compliance
+ * with the License.  You may obtain a copy of the License at
+ *
+ *   http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an
+ * "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+ * KIND, either express or implied.  See the License for the
+ * specific language governing permissions and limitations
+ * under the License.
+ */
+
+package org.apache.sysds.test.component.frame.array;
+
+import static org.junit.Assert.assertEquals;
+import static org.junit.Assert.assertNull;
+
+import java.io.IOException;
+
+import org.apache.sysds.common.Types.ValueType;
+import org.apache.sysds.runtime.frame.data.FrameBlock;
+import org.apache.sysds.runtime.frame.data.columns.Array;
+import org.apache.sysds.runtime.frame.data.columns.ArrayFactory;
+import org.apache.sysds.runtime.util.Py4jArrowUtils;
+import org.junit.Test;
+
+public class Py4jArrowUtilsTest {
+
+	@Test
+	public void testRoundTrip() throws IOException {
+		Array<?>[] columns = new Array<?>[] {ArrayFactory.create(new int[] {1, 2, 3}),
+			ArrayFactory.create(new long[] {4, 5, 6}), ArrayFactory.create(new float[] {1.5f, 2.5f, 3.5f}),
+			ArrayFactory.create(new double[] {0.1, 0.2, 0.3}), ArrayFactory.create(new boolean[] {true, false, true}),
+			ArrayFactory.create(new String[] {"a", null, "c"})};
+		FrameBlock fb = new FrameBlock(columns, new String[] {"i", "l", "f", "d", "b", "s"});
+
+		FrameBlock ret = Py4jArrowUtils.convertArrowToFrameBlock(Py4jArrowUtils.convertFrameBlockToArrow(fb));
+
+		assertEquals(fb.getNumRows(), ret.getNumRows());
+		assertEquals(fb.getNumColumns(), ret.getNumColumns());
+		for(int c = 0; c < fb.getNumColumns(); c++) {
+			assertEquals(fb.getColumnName(c), ret.getColumnName(c));
+			assertEquals(fb.getSchema()[c], ret.getSchema()[c]);
+			for(int r = 0; r < fb.getNumRows(); r++)
+				assertEquals(fb.get(r, c), ret.get(r, c));
+		}
+	}
+
+	@Test
+	public void testNulls() throws IOException {
+		Array<?> col = ArrayFactory.allocateOptional(ValueType.FP64, 3);
+		col.set(0, 1.0);
+		col.set(2, 3.0);
+		FrameBlock fb = new FrameBlock(new Array<?>[] {col}, new String[] {"d"});
+
+		FrameBlock ret = Py4jArrowUtils.convertArrowToFrameBlock(Py4jArrowUtils.convertFrameBlockToArrow(fb));
+
+		assertEquals(1.0, ret.get(0, 0));
+		assertNull(ret.get(1, 0));
+		assertEquals(3.0, ret.get(2, 0));
+	}
+
+	@Test
+	public void testEmpty() throws IOException {
+		FrameBlock fb = new FrameBlock(new Array<?>[] {ArrayFactory.create(new double[0])}, new String[] {"d"});
+		FrameBlock ret = Py4jArrowUtils.convertArrowToFrameBlock(Py4jArrowUtils.convertFrameBlockToArrow(fb));
+		assertEquals(0, ret.getNumRows());
+		assertEquals(1, ret.getNumColumns());
+	}
+}
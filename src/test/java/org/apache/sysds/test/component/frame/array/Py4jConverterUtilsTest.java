@@ -19,17 +19,23 @@
 
 package org.apache.sysds.test.component.frame.array;
 
+import static org.junit.Assert.assertArrayEquals;
 import static org.junit.Assert.assertEquals;
 import static org.junit.Assert.assertNotNull;
+import static org.junit.Assert.assertTrue;
 
 import java.nio.ByteBuffer;
 import java.nio.ByteOrder;
 import java.nio.charset.StandardCharsets;
+import java.util.Arrays;
 
 import org.apache.sysds.common.Types;
 import org.apache.sysds.common.Types.ValueType;
+import org.apache.sysds.runtime.frame.data.FrameBlock;
 import org.apache.sysds.runtime.util.Py4jConverterUtils;
 import org.apache.sysds.runtime.frame.data.columns.Array;
+import org.apache.sysds.runtime.frame.data.columns.ArrayFactory;
+import org.apache.sysds.runtime.frame.data.columns.OptionalArray;
 import org.junit.Test;
 
 public class Py4jConverterUtilsTest {
@@ -182,6 +188,129 @@ public class Py4jConverterUtilsTest {
 		assertEquals("world", result.get(1));
 	}
 
+	@Test
+	public void testConvertStrings() {
+		String[] strings = {"hello", null, "", "w\u00f6rld"};
+		byte[] encoded = Py4jConverterUtils.convertStringsToPy4J(ArrayFactory.create(strings));
+		ByteBuffer buffer = ByteBuffer.wrap(encoded).order(ByteOrder.LITTLE_ENDIAN);
+		assertEquals(5, buffer.getInt(0));
+		assertEquals(-1, buffer.getInt(4));
+		assertEquals(0, buffer.getInt(8));
+		assertEquals(6, buffer.getInt(12));
+		Array<?> result = Py4jConverterUtils.convertStrings(encoded, strings.length);
+		assertEquals(strings.length, result.size());
+		for(int i = 0; i < strings.length; i++)
+			assertEquals(strings[i], result.get(i));
+	}
+
+	@Test(expected = Exception.class)
+	public void testConvertStringsInvalid() {
+		Py4jConverterUtils.convertStrings(new byte[] {1, 2, 3}, 2);
+	}
+
+	@Test
+	public void testConvertFrameBlock() {
+		int numRows = 3;
+		byte[] strings = Py4jConverterUtils.convertStringsToPy4J(ArrayFactory.create(new String[] {"a", null, "c"}));
+		ByteBuffer data = ByteBuffer.allocate(numRows * Double.BYTES + numRows * Integer.BYTES + 1 + strings.length);
+		data.order(ByteOrder.LITTLE_ENDIAN);
+		for(int i = 0; i < numRows; i++)
+			data.putDouble(i + 0.5);
+		for(int i = 0; i < numRows; i++)
+			data.putInt(i * 10);
+		data.put((byte) 0b101);
+		data.put(strings);
+		ByteBuffer offsets = ByteBuffer.allocate(5 * Integer.BYTES).order(ByteOrder.LITTLE_ENDIAN);
+		offsets.putInt(0).putInt(24).putInt(36).putInt(37).putInt(data.capacity());
+		byte[] names = Py4jConverterUtils.convertStringsToPy4J(ArrayFactory.create(new String[] {"d", "i", "b", "s"}));
+
+		FrameBlock fb = Py4jConverterUtils.convertFrameBlock(data.array(), offsets.array(), numRows,
+			"FP64,INT32,BOOLEAN,STRING", names);
+		assertEquals(numRows, fb.getNumRows());
+		assertEquals(4, fb.getNumColumns());
+		assertArrayEquals(new ValueType[] {ValueType.FP64, ValueType.INT32, ValueType.BOOLEAN, ValueType.STRING},
+			fb.getSchema());
+		assertArrayEquals(new String[] {"d", "i", "b", "s"}, fb.getColumnNames());
+		for(int i = 0; i < numRows; i++) {
+			assertEquals(i + 0.5, fb.get(i, 0));
+			assertEquals(i * 10, fb.get(i, 1));
+			assertEquals(i != 1, fb.get(i, 2));
+		}
+		assertEquals("a", fb.get(0, 3));
+		assertEquals(null, fb.get(1, 3));
+		assertEquals("c", fb.get(2, 3));
+	}
+
+	@Test(expected = Exception.class)
+	public void testConvertFrameBlockInvalidOffsets() {
+		byte[] names = Py4jConverterUtils.convertStringsToPy4J(ArrayFactory.create(new String[] {"a"}));
+		Py4jConverterUtils.convertFrameBlock(new byte[8], new byte[] {0, 0, 0, 0, 16, 0, 0, 0}, 1, "FP64", names);
+	}
+
+	@Test
+	public void testConvertFrameBlockToPy4J() {
+		FrameBlock fb = new FrameBlock(new Array<?>[] {ArrayFactory.create(new double[] {1.5, 2.5}),
+			ArrayFactory.create(new String[] {"x", null}), ArrayFactory.create(new boolean[] {false, true})},
+			new String[] {"d", "s", "b"});
+		ByteBuffer buffer = ByteBuffer.wrap(Py4jConverterUtils.convertFrameBlockToPy4J(fb))
+			.order(ByteOrder.LITTLE_ENDIAN);
+		assertEquals(3, buffer.getInt(0));
+		int metaLen = buffer.getInt(4);
+		Array<?> meta = Py4jConverterUtils.convertStrings(Arrays.copyOfRange(buffer.array(), 8, 8 + metaLen), 6);
+		assertEquals("FP64", meta.get(0));
+		assertEquals("STRING", meta.get(1));
+		assertEquals("BOOLEAN", meta.get(2));
+		assertEquals("s", meta.get(4));
+		int start = 8 + metaLen + 4 * Long.BYTES;
+		assertEquals(0, buffer.getLong(8 + metaLen));
+		assertEquals(16, buffer.getLong(8 + metaLen + Long.BYTES));
+		assertEquals(1.5, buffer.getDouble(start), 0.0);
+		assertEquals(2.5, buffer.getDouble(start + 8), 0.0);
+		assertEquals(1, buffer.getInt(start + 16));
+		assertEquals(-1, buffer.getInt(start + 20));
+		assertEquals(0b10, buffer.get(buffer.capacity() - 1));
+	}
+
+	@Test
+	public void testConvertFrameBlockToPy4JLongs() {
+		// above 2^53, not representable as doubles
+		long[] values = {1577836800000000001L, Long.MAX_VALUE, -9007199254740993L};
+		FrameBlock fb = new FrameBlock(new Array<?>[] {ArrayFactory.create(values)}, new String[] {"l"});
+		ByteBuffer buffer = ByteBuffer.wrap(Py4jConverterUtils.convertFrameBlockToPy4J(fb))
+			.order(ByteOrder.LITTLE_ENDIAN);
+		int metaLen = buffer.getInt(4);
+		assertEquals("INT64", Py4jConverterUtils.convertStrings(Arrays.copyOfRange(buffer.array(), 8, 8 + metaLen), 2).get(0));
+		int start = 8 + metaLen + 2 * Long.BYTES;
+		for(int i = 0; i < values.length; i++)
+			assertEquals(values[i], buffer.getLong(start + i * Long.BYTES));
+	}
+
+	@Test
+	public void testConvertFrameBlockToPy4JNullIntegers() {
+		FrameBlock fb = new FrameBlock(new Array<?>[] {new OptionalArray<>(new Long[] {3L, null}),
+			new OptionalArray<>(new Integer[] {null, 4})}, new String[] {"l", "i"});
+		ByteBuffer buffer = ByteBuffer.wrap(Py4jConverterUtils.convertFrameBlockToPy4J(fb))
+			.order(ByteOrder.LITTLE_ENDIAN);
+		int metaLen = buffer.getInt(4);
+		Array<?> meta = Py4jConverterUtils.convertStrings(Arrays.copyOfRange(buffer.array(), 8, 8 + metaLen), 4);
+		assertEquals("FP64", meta.get(0));
+		assertEquals("FP64", meta.get(1));
+		int start = 8 + metaLen + 3 * Long.BYTES;
+		assertEquals(3.0, buffer.getDouble(start), 0.0);
+		assertTrue(Double.isNaN(buffer.getDouble(start + 8)));
+		assertTrue(Double.isNaN(buffer.getDouble(start + 16)));
+		assertEquals(4.0, buffer.getDouble(start + 24), 0.0);
+	}
+
+	@Test
+	public void testConvertFrameBlockToPy4JUnallocated() {
+		FrameBlock fb = new FrameBlock(new ValueType[] {ValueType.FP64, ValueType.STRING}, new String[] {"d", "s"}, 3);
+		ByteBuffer buffer = ByteBuffer.wrap(Py4jConverterUtils.convertFrameBlockToPy4J(fb))
+			.order(ByteOrder.LITTLE_ENDIAN);
+		int metaLen = buffer.getInt(4);
+		assertEquals(3 * Double.BYTES, buffer.getLong(8 + metaLen + Long.BYTES));
+	}
+
 	@Test
 	public void testConvertChar() {
 		char[] c = {'h', 'e', 'l', 'l', 'o', ' ', 'w', 'o', 'r', 'l', 'd'};
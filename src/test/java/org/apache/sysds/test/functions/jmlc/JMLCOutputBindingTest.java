@@ -0,0 +1,89 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one
+ * or more contributor license agreements.  See the NOTICE file
+ * distributed with this work for additional information
+ * regarding copyright ownership.  The ASF licenses this file
+ * to you under the Apache License, Version 2.0 (the
+ * "License"); you may not use this file except in compliance
+ * with the License.  You may obtain a copy of the License at
+ * 
+ *   http://www.apache.org/licenses/LICENSE-2.0
+ * 
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an
+ * "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+ * KIND, either express or implied.  See the License for the
+ * specific language governing permissions and limitations
+ * under the License.
+ */
+
+
+package org.apache.sysds.test.functions.jmlc;
+
+import static org.junit.Assert.assertEquals;
+import static org.junit.Assert.assertFalse;
+
+import org.junit.Test;
+import org.apache.sysds.api.jmlc.Connection;
+import org.apache.sysds.api.jmlc.PreparedScript;
+import org.apache.sysds.api.jmlc.ResultVariables;
+import org.apache.sysds.test.AutomatedTestBase;
+
+public class JMLCOutputBindingTest extends AutomatedTestBase
+{
+	@Override
+	public void setUp() { }
+
+	@Test
+	public void testBindOutputs() {
+		ResultVariables rv = execute(
+			"X = matrix(1, rows=3, cols=3) + 1; s = sum(X);",
+			new String[]{"X", "s"});
+		assertEquals(2, rv.getMatrix("X")[1][1], 0);
+		assertEquals(18, rv.getDouble("s"), 0);
+	}
+
+	@Test
+	public void testBindOutputsMultipleBlocks() {
+		ResultVariables rv = execute(
+			"X = matrix(1, rows=3, cols=3);"
+			+ "if( sum(X) > 0 ) { Y = X + 1; } else { Y = X - 1; }"
+			+ "s = sum(Y); print(s);",
+			new String[]{"X", "Y", "s"});
+		assertEquals(1, rv.getMatrix("X")[0][0], 0);
+		assertEquals(2, rv.getMatrix("Y")[0][0], 0);
+		assertEquals(18, rv.getDouble("s"), 0);
+	}
+
+	@Test
+	public void testBindOutputsBeforeControlFlow() {
+		// X and W are defined before the if block, X is only read afterwards and W is never read
+		ResultVariables rv = execute(
+			"X = matrix(2, rows=3, cols=3); W = matrix(3, rows=2, cols=2);"
+			+ "Z = rand(rows=3, cols=3, min=1, max=2, seed=1);"
+			+ "if( sum(Z) > 0 ) { Y = Z * 0; } else { Y = Z; }"
+			+ "s = sum(Y) + sum(X);",
+			new String[]{"X", "W", "s"});
+		assertEquals(2, rv.getMatrix("X")[0][0], 0);
+		assertEquals(3, rv.getMatrix("W")[1][1], 0);
+		assertEquals(18, rv.getDouble("s"), 0);
+	}
+
+	@Test
+	public void testNoPersistentWrites() {
+		try( Connection conn = new Connection() ) {
+			conn.setOutputBinding(true);
+			PreparedScript pscript = conn.prepareScript(
+				"X = matrix(1, rows=3, cols=3) + 1; s = sum(X);", new String[]{}, new String[]{"X", "s"});
+			assertFalse(pscript.explain().matches("(?s).*\\bCP write\\b.*"));
+		}
+	}
+
+	private static ResultVariables execute(String script, String[] outputs) {
+		try( Connection conn = new Connection() ) {
+			conn.setOutputBinding(true);
+			PreparedScript pscript = conn.prepareScript(script, new String[]{}, outputs);
+			return pscript.executeScript();
+		}
+	}
+}